@@ -168,15 +168,15 @@ let createChoiceFunction (r:Asn1AcnAst.AstRoot) (deps:Asn1AcnAst.AcnInsertedFiel
 
                 | Some childContent -> childContent.funcBody,  childContent.localVariables, childContent.userDefinedFunctions, childContent.errCodes, childContent.auxiliaries
 
-            let childBody =
+            let childBody, dispatchKey =
                 let sChoiceTypeName = typeDefinitionName
                 match child.Optionality with
-                | Some (ChoiceAlwaysAbsent) -> Some (choiceChildAlwaysAbsent (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) (BigInteger idx) errCode.errCodeName codec)
+                | Some (ChoiceAlwaysAbsent) -> Some (choiceChildAlwaysAbsent (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) (BigInteger idx) errCode.errCodeName codec), None
                 | Some (ChoiceAlwaysPresent)
                 | None  ->
                     match ec with
                     | CEC_uper  ->
-                        Some (choiceChild (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) (BigInteger idx) nIndexSizeInBits nMax childContent_funcBody sChildName sChildTypeDef sChoiceTypeName sChildInitExpr codec)
+                        Some (choiceChild (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) (BigInteger idx) nIndexSizeInBits nMax childContent_funcBody sChildName sChildTypeDef sChoiceTypeName sChildInitExpr codec), None
                     | CEC_enum (enm,_) ->
                         let getDefOrRef (a:Asn1AcnAst.ReferenceToEnumerated) =
                             match p.modName = ToC a.modName with
@@ -192,22 +192,23 @@ let createChoiceFunction (r:Asn1AcnAst.AstRoot) (deps:Asn1AcnAst.AcnInsertedFiel
                         let enmCaseName =
                             if r.args.acnDeferred && codec = Decode then enmItem.acnEncodeValue.ToString()
                             else lm.lg.getNamedItemBackendName (Some (getDefOrRef enm)) enmItem
-                        Some (choiceChild_Enum (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) enmCaseName (lm.lg.presentWhenName (Some defOrRef) child) childContent_funcBody sChildName sChildTypeDef sChoiceTypeName sChildInitExpr codec)
+                        Some (choiceChild_Enum (p.accessPath.joined lm.lg) (lm.lg.getAccess p.accessPath) enmCaseName (lm.lg.presentWhenName (Some defOrRef) child) childContent_funcBody sChildName sChildTypeDef sChoiceTypeName sChildInitExpr codec), Some ("", enmCaseName, false)
                     | CEC_presWhen  ->
+                        let intCondition (relPath:RelativePath) (intLoc:IntLoc) =
+                            let extField = getExternalFieldChoicePresentWhen lm r deps t.id relPath
+                            // Note: we always decode the external field as a asn1SccSint or asn1SccUint, therefore
+                            // we do not need the exact integer class (i.e. bit width). However, some backends
+                            // such as Scala requires the signedness to be passed.
+                            let tp = getExternalFieldTypeChoicePresentWhen r deps t.id relPath
+                            let unsigned =
+                                match tp with
+                                | Some (AcnInsertedType.AcnInteger int) -> int.isUnsigned
+                                | Some (AcnInsertedType.AcnNullType _) -> true
+                                | _ -> false
+                            extField, lm.lg.asn1SccIntValueToString intLoc.Value unsigned
                         let handPresenceCond (cond:AcnGenericTypes.AcnPresentWhenConditionChoiceChild) =
                             match cond with
-                            | PresenceInt  (relPath, intLoc)   ->
-                                let extField = getExternalFieldChoicePresentWhen lm r deps t.id relPath
-                                // Note: we always decode the external field as a asn1SccSint or asn1SccUint, therefore
-                                // we do not need the exact integer class (i.e. bit width). However, some backends
-                                // such as Scala requires the signedness to be passed.
-                                let tp = getExternalFieldTypeChoicePresentWhen r deps t.id relPath
-                                let unsigned =
-                                    match tp with
-                                    | Some (AcnInsertedType.AcnInteger int) -> int.isUnsigned
-                                    | Some (AcnInsertedType.AcnNullType _) -> true
-                                    | _ -> false
-                                choiceChild_preWhen_int_condition extField (lm.lg.asn1SccIntValueToString intLoc.Value unsigned)
+                            | PresenceInt  (relPath, intLoc)   -> intCondition relPath intLoc ||> choiceChild_preWhen_int_condition
                             | PresenceStr  (relPath, strVal)   ->
                                 let strType =
                                     deps.acnDependencies |>
@@ -233,8 +234,18 @@ let createChoiceFunction (r:Asn1AcnAst.AstRoot) (deps:Asn1AcnAst.AcnInsertedFiel
                         let bIsPrimitive =
                             childContentResult.IsNone ||
                             (match child.chType.ActualType.Kind with NullType _ -> true | _ -> false)
-                        Some (choiceChild_preWhen pp (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) childContent_funcBody conds (idx=0) sChildName sChildTypeDef sChoiceTypeName sChildInitExpr bIsPrimitive [] codec)
-            [{|childBody=childBody; lvs=childContent_localVariables; userDefFuncs=childContent_userDefFuncs; errCodes=childContent_errCodes; auxiliaries=auxiliaries|}], ns1
+                        // a single integer condition makes the alternative selectable by the field value
+                        let dispatchKey =
+                            match child.acnPresentWhenConditions with
+                            | [PresenceInt (relPath, intLoc)] -> let extField, sVal = intCondition relPath intLoc in Some (extField, sVal, bIsPrimitive)
+                            | _                               -> None
+                        Some (choiceChild_preWhen pp (lm.lg.getAccess p.accessPath) (lm.lg.presentWhenName (Some defOrRef) child) childContent_funcBody conds (idx=0) sChildName sChildTypeDef sChoiceTypeName sChildInitExpr bIsPrimitive [] codec), dispatchKey
+            let alternative =
+                dispatchKey |> Option.map (fun (sDeterminant, sKey, bIsPrimitive) ->
+                    sDeterminant,
+                    {AcnChoiceAlternative.sKey = sKey; sChildID = lm.lg.presentWhenName (Some defOrRef) child; sChildName = sChildName; sChildTypeDef = sChildTypeDef
+                     sChildBody = childContent_funcBody; arrsLocalVariables = childContent_localVariables |> List.map lm.lg.getLocalVariableDeclaration; bIsPrimitive = bIsPrimitive})
+            [{|childBody=childBody; lvs=childContent_localVariables; userDefFuncs=childContent_userDefFuncs; errCodes=childContent_errCodes; auxiliaries=auxiliaries; alternative=alternative|}], ns1
 
         let childrenStatements00, ns = children |> List.mapi (fun i x -> i,x)  |> foldMap (fun us (i,x) ->  handleChild us i x) us
         let childrenStatements0 = childrenStatements00 |> List.collect id
@@ -244,25 +255,63 @@ let createChoiceFunction (r:Asn1AcnAst.AstRoot) (deps:Asn1AcnAst.AcnInsertedFiel
         let childrenErrCodes = childrenStatements0 |> List.collect(fun (s) -> s.errCodes)
         let childrenAuxiliaries = childrenStatements0 |> List.collect(fun (a) -> a.auxiliaries)
 
+        // Decoding of a standalone CHOICE whose alternative is selected by the value of one
+        // determinant, through one function per alternative (languages that support it)
+        let dispatchDecode =
+            let alternatives = childrenStatements0 |> List.map (fun s -> s.alternative)
+            match codec, nestingScope.parents, ec with
+            | Decode, [], (CEC_enum _ | CEC_presWhen) when not alternatives.IsEmpty && alternatives |> List.forall Option.isSome ->
+                let alternatives = alternatives |> List.choose id
+                match alternatives |> List.map fst |> List.distinct with
+                | [sDeterminant] ->
+                    let pp, _ = joinedOrAsIdentifier lm codec p
+                    let bIsEnum, sDeterminant =
+                        match ec with
+                        | CEC_enum _ -> true, getExternalField lm r deps t.id
+                        | _          -> false, sDeterminant
+                    // the arguments of the decode function, see AcnFunctionWrapper.createAcnFunction
+                    let prmNames =
+                        let detNames =
+                            match lm.lg.needsAcnChoiceDeterminantParam with
+                            | true  ->
+                                deps.acnDependencies |>
+                                List.filter (fun d -> d.asn1Type = t.id && (match d.dependencyKind with AcnDepChoiceDeterminant _ -> true | _ -> false)) |>
+                                List.map (fun d -> getAcnDeterminantName d.determinant.id)
+                            | false -> []
+                        (t.acnParameters |> List.map (fun prm -> prm.c_name)) @ detNames |> List.distinct
+                    // the first alternative wins when several have the same value, as in the comparison chain
+                    let alternatives = alternatives |> List.map snd |> List.distinctBy (fun a -> a.sKey)
+                    lm.lg.acnChoiceDispatchDecode pp sDeterminant bIsEnum prmNames errCode.errCodeName alternatives
+                | _ -> None
+            | _ -> None
+
         let choiceContent, resultExpr =
             let pp, resultExpr = joinedOrAsIdentifier lm codec p
             let access = lm.lg.getAccess p.accessPath
-            match ec with
-            | CEC_uper        ->
-                choice_uper pp access childrenStatements nMax sChoiceIndexName td nIndexSizeInBits errCode.errCodeName codec, resultExpr
-            | CEC_enum   enm  ->
-                let extField = getExternalField lm r deps t.id
-                // In deferred mode the case discriminant is Asn1UInt (det.Value),
-                // so Ada needs an explicit when-others to cover the full integer
-                // range. In legacy mode the discriminant is the enum type and
-                // when-others would be redundant — Ada flags it as a warning,
-                // which becomes an error under -gnatwe.
-                let bIsDeferred = r.args.acnDeferred
-                choice_Enum pp access childrenStatements extField td errCode.errCodeName bIsDeferred codec, resultExpr
-            | CEC_presWhen    -> choice_preWhen pp  access childrenStatements td errCode.errCodeName codec, resultExpr
+            match dispatchDecode with
+            | Some (sDispatchBody, _) -> sDispatchBody, resultExpr
+            | None ->
+                match ec with
+                | CEC_uper        ->
+                    choice_uper pp access childrenStatements nMax sChoiceIndexName td nIndexSizeInBits errCode.errCodeName codec, resultExpr
+                | CEC_enum   enm  ->
+                    let extField = getExternalField lm r deps t.id
+                    // In deferred mode the case discriminant is Asn1UInt (det.Value),
+                    // so Ada needs an explicit when-others to cover the full integer
+                    // range. In legacy mode the discriminant is the enum type and
+                    // when-others would be redundant — Ada flags it as a warning,
+                    // which becomes an error under -gnatwe.
+                    let bIsDeferred = r.args.acnDeferred
+                    choice_Enum pp access childrenStatements extField td errCode.errCodeName bIsDeferred codec, resultExpr
+                | CEC_presWhen    -> choice_preWhen pp  access childrenStatements td errCode.errCodeName codec, resultExpr
         let choiceContent = lm.lg.generateChoiceProof r ACN t o choiceContent p.accessPath codec
         let aux = lm.lg.generateChoiceAuxiliaries r ACN t o nestingScope p.accessPath codec
-        Some ({AcnFuncBodyResult.funcBody = choiceContent; errCodes = errCode::childrenErrCodes; localVariables = localVariables@childrenLocalvars; userDefinedFunctions=childrenUserDefFuncs; bValIsUnReferenced=false; bBsIsUnReferenced=false; resultExpr=resultExpr; auxiliaries=childrenAuxiliaries@aux; icdResult = Some icd}), ns
+        // with dispatch, the local variables of the children are declared in the functions of the alternatives
+        let childrenLocalvars, alternativeFuncs =
+            match dispatchDecode with
+            | Some (_, alternativeFuncs) -> [], alternativeFuncs
+            | None                       -> childrenLocalvars, []
+        Some ({AcnFuncBodyResult.funcBody = choiceContent; errCodes = errCode::childrenErrCodes; localVariables = localVariables@childrenLocalvars; userDefinedFunctions=childrenUserDefFuncs; bValIsUnReferenced=false; bBsIsUnReferenced=false; resultExpr=resultExpr; auxiliaries=childrenAuxiliaries@alternativeFuncs@aux; icdResult = Some icd}), ns
 
 
     let soSparkAnnotations = Some(sparkAnnotations lm (typeDefinition.longTypedefName2 (Some lm.lg) lm.lg.hasModules t.moduleName) codec)
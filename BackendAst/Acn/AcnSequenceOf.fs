@@ -162,8 +162,29 @@ let createSequenceOfFunction (r:Asn1AcnAst.AstRoot) (deps:Asn1AcnAst.AcnInserted
                     ii.funcBody + "\n" + (lm.uper.update_array_item pp (i level) ii.resultExpr.Value)
                 | _ -> ii.funcBody
 
+            // Arrays of fixed-width, byte-sized primitives can be processed with one runtime call
+            let bulkBody =
+                match internalItem, callAux with
+                | Some _, None ->
+                    let sItemType = lm.lg.getLongTypedefNameBasedOnModule (lm.lg.getTypeDefinition o.child.FT_TypeDefinition) p.modName
+                    let soExtField =
+                        match o.acnEncodingClass with
+                        | SZ_EC_ExternalField _ ->
+                            let unsigned =
+                                match getExternalFieldType r deps t.id with
+                                | Some (AcnInsertedType.AcnInteger int) -> int.isUnsigned
+                                | Some (AcnInsertedType.AcnNullType _) -> true
+                                | _ -> false
+                            Some (getExternalField lm r deps t.id, unsigned)
+                        | _ -> None
+                    lm.lg.acnSequenceOfBulkBody codec o pp access sType sItemType soExtField errCode.errCodeName
+                | _ -> None
+
             let ret =
                 match o.acnEncodingClass with
+                | _ when bulkBody.IsSome && internalItem.IsSome ->
+                    let internalItem = internalItem.Value
+                    Some ({AcnFuncBodyResult.funcBody = bulkBody.Value; errCodes = errCode::internalItem.errCodes; localVariables = internalItem.localVariables; userDefinedFunctions=internalItem.userDefinedFunctions; bValIsUnReferenced= false; bBsIsUnReferenced=false; resultExpr=resultExpr; auxiliaries=internalItem.auxiliaries @ auxiliaries; icdResult = Some icd})
                 | SZ_EC_FIXED_SIZE
                 | SZ_EC_LENGTH_EMBEDDED _ ->
                     let nSizeInBits = GetNumberOfBitsForNonNegativeInteger (o.maxSize.acn - o.minSize.acn)
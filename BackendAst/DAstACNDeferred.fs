@@ -653,6 +653,7 @@ let private buildContainingStandaloneBody
         (specP: CodegenScope)
         (errCode: ErrorCode)
         (baseFncName: string)
+        (baseTypeDefinitionName: string)
         (ns1: State) : AcnFuncBodyResult * State =
     let pp =
         let str = ctx.lm.lg.getParamValue ctx.t specP.accessPath ctx.codec
@@ -668,9 +669,9 @@ let private buildContainingStandaloneBody
     let fncBody =
         match ctx.o.encodingOptions.Value.octOrBitStr with
         | CommonTypes.ContainedInOctString ->
-            ctx.lm.acn.octet_string_containing_deferred_func pp baseFncName detParamName patchFnName errCode.errCodeName ctx.codec
+            ctx.lm.acn.octet_string_containing_deferred_func pp baseFncName baseTypeDefinitionName detParamName patchFnName errCode.errCodeName ctx.codec
         | CommonTypes.ContainedInBitString ->
-            ctx.lm.acn.bit_string_containing_deferred_func pp baseFncName detParamName patchFnName errCode.errCodeName ctx.codec
+            ctx.lm.acn.bit_string_containing_deferred_func pp baseFncName baseTypeDefinitionName detParamName patchFnName errCode.errCodeName ctx.codec
     { emptyBody ctx.lm with
         funcBody = fncBody
         errCodes = [errCode]
@@ -964,7 +965,7 @@ let private createDeferredReferenceFunction
         (baseType:Asn1Type)
         (us:State) =
 
-    let _baseTypeDefinitionName, baseFncName = getBaseFuncName lm typeDefinition o t "_ACN" codec
+    let baseTypeDefinitionName, baseFncName = getBaseFuncName lm typeDefinition o t "_ACN" codec
 
     // ICD this reference contributes to its parent.  Same construction as the
     // legacy inline path; without it the parent SEQUENCE drops the field row
@@ -981,11 +982,11 @@ let private createDeferredReferenceFunction
         | None -> false
 
     // Helper: create a simple funcBody from an STG template call (for CONTAINING FIXED/EMBEDDED)
-    let makeContainingFuncBody (stgCall: string -> string -> (AcnFuncBodyResult option) * State) =
+    let makeContainingFuncBody (stgCall: string -> string -> string -> (AcnFuncBodyResult option) * State) =
         let soSparkAnnotations = Some(DAstACN.sparkAnnotations lm (typeDefinition.longTypedefName2 (Some lm.lg) lm.lg.hasModules t.moduleName) codec)
         let funcBody (us:State) (errCode:ErrorCode) (_acnArgs: (AcnGenericTypes.RelativePath*AcnGenericTypes.AcnParameter) list) (_nestingScope: NestingScope) (p:CodegenScope) =
             let pp = lm.lg.getParamValue t p.accessPath codec
-            stgCall pp baseFncName
+            stgCall pp baseFncName baseTypeDefinitionName
         DAstACN.createAcnFunction r deps lm codec t typeDefinition isValidFunc
             (fun us e acnArgs nestingScope p -> funcBody us e acnArgs nestingScope p)
             (fun _atc -> true) soSparkAnnotations [] us
@@ -997,22 +998,22 @@ let private createDeferredReferenceFunction
         | Some encOptions ->
             match encOptions.acnEncodingClass, encOptions.octOrBitStr with
             | Asn1AcnAst.SZ_EC_FIXED_SIZE, CommonTypes.ContainedInOctString ->
-                Some (makeContainingFuncBody (fun pp fncName ->
-                    let fncBody = lm.acn.octet_string_containing_deferred_fixed_func pp fncName codec
+                Some (makeContainingFuncBody (fun pp fncName sContainedType ->
+                    let fncBody = lm.acn.octet_string_containing_deferred_fixed_func pp fncName sContainedType codec
                     Some ({AcnFuncBodyResult.funcBody = fncBody; errCodes = []; localVariables = []; userDefinedFunctions=[]; bValIsUnReferenced= false; bBsIsUnReferenced=false; resultExpr=None; auxiliaries=[]; icdResult = refIcd}), us))
             | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _, CommonTypes.ContainedInOctString ->
-                Some (makeContainingFuncBody (fun pp fncName ->
+                Some (makeContainingFuncBody (fun pp fncName sContainedType ->
                     let nBits = GetNumberOfBitsForNonNegativeInteger (encOptions.maxSize.acn - encOptions.minSize.acn)
-                    let fncBody = lm.acn.octet_string_containing_deferred_embedded_func pp fncName encOptions.minSize.acn encOptions.maxSize.acn nBits codec
+                    let fncBody = lm.acn.octet_string_containing_deferred_embedded_func pp fncName sContainedType encOptions.minSize.acn encOptions.maxSize.acn nBits codec
                     Some ({AcnFuncBodyResult.funcBody = fncBody; errCodes = []; localVariables = []; userDefinedFunctions=[]; bValIsUnReferenced= false; bBsIsUnReferenced=false; resultExpr=None; auxiliaries=[]; icdResult = refIcd}), us))
             | Asn1AcnAst.SZ_EC_FIXED_SIZE, CommonTypes.ContainedInBitString ->
-                Some (makeContainingFuncBody (fun pp fncName ->
-                    let fncBody = lm.acn.bit_string_containing_deferred_fixed_func pp fncName codec
+                Some (makeContainingFuncBody (fun pp fncName sContainedType ->
+                    let fncBody = lm.acn.bit_string_containing_deferred_fixed_func pp fncName sContainedType codec
                     Some ({AcnFuncBodyResult.funcBody = fncBody; errCodes = []; localVariables = []; userDefinedFunctions=[]; bValIsUnReferenced= false; bBsIsUnReferenced=false; resultExpr=None; auxiliaries=[]; icdResult = refIcd}), us))
             | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _, CommonTypes.ContainedInBitString ->
-                Some (makeContainingFuncBody (fun pp fncName ->
+                Some (makeContainingFuncBody (fun pp fncName sContainedType ->
                     let nBits = GetNumberOfBitsForNonNegativeInteger (encOptions.maxSize.acn - encOptions.minSize.acn)
-                    let fncBody = lm.acn.bit_string_containing_deferred_embedded_func pp fncName encOptions.minSize.acn encOptions.maxSize.acn nBits codec
+                    let fncBody = lm.acn.bit_string_containing_deferred_embedded_func pp fncName sContainedType encOptions.minSize.acn encOptions.maxSize.acn nBits codec
                     Some ({AcnFuncBodyResult.funcBody = fncBody; errCodes = []; localVariables = []; userDefinedFunctions=[]; bValIsUnReferenced= false; bBsIsUnReferenced=false; resultExpr=None; auxiliaries=[]; icdResult = refIcd}), us))
             | _ when not isContainingExternalField ->
                 Some (DAstACN.createReferenceFunction_inline r deps lm codec t o typeDefinition isValidFunc baseType us)
@@ -1079,7 +1080,7 @@ let private createDeferredReferenceFunction
             let bodyResult, ns2 =
                 match isContainingExternalField, baseAcnFunc.funcName.IsNone with
                 | true, true  -> buildContainingClosureBody    ctx specP errCode baseAcnFunc stripLocals ns1
-                | true, false -> buildContainingStandaloneBody ctx specP errCode baseFncName ns1
+                | true, false -> buildContainingStandaloneBody ctx specP errCode baseFncName baseTypeDefinitionName ns1
                 | _           -> buildNormalReferenceBody      ctx specP          baseAcnFunc stripLocals ns1
 
             // Step 2b: append PatchDet calls (encode only) onto the body.
@@ -486,8 +486,14 @@ let createIA5StringFunction (r:Asn1AcnAst.AstRoot) (lm:LanguageMacros) (codec:Co
         let introSnap = nestingScope.nestingLevel = 0I
         let auxiliaries, callAux = lm.lg.generateSequenceOfLikeAuxiliaries r (if fromACN then ACN else UPER) (StrType o) sqfProofGen codec
 
+        let soBulkBody =
+            match o.maxSize.uper < 65536I with
+            | true  -> lm.lg.uperStringBulkBody codec o pp typeDefinitionName errCode.errCodeName
+            | false -> None
+
         let funcBodyContent,localVariables =
             match o.minSize with
+            | _ when soBulkBody.IsSome -> soBulkBody.Value, nStringLength
             | _ when o.maxSize.uper < 65536I && o.maxSize.uper=o.minSize.uper ->
                 str_FixedSize pp typeDefinitionName i internalItem o.minSize.uper nBits nBits 0I initExpr introSnap callAux codec, lv::charIndex@nStringLength
             | _ when o.maxSize.uper < 65536I && o.maxSize.uper<>o.minSize.uper ->
@@ -665,7 +671,14 @@ let createSequenceOfFunction (r:Asn1AcnAst.AstRoot) (lm:LanguageMacros) (codec:C
             let offset = nestingScope.uperRelativeOffset
             let introSnap = nestingScope.nestingLevel = 0I
 
+            let soBulkBody =
+                match o.maxSize.uper < 65536I with
+                | true  -> lm.lg.uperSequenceOfBulkBody codec o pp access td errCode.errCodeName
+                | false -> None
+
             match internalItem with
+            | Some internalItem when soBulkBody.IsSome ->
+                Some ({UPERFuncBodyResult.funcBody = soBulkBody.Value; errCodes = errCode::internalItem.errCodes; localVariables = lv@nStringLength; bValIsUnReferenced=false; bBsIsUnReferenced=false; resultExpr=resultExpr; auxiliaries = auxiliaries})
             | None  ->
                 match o.minSize with
                 | _ when o.maxSize.uper < 65536I && o.maxSize.uper=o.minSize.uper  -> None
@@ -117,6 +117,8 @@ let private printUnitInternal (tas: TypeAssignment) (fullCls: Asn1Type) (encDecC
         | true  -> combineStringOpts fullCls.equalFunction.isEqualFuncDef fullCls.equalFunction.isEqualFunc
         | false -> ""
 
+    let dict_funcs = lm.lg.dictConverterFuncs fullCls
+
     let is_valid_funcs =
         match printIsValid with
         | false -> []
@@ -152,7 +154,7 @@ let private printUnitInternal (tas: TypeAssignment) (fullCls: Asn1Type) (encDecC
         | true, Some x -> [combineStringOpts x.funcDef x.func] @ x.auxiliaries
         | _ -> []
 
-    let allProcs = [equal_funcs] @is_valid_funcs @special_init_funcs @[init_funcs] @uPerEncDec @sEncodingSizeConstant @acnEncFunc @acnDecFunc @xerEncFunc @xerDecFunc
+    let allProcs = [equal_funcs] @is_valid_funcs @dict_funcs @special_init_funcs @[init_funcs] @uPerEncDec @sEncodingSizeConstant @acnEncFunc @acnDecFunc @xerEncFunc @xerDecFunc
 
     // Separated constants and funcs-only for Python's assembleAllProcs (merged EncodeConstants class)
     let allEncConstBodies =
@@ -180,7 +182,7 @@ let private printUnitInternal (tas: TypeAssignment) (fullCls: Asn1Type) (encDecC
         | true, Some x -> [defaultArg x.func ""] @ x.auxiliaries
         | _ -> []
     let allFuncsAndOtherProcs =
-        [equal_funcs] @is_valid_funcs @special_init_funcs @[init_funcs] @uPerFuncsOnly @sEncodingSizeConstant @acnEncFuncOnly @acnDecFuncOnly @xerEncFuncOnly @xerDecFuncOnly
+        [equal_funcs] @is_valid_funcs @dict_funcs @special_init_funcs @[init_funcs] @uPerFuncsOnly @sEncodingSizeConstant @acnEncFuncOnly @acnDecFuncOnly @xerEncFuncOnly @xerDecFuncOnly
 
     let finalProcs = lm.lg.assembleAllProcs allEncConstBodies allDecConstBodies allFuncsAndOtherProcs allProcs
     let generatedCode = lm.typeDef.Define_TAS type_definition finalProcs
@@ -485,13 +485,13 @@ Generated by the C stg macros with the following command
         abstract member checkAccessPath : arrsCheckPaths:seq<string> -> sUpdateStatement:string -> v:string -> sInitExpr:string -> string;
         abstract member SizeDependency_oct_str_containing : p:string -> sFuncName:string -> sReqBytesForUperEncoding:string -> v:string -> bIsOctet:bool -> sInner:string -> sLocalVarType:string -> string;
         abstract member octet_string_containing_ext_field_func : p:string -> sFuncName:string -> sReqBytesForUperEncoding:string -> sExtField:string -> sErrCode:string -> soInner:string option -> codec:Codec -> string;
-        abstract member octet_string_containing_deferred_func : p:string -> sFuncName:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
-        abstract member octet_string_containing_deferred_fixed_func : p:string -> sFuncName:string -> codec:Codec -> string;
-        abstract member octet_string_containing_deferred_embedded_func : p:string -> sFuncName:string -> nMinSize:BigInteger -> nMaxSize:BigInteger -> nBits:BigInteger -> codec:Codec -> string;
+        abstract member octet_string_containing_deferred_func : p:string -> sFuncName:string -> sContainedType:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
+        abstract member octet_string_containing_deferred_fixed_func : p:string -> sFuncName:string -> sContainedType:string -> codec:Codec -> string;
+        abstract member octet_string_containing_deferred_embedded_func : p:string -> sFuncName:string -> sContainedType:string -> nMinSize:BigInteger -> nMaxSize:BigInteger -> nBits:BigInteger -> codec:Codec -> string;
         abstract member octet_string_containing_deferred_wrapper : sBody:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
-        abstract member bit_string_containing_deferred_func : p:string -> sFuncName:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
-        abstract member bit_string_containing_deferred_fixed_func : p:string -> sFuncName:string -> codec:Codec -> string;
-        abstract member bit_string_containing_deferred_embedded_func : p:string -> sFuncName:string -> nMinSize:BigInteger -> nMaxSize:BigInteger -> nBits:BigInteger -> codec:Codec -> string;
+        abstract member bit_string_containing_deferred_func : p:string -> sFuncName:string -> sContainedType:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
+        abstract member bit_string_containing_deferred_fixed_func : p:string -> sFuncName:string -> sContainedType:string -> codec:Codec -> string;
+        abstract member bit_string_containing_deferred_embedded_func : p:string -> sFuncName:string -> sContainedType:string -> nMinSize:BigInteger -> nMaxSize:BigInteger -> nBits:BigInteger -> codec:Codec -> string;
         abstract member bit_string_containing_deferred_wrapper : sBody:string -> sDetParamName:string -> sPatchFuncName:string -> sErrCode:string -> codec:Codec -> string;
         abstract member bit_string_containing_ext_field_func : p:string -> sFuncName:string -> sReqBytesForUperEncoding:string -> sReqBitsForUperEncoding:string -> sExtField:string -> sErrCode:string -> codec:Codec -> string;
         abstract member rtlModuleName : unit -> string;
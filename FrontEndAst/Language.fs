@@ -217,6 +217,17 @@ type public SequenceChildStmt = {
     icdComments : string list
 }
 
+/// One alternative of an ACN CHOICE selected by the value of a single determinant.
+type AcnChoiceAlternative = {
+    sKey: string                    // determinant value that selects the alternative
+    sChildID: string
+    sChildName: string
+    sChildTypeDef: string
+    sChildBody: string
+    arrsLocalVariables: string list
+    bIsPrimitive: bool
+}
+
 type AcnFuncBody = State -> ErrorCode -> (AcnGenericTypes.RelativePath * AcnGenericTypes.AcnParameter) list -> NestingScope -> CodegenScope -> (AcnFuncBodyResult option) * State
 
 /// Quadruple για deferred patching:
@@ -333,6 +344,44 @@ type ILangGeneric () =
     /// leading underscore identifiers.  Default: identity.
     abstract member acnDeferredTempVarName : baseName:string -> string
 
+    /// Encoding/decoding statements for a whole ACN SEQUENCE OF whose items are
+    /// fixed-width, byte-sized primitives (8/16/32/64-bit integers, IEEE 754 reals),
+    /// processed with one runtime call instead of a loop over the items.
+    /// Arguments: codec, the SEQUENCE OF, access path, accessor, type name, item type
+    /// name, external size field (name, is unsigned) and error code.
+    /// Returns None when the items must be encoded one by one.  Default: None.
+    abstract member acnSequenceOfBulkBody : Codec -> Asn1AcnAst.SequenceOf -> string -> string -> string -> string -> (string*bool) option -> string -> string option
+
+    /// Encoding/decoding statements for a whole uPER IA5String/NumericString, with all
+    /// characters packed into one bit field by a single runtime call instead of a loop
+    /// over the characters. Not used for strings that require fragmentation.
+    /// Arguments: codec, the string type, access path, type name and error code.
+    /// Returns None when the characters must be encoded one by one.  Default: None.
+    abstract member uperStringBulkBody : Codec -> Asn1AcnAst.StringType -> string -> string -> string -> string option
+
+    /// Encoding/decoding statements for a whole uPER SEQUENCE OF constrained INTEGER,
+    /// with all items packed into one bit field by a single runtime call instead of a
+    /// loop over the items. Not used for SEQUENCE OFs that require fragmentation.
+    /// Arguments: codec, the SEQUENCE OF, access path, accessor, type name and error code.
+    /// Returns None when the items must be encoded one by one.  Default: None.
+    abstract member uperSequenceOfBulkBody : Codec -> Asn1AcnAst.SequenceOf -> string -> string -> string -> string -> string option
+
+    /// Decoding statements for an ACN CHOICE whose alternative is selected by the value
+    /// of one determinant (an enumerated determinant, or present-when conditions on one
+    /// integer field), with one decode function per alternative and a table from the
+    /// determinant value to the function instead of one comparison per alternative.
+    /// Arguments: access path, determinant, is enumerated, ACN parameter names of the
+    /// decode function, error code and the alternatives.
+    /// Returns the statements and the functions of the alternatives, or None when the
+    /// alternatives must be tried one by one.  Default: None.
+    abstract member acnChoiceDispatchDecode : string -> string -> bool -> string list -> string -> AcnChoiceAlternative list -> (string * string list) option
+
+    /// Methods that convert the values of a generated type to and from plain data
+    /// (dicts, lists, str, ...), emitted in the class of each newly defined type;
+    /// subtypes inherit them.
+    /// Returns the methods, or no methods when the language has no such conversion.  Default: [].
+    abstract member dictConverterFuncs : DAst.Asn1Type -> string list
+
     abstract member getRtlFiles : Asn1Encoding list -> string list -> string list
 
     abstract member getChildInfoName : Asn1Ast.ChildInfo -> string
@@ -613,6 +662,11 @@ type ILangGeneric () =
     default _.computeDeferredFallbackValue _ _ = "0"
     default _.wrapDeferredSpecBody body = body
     default _.acnDeferredTempVarName baseName = baseName
+    default _.acnSequenceOfBulkBody _ _ _ _ _ _ _ _ = None
+    default _.uperStringBulkBody _ _ _ _ _ = None
+    default _.uperSequenceOfBulkBody _ _ _ _ _ _ = None
+    default _.acnChoiceDispatchDecode _ _ _ _ _ _ = None
+    default _.dictConverterFuncs _ = []
     default this.real_annotations = []
 
     default this.extractEnumClassName (prefix: string) (varName: string) (internalName: string): string = ""
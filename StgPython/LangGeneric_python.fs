@@ -67,6 +67,23 @@ let uperExprMethodCall (k: Asn1TypeKind) (sChildInitExpr: string) =
     | true -> ""
     | false -> initMethSuffix k
 
+// array.array typecode of the items of a SEQUENCE OF INTEGER/REAL (Asn1SequenceOf.ITEM_TYPECODE);
+// the integer class is the smallest C integer type that holds the constrained range
+let sequenceOfItemTypecode (child: Asn1Type) : string option =
+    match resolveReferenceType child.Kind with
+    | Integer int ->
+        match int.intClass with
+        | ASN1SCC_Int8 _   -> Some "b"
+        | ASN1SCC_Int16 _  -> Some "h"
+        | ASN1SCC_Int32 _  -> Some "i"
+        | ASN1SCC_Int64 _ | ASN1SCC_Int _   -> Some "q"
+        | ASN1SCC_UInt8 _  -> Some "B"
+        | ASN1SCC_UInt16 _ -> Some "H"
+        | ASN1SCC_UInt32 _ -> Some "I"
+        | ASN1SCC_UInt64 _ | ASN1SCC_UInt _ -> Some "Q"
+    | Real _ -> Some "d"
+    | _ -> None
+
 type LangBasic_python() =
     inherit ILangBasic()
     
@@ -1089,7 +1106,7 @@ type LangGeneric_python() =
         else name
 
     override this.wrapIA5StringValue typeRef modName literal =
-        this.getQualifiedTypeName typeRef modName + "(arr=[ord(c) for c in " + literal + "])"
+        this.getQualifiedTypeName typeRef modName + "(arr=" + literal + ")"
 
     override _.formatEnumValueInit (enumTd: FE_EnumeratedTypeDefinition) itemCName _defaultValue =
         let qualTypeName = if enumTd.programUnit = "" then enumTd.typeName else enumTd.programUnit + "." + enumTd.typeName
@@ -1136,7 +1153,6 @@ type LangGeneric_python() =
     override this.supportsStaticVerification = false
     override this.isObjectOriented = true
     override this.nullTerminatorByte = None
-    override this.charToNumericValueExpression charValue = sprintf "ord(%s)" charValue
     override this.validationStringPrefix = "self.arr"
     override this.shouldRemoveModulePrefixFromTypedef = true
     override this.scopeErrorCodeNamesPerTypeAssignment = true
@@ -1248,6 +1264,12 @@ type LangGeneric_python() =
         | FlagLocalVariable (name,Some iv)          -> sprintf "%s = %s" name iv
         | BooleanLocalVariable (name,None)          -> sprintf "%s = False" name
         | BooleanLocalVariable (name,Some iv)       -> sprintf "%s = %s" name iv
+        | AcnInsertedChild(name, vartype, "") when vartype = this.bitStreamName ->
+            // start position of a SEQUENCE with a post-encoding function (bit index)
+            sprintf "%s = 0" name
+        | AcnInsertedChild(name, _, "")             ->
+            // child positions passed to a post-encoding function
+            sprintf "%s = AcnBitStreamPositions()" name
         | AcnInsertedChild(name, vartype, initVal)  ->
             sprintf "%s = %s" name initVal
         | GenericLocalVariable lv                   ->
@@ -1446,6 +1468,351 @@ type LangGeneric_python() =
         | ASN1SCC_FP32                      -> this.castExpression pp realTypeName
         | _                                 -> pp
 
+    override this.getDeferredDetFunctions (acnType: Asn1AcnAst.AcnInsertedType) : DetFunctionNames option =
+        let mapIntEncoding (enc: Asn1AcnAst.IntEncodingClass) : DetFunctionNames option =
+            match enc with
+            | Asn1AcnAst.PositiveInteger_ConstSize_8                -> Some ("acn_init_det_u8",     "acn_patch_det_u8", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_16    -> Some ("acn_init_det_u16_be", "acn_patch_det_u16_be", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_32    -> Some ("acn_init_det_u32_be", "acn_patch_det_u32_be", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_64    -> Some ("acn_init_det_u64_be", "acn_patch_det_u64_be", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_16 -> Some ("acn_init_det_u16_le", "acn_patch_det_u16_le", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_32 -> Some ("acn_init_det_u32_le", "acn_patch_det_u32_le", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_64 -> Some ("acn_init_det_u64_le", "acn_patch_det_u64_le", None, 0I)
+            | Asn1AcnAst.TwosComplement_ConstSize_8                 -> Some ("acn_init_det_i8",     "acn_patch_det_i8", None, 0I)
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_16     -> Some ("acn_init_det_i16_be", "acn_patch_det_i16_be", None, 0I)
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_32     -> Some ("acn_init_det_i32_be", "acn_patch_det_i32_be", None, 0I)
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_64     -> Some ("acn_init_det_i64_be", "acn_patch_det_i64_be", None, 0I)
+            | Asn1AcnAst.PositiveInteger_ConstSize nBits            -> Some ("acn_init_det_const_size", "acn_patch_det_const_size", Some nBits, 0I)
+            | Asn1AcnAst.TwosComplement_ConstSize nBits             -> Some ("acn_init_det_twos_complement_const_size", "acn_patch_det_twos_complement_const_size", Some nBits, 0I)
+            | _ -> None
+        match acnType with
+        | Asn1AcnAst.AcnInsertedType.AcnInteger ai ->
+            match ai.acnEncodingClass with
+            | Asn1AcnAst.Integer_uPER when ai.acnMinSizeInBits = ai.acnMaxSizeInBits ->
+                let uperMinOffset =
+                    match ai.uperRange with
+                    | Concrete (minVal, _) -> minVal
+                    | _ -> 0I
+                Some ("acn_init_det_const_size", "acn_patch_det_const_size", Some ai.acnMaxSizeInBits, uperMinOffset)
+            | _ -> mapIntEncoding ai.acnEncodingClass
+        | Asn1AcnAst.AcnInsertedType.AcnBoolean bln ->
+            match bln.acnProperties.encodingPattern with
+            | None -> Some ("acn_init_det_bool1", "acn_patch_det_bool1", None, 0I)
+            | Some _ -> None
+        | Asn1AcnAst.AcnInsertedType.AcnReferenceToEnumerated enm ->
+            match enm.enumerated.acnEncodingClass with
+            | Asn1AcnAst.Integer_uPER ->
+                let nItems = enm.enumerated.items.Length
+                let nBits = if nItems <= 1 then 0I else bigint (int (System.Math.Ceiling(System.Math.Log(float nItems, 2.0))))
+                Some ("acn_init_det_const_size", "acn_patch_det_const_size", Some nBits, 0I)
+            | _ -> mapIntEncoding enm.enumerated.acnEncodingClass
+        | Asn1AcnAst.AcnInsertedType.AcnReferenceToIA5String ref ->
+            Some ("acn_init_det_ia5_string_fix_size", "acn_patch_det_ia5_string_fix_size", Some ref.str.maxSize.acn, 0I)
+        | _ -> None
+
+    override this.computeDeferredFallbackValue (acnType: Asn1AcnAst.AcnInsertedType) (uperMinOffset: BigInteger) : string =
+        match acnType with
+        | Asn1AcnAst.AcnInsertedType.AcnInteger _ ->
+            if uperMinOffset > 0I then uperMinOffset.ToString() else "0"
+        | Asn1AcnAst.AcnInsertedType.AcnReferenceToEnumerated enm ->
+            // Python determinants hold plain integers, not enum members
+            match enm.enumerated.items with
+            | firstItem :: _ -> firstItem.acnEncodeValue.ToString()
+            | [] -> "0"
+        | Asn1AcnAst.AcnInsertedType.AcnReferenceToIA5String _ -> "\"\""
+        | _ -> "0"
+
+    override _.acnDeferredTempVarName baseName = "_" + baseName
+
+    override this.acnSequenceOfBulkBody (codec: Codec) (o: Asn1AcnAst.SequenceOf) (pp: string) (sAcc: string) (sTypeName: string) (sItemTypeName: string) (soExtField: (string*bool) option) (sErrCode: string) : string option =
+        let rec isUnaligned (t: Asn1AcnAst.Asn1Type) =
+            t.acnAlignment.IsNone &&
+                (match t.Kind with
+                 | Asn1AcnAst.ReferenceType rt -> isUnaligned rt.resolvedType
+                 | _ -> true)
+        let intFormat (enc: Asn1AcnAst.IntEncodingClass) =
+            match enc with
+            | Asn1AcnAst.PositiveInteger_ConstSize_8                -> Some ">B"
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_16    -> Some ">H"
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_32    -> Some ">I"
+            | Asn1AcnAst.PositiveInteger_ConstSize_big_endian_64    -> Some ">Q"
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_16 -> Some "<H"
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_32 -> Some "<I"
+            | Asn1AcnAst.PositiveInteger_ConstSize_little_endian_64 -> Some "<Q"
+            | Asn1AcnAst.TwosComplement_ConstSize_8                 -> Some ">b"
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_16     -> Some ">h"
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_32     -> Some ">i"
+            | Asn1AcnAst.TwosComplement_ConstSize_big_endian_64     -> Some ">q"
+            | Asn1AcnAst.TwosComplement_ConstSize_little_endian_16  -> Some "<h"
+            | Asn1AcnAst.TwosComplement_ConstSize_little_endian_32  -> Some "<i"
+            | Asn1AcnAst.TwosComplement_ConstSize_little_endian_64  -> Some "<q"
+            | _ -> None
+        let itemFormat =
+            match o.child.Kind.ActualType with
+            | Asn1AcnAst.Integer int when int.acnProperties.mappingFunction.IsNone -> intFormat int.acnEncodingClass
+            | Asn1AcnAst.Real rl ->
+                match rl.acnEncodingClass with
+                | Asn1AcnAst.Real_IEEE754_32_big_endian    -> Some ">f"
+                | Asn1AcnAst.Real_IEEE754_64_big_endian    -> Some ">d"
+                | Asn1AcnAst.Real_IEEE754_32_little_endian -> Some "<f"
+                | Asn1AcnAst.Real_IEEE754_64_little_endian -> Some "<d"
+                | _ -> None
+            | _ -> None
+        let indent (lines: string list) = lines |> List.map (fun l -> "    " + l)
+        let checkDecodeResult sInp =
+            [sprintf "if not %s or %s.decoded_value is None:" sInp sInp
+             sprintf "    if %s.error_code == ErrorCode.INSUFFICIENT_DATA:" sInp
+             sprintf "        raise Asn1UnexpectedEndOfDataException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode
+             sprintf "    raise Asn1InvalidValueException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode]
+        let encodeItems fmt sCount =
+            [sprintf "res = codec.enc_fixed_width_array(%s%sarr, %s, \"%s\")" pp sAcc sCount fmt
+             "if not res:"
+             sprintf "    raise Asn1Exception(f\"Encoding Exception {self.EncodeConstants.%s}: {res.error_message}\")" sErrCode]
+        let decodeItems fmt sCount =
+            let sItems =
+                match sItemTypeName with
+                | "int" | "float" -> "decoded_result.decoded_value"
+                | _ -> sprintf "[%s(v) for v in decoded_result.decoded_value]" sItemTypeName
+            [sprintf "decoded_result = codec.dec_fixed_width_array(%s, \"%s\")" sCount fmt] @
+            checkDecodeResult "decoded_result" @
+            [sprintf "%s_arr = %s" pp sItems]
+        let lines =
+            match itemFormat with
+            | Some fmt when isUnaligned o.child ->
+                match o.acnEncodingClass, o.isFixedSize, codec with
+                | (Asn1AcnAst.SZ_EC_FIXED_SIZE | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _), true, CommonTypes.Encode ->
+                    Some (encodeItems fmt (o.maxSize.acn.ToString()))
+                | (Asn1AcnAst.SZ_EC_FIXED_SIZE | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _), true, CommonTypes.Decode ->
+                    Some (decodeItems fmt (o.maxSize.acn.ToString()) @ [sprintf "%s = %s(%s_arr)" pp sTypeName pp])
+                | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _, false, CommonTypes.Encode ->
+                    Some ([sprintf "res = codec.encode_constrained_whole_number(%s%snCount, %s, %s)" pp sAcc (o.minSize.acn.ToString()) (o.maxSize.acn.ToString())
+                           "if not res:"
+                           sprintf "    raise Asn1Exception(f\"Encoding Exception {self.EncodeConstants.%s}: {res.error_message}\")" sErrCode] @
+                          encodeItems fmt (sprintf "%s%snCount" pp sAcc))
+                | Asn1AcnAst.SZ_EC_LENGTH_EMBEDDED _, false, CommonTypes.Decode ->
+                    Some ([sprintf "decoded_length = codec.decode_constrained_whole_number(%s, %s)" (o.minSize.acn.ToString()) (o.maxSize.acn.ToString())] @
+                          checkDecodeResult "decoded_length" @
+                          [sprintf "%s_nCount = decoded_length.decoded_value" pp] @
+                          decodeItems fmt (sprintf "%s_nCount" pp) @
+                          [sprintf "%s = %s(%s_nCount, %s_arr)" pp sTypeName pp pp])
+                | Asn1AcnAst.SZ_EC_ExternalField _, false, CommonTypes.Encode ->
+                    Some (encodeItems fmt (sprintf "%s%snCount" pp sAcc))
+                | Asn1AcnAst.SZ_EC_ExternalField _, false, CommonTypes.Decode ->
+                    match soExtField with
+                    | Some (sExtFld, bIsUnsigned) ->
+                        let sMinCheck = if o.minSize.acn = 0I then "" else sprintf "(%s <= %s) and " (o.minSize.acn.ToString()) sExtFld
+                        Some ([sprintf "if %s(%s <= %s):" sMinCheck sExtFld (o.maxSize.acn.ToString())] @
+                              indent ([sprintf "%s_nCount = %s" pp (if bIsUnsigned then sprintf "int(%s)" sExtFld else sExtFld)] @
+                                      decodeItems fmt (sprintf "%s_nCount" pp) @
+                                      [sprintf "%s = %s(%s_nCount, %s_arr)" pp sTypeName pp pp]) @
+                              ["else:"
+                               sprintf "    raise Asn1InvalidValueException(f\"External field size out of range (Error {cls.DecodeConstants.%s})\")" sErrCode])
+                    | None -> None
+                | _ -> None
+            | _ -> None
+        lines |> Option.map (fun l -> l |> String.concat "\n")
+
+    override this.uperStringBulkBody (codec: Codec) (o: Asn1AcnAst.StringType) (pp: string) (sTypeName: string) (sErrCode: string) : string option =
+        // The full IA5 alphabet is the runtime default: every character is its own 7-bit index
+        let sCharSet =
+            match o.uperCharSet.Length = 128 with
+            | true  -> ""
+            | false -> sprintf ", bytes([%s])" (o.uperCharSet |> Array.map (fun c -> sprintf "0x%02X" (int c)) |> String.concat ", ")
+        let sMin, sMax = o.minSize.uper.ToString(), o.maxSize.uper.ToString()
+        let checkEncodeResult sInp =
+            [sprintf "if not %s:" sInp
+             sprintf "    raise Asn1Exception(f\"Encoding Exception {self.EncodeConstants.%s}: {%s.error_message}\")" sErrCode sInp]
+        let checkDecodeResult sInp =
+            [sprintf "if not %s or %s.decoded_value is None:" sInp sInp
+             sprintf "    if %s.error_code == ErrorCode.INSUFFICIENT_DATA:" sInp
+             sprintf "        raise Asn1UnexpectedEndOfDataException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode
+             sprintf "    raise Asn1InvalidValueException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode]
+        let encodeChars sCount =
+            [sprintf "res = codec.encode_string_char_index(%s.arr, %s%s)" pp sCount sCharSet] @ checkEncodeResult "res"
+        let decodeChars sCount =
+            [sprintf "decoded_result = codec.decode_string_char_index(%s%s)" sCount sCharSet] @
+            checkDecodeResult "decoded_result" @
+            [sprintf "%s = %s(decoded_result.decoded_value)" pp sTypeName]
+        let lines =
+            match o.minSize.uper = o.maxSize.uper, codec with
+            | true, CommonTypes.Encode  -> encodeChars sMax
+            | true, CommonTypes.Decode  -> decodeChars sMax
+            | false, CommonTypes.Encode ->
+                [sprintf "nStringLength = len(%s.arr)" pp
+                 sprintf "res = codec.encode_constrained_whole_number(nStringLength, %s, %s)" sMin sMax] @
+                checkEncodeResult "res" @
+                encodeChars "nStringLength"
+            | false, CommonTypes.Decode ->
+                [sprintf "decoded_length = codec.decode_constrained_whole_number(%s, %s)" sMin sMax] @
+                checkDecodeResult "decoded_length" @
+                ["nStringLength = decoded_length.decoded_value"] @
+                decodeChars "nStringLength"
+        Some (lines |> String.concat "\n")
+
+    override this.uperSequenceOfBulkBody (codec: Codec) (o: Asn1AcnAst.SequenceOf) (pp: string) (sAcc: string) (sTypeName: string) (sErrCode: string) : string option =
+        // Items encoded as plain constrained whole numbers: no extension bit, at least one bit each
+        let soItemRange =
+            match resolveReferenceType o.child.Kind, sequenceOfItemTypecode o.child with
+            | Integer int, Some sTypecode ->
+                let hasRootExt = int.cons |> List.exists (fun c -> match c with RangeRootConstraint _ | RangeRootConstraint2 _ -> true | _ -> false)
+                match int.uperRange with
+                | Concrete (a, b) when a < b && not hasRootExt -> Some (a.ToString(), b.ToString(), sTypecode)
+                | _ -> None
+            | _ -> None
+        let sMin, sMax = o.minSize.uper.ToString(), o.maxSize.uper.ToString()
+        let checkEncodeResult sInp =
+            [sprintf "if not %s:" sInp
+             sprintf "    raise Asn1Exception(f\"Encoding Exception {self.EncodeConstants.%s}: {%s.error_message}\")" sErrCode sInp]
+        let checkDecodeResult sInp =
+            [sprintf "if not %s or %s.decoded_value is None:" sInp sInp
+             sprintf "    if %s.error_code == ErrorCode.INSUFFICIENT_DATA:" sInp
+             sprintf "        raise Asn1UnexpectedEndOfDataException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode
+             sprintf "    raise Asn1InvalidValueException(f\"Decoding failed with Error Code {cls.DecodeConstants.%s}: {%s.error_message}\", field_name=cls.DecodeConstants.%s_path)" sErrCode sInp sErrCode]
+        soItemRange |> Option.map (fun (sItemMin, sItemMax, sTypecode) ->
+            let encodeItems sCount =
+                [sprintf "res = codec.encode_constrained_whole_number_array(%s%sarr, %s, %s, %s)" pp sAcc sCount sItemMin sItemMax] @
+                checkEncodeResult "res"
+            let decodeItems sCount =
+                [sprintf "decoded_result = codec.decode_constrained_whole_number_array(%s, %s, %s, \"%s\")" sCount sItemMin sItemMax sTypecode] @
+                checkDecodeResult "decoded_result"
+            let lines =
+                match o.minSize.uper = o.maxSize.uper, codec with
+                | true, CommonTypes.Encode  -> encodeItems sMax
+                | true, CommonTypes.Decode  ->
+                    decodeItems sMax @ [sprintf "%s = %s(decoded_result.decoded_value)" pp sTypeName]
+                | false, CommonTypes.Encode ->
+                    [sprintf "res = codec.encode_constrained_whole_number(%s%snCount, %s, %s)" pp sAcc sMin sMax] @
+                    checkEncodeResult "res" @
+                    encodeItems (sprintf "%s%snCount" pp sAcc)
+                | false, CommonTypes.Decode ->
+                    [sprintf "decoded_length = codec.decode_constrained_whole_number(%s, %s)" sMin sMax] @
+                    checkDecodeResult "decoded_length" @
+                    [sprintf "%s_nCount = decoded_length.decoded_value" pp] @
+                    decodeItems (sprintf "%s_nCount" pp) @
+                    [sprintf "%s = %s(%s_nCount, decoded_result.decoded_value)" pp sTypeName pp]
+            lines |> String.concat "\n")
+
+    override this.acnChoiceDispatchDecode (pp: string) (sDeterminant: string) (bIsEnum: bool) (arrsAcnParams: string list) (sErrCode: string) (alternatives: AcnChoiceAlternative list) : (string * string list) option =
+        let indent (lines: string list) = lines |> List.map (fun l -> if l = "" then l else "    " + l)
+        let sArgs = arrsAcnParams |> List.map (fun p -> ", " + p) |> String.concat ""
+        let funcName (a: AcnChoiceAlternative) = "_decode_acn_" + a.sChildName
+        // One classmethod per alternative, called with the arguments of the CHOICE decode function
+        let alternativeFunc (a: AcnChoiceAlternative) =
+            ["@classmethod"
+             sprintf "def %s(cls, codec: ACNDecoder, check_constraints: bool%s):" (funcName a) sArgs] @
+            indent ((a.arrsLocalVariables |> List.distinct) @
+                    (if a.bIsPrimitive then [sprintf "instance_%s = %s()" a.sChildName a.sChildTypeDef] else []) @
+                    (a.sChildBody.Replace("\r\n", "\n").Split('\n') |> Array.toList) @
+                    [sprintf "return cls(kind=%s, data=instance_%s)" a.sChildID a.sChildName])
+            |> String.concat "\n"
+        let sSelector, prefix, sNoMatch =
+            match bIsEnum with
+            | true  -> pp, [sprintf "%s = getattr(%s, 'val', %s)" pp sDeterminant sDeterminant], "No matching enum choice alternative"
+            | false -> sDeterminant, [], "No matching choice alternative"
+        // The table of each class is built on first use, by dispatch_table
+        let lines =
+            prefix @
+            [sprintf "%s_decode = dispatch_table(cls, \"%s_alternatives\", lambda: {" pp sErrCode] @
+            (alternatives |> List.map (fun a -> sprintf "    %s: cls.%s," a.sKey (funcName a))) @
+            [sprintf "}).get(%s)" sSelector
+             sprintf "if %s_decode is None:" pp
+             sprintf "    raise Asn1InvalidValueException(f\"%s (Error {cls.DecodeConstants.%s})\")" sNoMatch sErrCode
+             sprintf "%s = %s_decode(codec, check_constraints%s)" pp pp sArgs]
+        Some (lines |> String.concat "\n", alternatives |> List.map alternativeFunc)
+
+    override this.dictConverterFuncs (t: DAst.Asn1Type) : string list =
+        let modName = ToC t.id.ModName
+        let indent (lines: string list) = lines |> List.map (fun l -> "    " + l)
+        let typeName (c: DAst.Asn1Type) = c.typeDefinitionOrReference.longTypedefName2 (Some this) this.hasModules modName
+        let isNew kind = match kind with NonPrimitiveNewTypeDefinition -> true | _ -> false
+        // Children kept as they are in the plain data: numbers, OBJECT IDENTIFIER and time values
+        let isKeptAsIs (c: DAst.Asn1Type) =
+            match c.ActualType.Kind with
+            | DAst.Integer _ | DAst.Real _ | DAst.ObjectIdentifier _ | DAst.TimeType _ -> true
+            | _ -> false
+        let toPlain (c: DAst.Asn1Type) (sVal: string) =
+            match c.ActualType.Kind with
+            | _ when isKeptAsIs c -> sVal
+            | DAst.Boolean _      -> sprintf "bool(%s)" sVal
+            | DAst.NullType _     -> "None"
+            | _                   -> sprintf "%s.to_dict(enum_names, hex_octets)" sVal
+        let fromPlain (c: DAst.Asn1Type) (sData: string) =
+            match c.ActualType.Kind with
+            | _ when isKeptAsIs c -> sData
+            | DAst.Boolean _      -> sprintf "%s(%s)" (typeName c) sData
+            | DAst.NullType _     -> sprintf "%s()" (typeName c)
+            | _                   -> sprintf "%s.from_dict(%s, enum_names, hex_octets)" (typeName c) sData
+        let sized bFixedSize sItems = if bFixedSize then sprintf "cls(arr=%s)" sItems else sprintf "cls(nCount=len(%s), arr=%s)" sItems sItems
+        let bodies =
+            match t.Kind with
+            | DAst.Sequence o when isNew (this.getSequenceTypeDefinition o.baseInfo.typeDef).kind ->
+                let children = o.Asn1Children |> List.map (fun c -> this.getAsn1ChildBackendName c, c.Type, c.Optionality.IsSome)
+                let mandatory = children |> List.filter (fun (_, _, bOpt) -> not bOpt) |> List.map (fun (n, c, _) -> sprintf "\"%s\": %s" n (toPlain c ("self." + n)))
+                let toBody =
+                    [sprintf "d = {%s}" (mandatory |> String.concat ", ")] @
+                    (children |> List.filter (fun (_, _, bOpt) -> bOpt) |> List.collect (fun (n, c, _) ->
+                        [sprintf "if self.%s is not None:" n
+                         sprintf "    d[\"%s\"] = %s" n (toPlain c ("self." + n))])) @
+                    ["return d"]
+                let args =
+                    children |> List.map (fun (n, c, bOpt) ->
+                        let sValue = fromPlain c (sprintf "data[\"%s\"]" n)
+                        if bOpt then sprintf "%s=(%s if \"%s\" in data else None)" n sValue n else sprintf "%s=%s" n sValue)
+                Some (toBody, [sprintf "return cls(%s)" (args |> String.concat ", ")])
+            | DAst.Choice o when isNew (this.getChoiceTypeDefinition o.baseInfo.typeDef).kind ->
+                let sTypeName = (this.getChoiceTypeDefinition o.baseInfo.typeDef).typeName
+                let children = o.children |> List.map (fun c -> this.getAsn1ChChildBackendName c, this.presentWhenName (Some t.typeDefinitionOrReference) c, c.chType)
+                let toBody =
+                    ["kind = self.kind"] @
+                    (children |> List.collect (fun (n, sKind, c) ->
+                        [sprintf "if kind == %s:" sKind
+                         sprintf "    return {\"%s\": %s}" n (toPlain c "self.data")])) @
+                    [sprintf "raise Asn1InvalidValueException(f\"Invalid %s kind {kind!r}\")" sTypeName]
+                let fromBody =
+                    ["if len(data) != 1:"
+                     sprintf "    raise Asn1InvalidValueException(f\"A %s value needs exactly one alternative, got {list(data)!r}\")" sTypeName
+                     "(name, value), = data.items()"] @
+                    (children |> List.collect (fun (n, sKind, c) ->
+                        [sprintf "if name == \"%s\":" n
+                         sprintf "    return cls(kind=%s, data=%s)" sKind (fromPlain c "value")])) @
+                    [sprintf "raise Asn1InvalidValueException(f\"Unknown %s alternative {name!r}\")" sTypeName]
+                Some (toBody, fromBody)
+            | DAst.SequenceOf o when isNew (this.getSizeableTypeDefinition o.baseInfo.typeDef).kind ->
+                let bFixedSize = o.baseInfo.minSize.uper = o.baseInfo.maxSize.uper
+                let sItems = if bFixedSize then "self.arr" else "self.arr[:self.nCount]"
+                let toBody, sFromItems =
+                    match o.childType.ActualType.Kind with
+                    // list, array.array or NumPy array, see set_sequence_of_arrays
+                    | DAst.Integer _ | DAst.Real _ ->
+                        [sprintf "items = %s" sItems
+                         "return items if type(items) is list else items.tolist()"], "list(data)"
+                    | _ when isKeptAsIs o.childType -> [sprintf "return list(%s)" sItems], "list(data)"
+                    | _ -> [sprintf "return [%s for x in %s]" (toPlain o.childType "x") sItems], sprintf "[%s for x in data]" (fromPlain o.childType "x")
+                Some (toBody, [sprintf "items = %s" sFromItems; "return " + sized bFixedSize "items"])
+            | DAst.OctetString o when isNew (this.getSizeableTypeDefinition o.baseInfo.typeDef).kind ->
+                let bFixedSize = o.baseInfo.minSize.uper = o.baseInfo.maxSize.uper
+                Some (["return self.to_bytes().hex() if hex_octets else self.to_bytes()"],
+                      ["arr = bytes.fromhex(data) if hex_octets else bytes(data)"; "return " + sized bFixedSize "arr"])
+            | DAst.BitString o when isNew (this.getSizeableTypeDefinition o.baseInfo.typeDef).kind ->
+                let bFixedSize = o.baseInfo.minSize.uper = o.baseInfo.maxSize.uper
+                let sFrom =
+                    if bFixedSize then "return cls(arr=cls.pack_bit_str(data))"
+                    else "return cls(nCount=len(data), arr=cls.pack_bit_str(data))"
+                Some (["return self.to_bit_str()"], [sFrom])
+            | DAst.IA5String o when isNew (this.getStrTypeDefinition o.baseInfo.typeDef).kind ->
+                Some (["return self.arr"], ["return cls(arr=data)"])
+            | DAst.Enumerated o when isNew (this.getEnumTypeDefinition o.baseInfo.typeDef).kind ->
+                let sEnum = (this.getEnumTypeDefinition o.baseInfo.typeDef).typeName + "_Enum"
+                Some (["return self.val.name if enum_names else int(self.val)"],
+                      [sprintf "return cls(val=%s[data] if enum_names else %s(data))" sEnum sEnum])
+            | _ -> None
+        match bodies with
+        | None -> []
+        | Some (toBody, fromBody) ->
+            [["def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:"] @ indent toBody |> String.concat "\n"
+             ["@classmethod"
+              sprintf "def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> '%s':" (typeName t)] @ indent fromBody |> String.concat "\n"]
+
     // Placeholder methods for features not yet implemented in Python
     // override this.generateSequenceAuxiliaries (r: Asn1AcnAst.AstRoot) (enc: Asn1Encoding) (t: Asn1AcnAst.Asn1Type) (sq: Asn1AcnAst.Sequence) (nestingScope: NestingScope) (sel: Selection) (codec: Codec): string list =
     //     []
@@ -1558,8 +1925,8 @@ type LangGeneric_python() =
     //               (children            : Asn1AcnAst.ChChildInfo list): string list =
     //     []
 
-    // override this.generateSequenceOfSizeDefinitions (typeDef : Map<ProgrammingLanguage, FE_SizeableTypeDefinition>) (acnMinSizeInBits : BigInteger) (acnMaxSizeInBits : BigInteger) (maxSize : SIZE) (acnEncodingClass : Asn1AcnAst.SizeableAcnEncodingClass) (acnAlignment : AcnGenericTypes.AcnAlignment option) (maxAlignment: AcnGenericTypes.AcnAlignment option) (child : Asn1AcnAst.Asn1Type): string list * string list =
-    //     [], []
+    override this.generateSequenceOfSizeDefinitions (typeDef : Map<ProgrammingLanguage, FE_SizeableTypeDefinition>) (acnMinSizeInBits : BigInteger) (acnMaxSizeInBits : BigInteger) (maxSize : SIZE) (acnEncodingClass : Asn1AcnAst.SizeableAcnEncodingClass) (acnAlignment : AcnGenericTypes.AcnAlignment option) (maxAlignment: AcnGenericTypes.AcnAlignment option) (child : Asn1AcnAst.Asn1Type): string list * string list =
+        (sequenceOfItemTypecode child |> Option.map (sprintf "ITEM_TYPECODE = \"%s\"") |> Option.toList), []
 
     // override this.generateSequenceSubtypeDefinitions (dealiased: string) (typeDef:Map<ProgrammingLanguage, FE_SequenceTypeDefinition>) (children: Asn1AcnAst.Asn1Child list): string list =
     //     []
\ No newline at end of file
@@ -15,15 +15,21 @@ from .asn1_exceptions import (
 
 from .asn1_types import (
     # ASN.1 semantic types
-    Asn1Boolean, NullType, Real32, Asn1Base, Asn1ObjectIdentifier, OBJECT_IDENTIFIER_MAX_LENGTH,
+    Asn1Boolean, NullType, Real32, Asn1Base, Asn1IA5String, Asn1OctetString, Asn1BitString, Asn1SequenceOf, Asn1Enumerated, Asn1Choice, Asn1ObjectIdentifier, OBJECT_IDENTIFIER_MAX_LENGTH,
 
     # Time types
     Asn1Date, Asn1LocalTime, Asn1UtcTime,
     Asn1TimeWithTimeZone, Asn1DateLocalTime,
-    Asn1DateUtcTime, Asn1DateTimeWithTimeZone,
+    Asn1DateUtcTime, Asn1DateTimeWithTimeZone, Asn1TimeZone,
 
     # Constraint Validation
     Asn1ConstraintValidResult,
+
+    # Generated class declaration
+    asn1_dataclass, set_dataclass_slots, set_sequence_of_arrays,
+
+    # Pickling
+    set_uper_pickling, register_uper_pickling,
 )
 
 from .bitstream import BitStream, BitStreamError
@@ -35,11 +41,18 @@ from .codec import (
 )
 
 from .codec_uper import UPEREncoder, UPERDecoder
-from .acn_encoder import ACNEncoder
+from .codec_registry import CodecRegistration, register_codec, get_codec
+from .acn_encoder import ACNEncoder, AcnInsertedFieldRef
 from .acn_decoder import ACNDecoder
+from .acn_post_encoding import (
+    AcnBitStreamPositions, crc16_ccitt, crc32,
+    register_checksum_function, get_checksum_function,
+    checksum_post_encoding_function, checksum_post_decoding_validator,
+)
+from .helper import dispatch_table
 try:
-    from .xer_encoder import XEREncoder
-    from .xer_decoder import XERDecoder
+    from .xer_encoder import XEREncoder, CompactXEREncoder, XERPduStreamWriter
+    from .xer_decoder import XERDecoder, ExpatXERDecoder, XERPushDecoder, XER_NEED_MORE_DATA
 except ImportError:
     pass
 # from .codec_xer import XERCodec
@@ -52,13 +65,16 @@ __description__ = "ASN.1 runtime library for Python"
 
 __all__ = [
     # Types
-    "Asn1Boolean", "NullType", "Real32", "Asn1ObjectIdentifier", "OBJECT_IDENTIFIER_MAX_LENGTH",
+    "Asn1Boolean", "NullType", "Real32", "Asn1IA5String", "Asn1OctetString", "Asn1BitString", "Asn1SequenceOf", "Asn1Enumerated", "Asn1Choice", "Asn1ObjectIdentifier", "OBJECT_IDENTIFIER_MAX_LENGTH",
     "Asn1Date", "Asn1LocalTime", "Asn1UtcTime",
     "Asn1TimeWithTimeZone", "Asn1DateLocalTime",
-    "Asn1DateUtcTime", "Asn1DateTimeWithTimeZone",
+    "Asn1DateUtcTime", "Asn1DateTimeWithTimeZone", "Asn1TimeZone",
     
     # Base Class
-    "Asn1Base",
+    "Asn1Base", "asn1_dataclass", "set_dataclass_slots", "set_sequence_of_arrays",
+
+    # Pickling
+    "set_uper_pickling", "register_uper_pickling",
 
     # Constraint Validation
     "Asn1ConstraintValidResult",
@@ -74,7 +90,16 @@ __all__ = [
 
     # Codecs
     "Encoding", "Codec", "EncodeResult", "DecodeResult", "ErrorCode",
-    "ACNDecoder", "ACNEncoder", "UPERDecoder", "UPEREncoder", #"XERCodec", "BERCodec", "PERCodec",
+    "ACNDecoder", "ACNEncoder", "AcnInsertedFieldRef", "UPERDecoder", "UPEREncoder", #"XERCodec", "BERCodec", "PERCodec",
+    "CodecRegistration", "register_codec", "get_codec",
+
+    # ACN post-encoding functions
+    "AcnBitStreamPositions", "crc16_ccitt", "crc32",
+    "register_checksum_function", "get_checksum_function",
+    "checksum_post_encoding_function", "checksum_post_decoding_validator",
+
+    # Helpers
+    "dispatch_table",
 
     # Constants
     "ENCODE_OK", "DECODE_OK", "ERROR_INSUFFICIENT_DATA",
@@ -83,4 +108,4 @@ __all__ = [
 
 # Conditionally export XER classes when available (only present with -XER flag)
 if 'XEREncoder' in vars():
-    __all__ += ["XEREncoder", "XERDecoder"]
+    __all__ += ["XEREncoder", "CompactXEREncoder", "XERPduStreamWriter", "XERDecoder", "ExpatXERDecoder", "XERPushDecoder", "XER_NEED_MORE_DATA"]
@@ -11,6 +11,20 @@ from .asn1_constants import *
 from .decoder import Decoder
 from .codec import DecodeResult, DECODE_OK, ERROR_INVALID_VALUE
 from .bitstream import BitStreamError
+from .char_index_codec import IA5_CHAR_SET, CharIndexCodec, get_char_index_codec
+
+
+def bit_pattern_to_uint(pattern: Union[bytes, bytearray], n_bits: int) -> int:
+    """Convert an MSB aligned bit pattern to an unsigned integer of n_bits bits.
+
+    Args:
+        pattern: Pattern bytes, first pattern bit is the MSB of pattern[0]
+        n_bits: Number of pattern bits
+    """
+    n_bytes = (n_bits + NO_OF_BITS_IN_BYTE - 1) // NO_OF_BITS_IN_BYTE
+    if n_bytes > len(pattern):
+        raise ValueError(f"Bit pattern of {len(pattern)} bytes is shorter than {n_bits} bits")
+    return int.from_bytes(pattern[:n_bytes], "big") >> (n_bytes * NO_OF_BITS_IN_BYTE - n_bits)
 
 
 class ACNDecoder(Decoder):
@@ -461,6 +475,70 @@ class ACNDecoder(Decoder):
                 error_message=str(e)
             )
 
+    def peek_bits(self, bit_index: int, n_bits: int) -> DecodeResult[int]:
+        """Read n_bits at an absolute bit_index without moving the current position.
+
+        Used by: post-decoding validators that check an already decoded field
+        (see acn_post_encoding)
+        """
+        bitstream = self._bitstream
+        current_position = bitstream.current_used_bits
+        try:
+            bitstream.set_bit_index(bit_index)
+            return DecodeResult(
+                success=True,
+                error_code=DECODE_OK,
+                decoded_value=bitstream.read_bits_wide(n_bits),
+                bits_consumed=0
+            )
+        except BitStreamError as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+        finally:
+            bitstream.set_bit_index(current_position)
+
+    # ============================================================================
+    # FIXED-WIDTH ARRAY DECODING
+    # ============================================================================
+
+    def dec_fixed_width_array(self, count: int, item_format: str) -> DecodeResult[List[Union[int, float]]]:
+        """Decode count fixed-width integers or IEEE 754 reals in one block.
+
+        Byte aligned arrays are unpacked straight from a view of the buffer.
+
+        Args:
+            count: Number of items to decode
+            item_format: struct format of one item including the byte order, e.g. '>H' or '<d'
+        """
+        try:
+            layout = struct.Struct(f"{item_format[0]}{count}{item_format[1:]}")
+            start = self._bitstream.current_used_bits
+            end = start + layout.size * 8
+            if end > self._bitstream.buffer_size * 8:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=f"Insufficient data: need {layout.size * 8} bits"
+                )
+
+            values = list(layout.unpack(self._bitstream.bit_range_view(start, end)))
+            self._bitstream.set_bit_index(end)
+            return DecodeResult(
+                success=True,
+                error_code=DECODE_OK,
+                decoded_value=values,
+                bits_consumed=layout.size * 8
+            )
+        except BitStreamError as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     # ============================================================================
     # STRING DECODING
     # ============================================================================
@@ -492,34 +570,29 @@ class ACNDecoder(Decoder):
             )
             
         try:
-            chars = []
-            bits_consumed = 0
-            end_reached = False
-            i = 0
-            
-            # Read characters until null terminator or max_len (null terminated specific logic)
-            while i <= max_len and not end_reached:
-                if self._bitstream.remaining_bits < 8:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message="Insufficient data for character"
-                    )
+            # Look at up to max_len + 1 characters at once and search the terminator in them
+            start_bit = self._bitstream.current_used_bits
+            window_len = min(max_len + 1, self._bitstream.remaining_bits // 8)
+            window = self._bitstream.read_bytes(window_len)
+
+            null_pos = window.find(null_character)
+            if null_pos != -1:
+                chars = window[:null_pos]
+                bytes_consumed = null_pos + 1
+            elif window_len == max_len + 1:
+                chars = window
+                bytes_consumed = window_len
+            else:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message="Insufficient data for character"
+                )
+
+            self._bitstream.set_bit_index(start_bit + bytes_consumed * 8)
 
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return self._error_str(result)
-                decoded_char = result.decoded_value
-                bits_consumed += 8
-                
-                if decoded_char != null_character:
-                    chars.append(decoded_char)
-                    i += 1
-                else:
-                    end_reached = True
-                    
             # Convert bytes to ASCII string using common helper
-            return self._bytes_to_ascii_string(chars, bits_consumed)
+            return self._bytes_to_ascii_string(chars, bytes_consumed * 8)
                 
         except BitStreamError as e:
             return DecodeResult(
@@ -553,49 +626,37 @@ class ACNDecoder(Decoder):
             
         try:
             null_size = len(null_characters)
-            tmp = bytearray(null_size)  # Sliding window buffer
-            chars = []
-            bits_consumed = 0
-            
-            # Read initial null_size characters into tmp buffer
-            for j in range(null_size):
-                if self._bitstream.remaining_bits < 8:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message="Insufficient data for initial characters"
-                    )
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return self._error_str(result)
-                tmp[j] = result.decoded_value
-                bits_consumed += 8
-                
-            i = 0
-            while i <= max_len and tmp != null_characters:
-                # Add first character of tmp to result
-                chars.append(tmp[0])
-                i += 1
-                
-                # Shift tmp buffer left by one position
-                for j in range(null_size - 1):
-                    tmp[j] = tmp[j + 1]
-                    
-                # Read next character into last position of tmp
-                if self._bitstream.remaining_bits < 8:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message="Insufficient data for next character"
-                    )
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return self._error_str(result)
-                tmp[null_size - 1] = result.decoded_value
-                bits_consumed += 8
+            available = self._bitstream.remaining_bits // 8
+            if available < null_size:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message="Insufficient data for initial characters"
+                )
+
+            # Look at up to max_len + 1 characters plus the terminator sequence at once
+            start_bit = self._bitstream.current_used_bits
+            window_len = min(max_len + 1 + null_size, available)
+            window = self._bitstream.read_bytes(window_len)
+
+            null_pos = window.find(null_characters)
+            if null_pos != -1 and null_pos <= max_len:
+                chars = window[:null_pos]
+                bytes_consumed = null_pos + null_size
+            elif window_len == max_len + 1 + null_size:
+                chars = window[:max_len + 1]
+                bytes_consumed = window_len
+            else:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message="Insufficient data for next character"
+                )
+
+            self._bitstream.set_bit_index(start_bit + bytes_consumed * 8)
 
             # Convert bytes to ASCII string using common helper
-            return self._bytes_to_ascii_string(chars, bits_consumed)
+            return self._bytes_to_ascii_string(chars, bytes_consumed * 8)
         except BitStreamError as e:
             return DecodeResult(
                 success=False,
@@ -753,9 +814,6 @@ class ACNDecoder(Decoder):
             max_len: Maximum allowed string length
             ext_size_determinant_fld: External field determining actual string length
         """
-        # Import IA5 character set from encoder to ensure consistency
-        from .acn_encoder import IA5_CHAR_SET
-        
         if ext_size_determinant_fld < 0:
             return DecodeResult(
                 success=False,
@@ -777,9 +835,6 @@ class ACNDecoder(Decoder):
             max_len: Maximum string length
             min_len: Minimum string length
         """
-        # Import IA5 character set from encoder to ensure consistency
-        from .acn_encoder import IA5_CHAR_SET
-        
         if min_len > max_len:
             return DecodeResult(
                 success=False,
@@ -1057,39 +1112,33 @@ class ACNDecoder(Decoder):
     # ============================================================================
 
     def read_bit_pattern(self, pattern_to_read: bytearray, n_bits_to_read: int) -> DecodeResult[bool]:
-        """Read bit pattern and return boolean value."""
+        """Read bit pattern and return boolean value.
+
+        Args:
+            pattern_to_read: Pattern bytes, MSB aligned
+            n_bits_to_read: Number of pattern bits
+        """
+        return self.read_bit_pattern_uint(bit_pattern_to_uint(pattern_to_read, n_bits_to_read), n_bits_to_read)
+
+    def read_bit_pattern_uint(self, pattern_value: int, n_bits_to_read: int) -> DecodeResult[bool]:
+        """Read n_bits_to_read bits and compare them with a precompiled pattern.
+
+        Used by: generated ACN code, which folds the pattern into an integer constant
+
+        Args:
+            pattern_value: Pattern as unsigned integer of n_bits_to_read bits
+            n_bits_to_read: Number of pattern bits
+
+        Returns:
+            DecodeResult with True if the bits match the pattern
+        """
         try:
-            prev_bits = self._bitstream.current_used_bits
-            bytes_to_read = n_bits_to_read // NO_OF_BITS_IN_BYTE
-            remaining_bits_to_read = n_bits_to_read % NO_OF_BITS_IN_BYTE
-            needed_bytes = bytes_to_read + (0 if remaining_bits_to_read == 0 else 1)
-            
-            bool_result: bool = True
-            i: int = 0
-            
-            while i < bytes_to_read:
-                read: int
-                if self._bitstream.remaining_bits < NO_OF_BITS_IN_BYTE:
-                    read = self._bitstream.read_bits(self._bitstream.remaining_bits)
-                else:
-                    read = self._bitstream.read_byte()
-                
-                if read != pattern_to_read[i]:
-                    bool_result = False
-                    
-                i += 1
-                
-            if remaining_bits_to_read > 0:
-                read = self._bitstream.read_bits(remaining_bits_to_read)
-                pattern = pattern_to_read[bytes_to_read] >> (NO_OF_BITS_IN_BYTE - remaining_bits_to_read)
-                if  read != pattern:
-                    bool_result = False
-            
+            read = self._bitstream.read_bits_wide(n_bits_to_read)
             return DecodeResult(
                 success=True,
                 error_code=DECODE_OK,
-                decoded_value=bool_result,
-                bits_consumed= self._bitstream.current_used_bits - prev_bits
+                decoded_value=read == pattern_value,
+                bits_consumed=n_bits_to_read
             )
             
         except BitStreamError as e:
@@ -1100,82 +1149,44 @@ class ACNDecoder(Decoder):
             )
 
     def decode_true_false_boolean(self, true_pattern: bytearray, false_pattern: bytearray, n_bits_to_read: int) -> DecodeResult[bool]:
-        """Decode boolean using true/false patterns."""
+        """Decode boolean using true/false patterns.
+
+        Args:
+            true_pattern: Pattern bytes for TRUE, MSB aligned
+            false_pattern: Pattern bytes for FALSE, MSB aligned
+            n_bits_to_read: Number of pattern bits
+        """
+        return self.decode_true_false_boolean_uint(bit_pattern_to_uint(true_pattern, n_bits_to_read),
+                                                   bit_pattern_to_uint(false_pattern, n_bits_to_read),
+                                                   n_bits_to_read)
+
+    def decode_true_false_boolean_uint(self, true_value: int, false_value: int, n_bits_to_read: int) -> DecodeResult[bool]:
+        """Decode boolean by comparing the read bits with precompiled true/false patterns.
+
+        Used by: generated ACN code, which folds the patterns into integer constants
+
+        Args:
+            true_value: TRUE pattern as unsigned integer of n_bits_to_read bits
+            false_value: FALSE pattern as unsigned integer of n_bits_to_read bits
+            n_bits_to_read: Number of pattern bits
+
+        Returns:
+            DecodeResult with the boolean, or an error if neither pattern matches
+        """
         try:
-            prev_bits = self._bitstream.current_used_bits
-            bytes_to_read = n_bits_to_read // NO_OF_BITS_IN_BYTE
-            remaining_bits_to_read = n_bits_to_read % NO_OF_BITS_IN_BYTE
-            
-            bool_result: Optional[bool] = None
-            
-            for i in range(bytes_to_read):
-                read = self._bitstream.read_byte() if self._bitstream.remaining_bits >= NO_OF_BITS_IN_BYTE else self._bitstream.read_bits(self._bitstream.remaining_bits)
-                
-                # Validate: byte must match either true or false pattern
-                matches_true = (read == true_pattern[i])
-                matches_false = (read == false_pattern[i])
-                
-                if not matches_true and not matches_false:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message=f"Invalid pattern: {read}"
-                    )
-                
-                # First byte determines the expected pattern
-                if i == 0:
-                    bool_result = matches_true
-                else:
-                    # Subsequent bytes must be consistent with first byte's determination
-                    if matches_true and not bool_result:
-                        return DecodeResult(
-                            success=False,
-                            error_code=ERROR_INVALID_VALUE,
-                            error_message=f"Byte {i} matches true pattern but earlier bytes matched false pattern"
-                        )
-                    if matches_false and bool_result:
-                        return DecodeResult(
-                            success=False,
-                            error_code=ERROR_INVALID_VALUE,
-                            error_message=f"Byte {i} matches false pattern but earlier bytes matched true pattern"
-                        )
-            
-            if remaining_bits_to_read > 0:
-                read = self._bitstream.read_bits(remaining_bits_to_read)
-                true_partial = true_pattern[bytes_to_read] >> (NO_OF_BITS_IN_BYTE - remaining_bits_to_read)
-                false_partial = false_pattern[bytes_to_read] >> (NO_OF_BITS_IN_BYTE - remaining_bits_to_read)
-                
-                matches_true = (read == true_partial)
-                matches_false = (read == false_partial)
-                
-                if not matches_true and not matches_false:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message=f"Invalid pattern: {read}"
-                    )
-                
-                if bytes_to_read == 0:
-                    bool_result = matches_true
-                else:
-                    if matches_true and not bool_result:
-                        return DecodeResult(
-                            success=False,
-                            error_code=ERROR_INVALID_VALUE,
-                            error_message="Remaining bits match true pattern but earlier bytes matched false pattern"
-                        )
-                    if matches_false and bool_result:
-                        return DecodeResult(
-                            success=False,
-                            error_code=ERROR_INVALID_VALUE,
-                            error_message="Remaining bits match false pattern but earlier bytes matched true pattern"
-                        )
+            read = self._bitstream.read_bits_wide(n_bits_to_read)
+            if read != true_value and read != false_value:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=f"Invalid pattern: {read}"
+                )
             
             return DecodeResult(
                 success=True,
                 error_code=DECODE_OK,
-                decoded_value=bool_result,
-                bits_consumed=self._bitstream.current_used_bits - prev_bits
+                decoded_value=read == true_value,
+                bits_consumed=n_bits_to_read
             )
             
         except BitStreamError as e:
@@ -1192,23 +1203,12 @@ class ACNDecoder(Decoder):
     def read_bit_pattern_ignore_value(self, n_bits_to_read: int) -> DecodeResult[None]:
         """Read bit pattern and ignore the value."""
         try:
-            prev_bits = self._bitstream.current_used_bits
-            bytes_to_read = n_bits_to_read // NO_OF_BITS_IN_BYTE
-            remaining_bits_to_read = n_bits_to_read % NO_OF_BITS_IN_BYTE
-            needed_bytes = bytes_to_read + (0 if remaining_bits_to_read == 0 else 1)
-            
-            i: int = 0
-            while i < bytes_to_read:
-                self._bitstream.read_byte()
-                i += 1
-                
-            if remaining_bits_to_read > 0:
-                self._bitstream.read_bits(remaining_bits_to_read)
+            self._bitstream.read_bits_wide(n_bits_to_read)
             
             return DecodeResult(
                 success=True,
                 error_code=DECODE_OK,
-                bits_consumed= self._bitstream.current_used_bits - prev_bits
+                bits_consumed=n_bits_to_read
             )
             
         except BitStreamError as e:
@@ -1246,26 +1246,18 @@ class ACNDecoder(Decoder):
             )
             
         try:
-            chars = []
-            bits_consumed = 0
-            
-            for i in range(characters_to_decode):
-                if self._bitstream.remaining_bits < 8:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message=f"Insufficient data: need {characters_to_decode - i} more characters"
-                    )
+            available = self._bitstream.remaining_bits // 8
+            if available < characters_to_decode:
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=f"Insufficient data: need {characters_to_decode - available} more characters"
+                )
 
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return self._error_str(result)
-                char_byte = result.decoded_value
-                chars.append(char_byte)
-                bits_consumed += 8
+            chars = self._bitstream.read_bytes(characters_to_decode)
 
             # Convert bytes to ASCII string
-            return self._bytes_to_ascii_string(chars, bits_consumed)
+            return self._bytes_to_ascii_string(chars, characters_to_decode * 8)
                 
         except BitStreamError as e:
             return DecodeResult(
@@ -1274,31 +1266,31 @@ class ACNDecoder(Decoder):
                 error_message=str(e)
             )
     
-    def _bytes_to_ascii_string(self, chars: list[int], bits_consumed: int) -> DecodeResult[str]:
-        """Convert list of byte values to ASCII string with proper error handling.
+    def _bytes_to_ascii_string(self, chars: bytes, bits_consumed: int) -> DecodeResult[str]:
+        """Convert decoded bytes to ASCII string with proper error handling.
         
         Args:
-            chars: List of byte values (0-255)
+            chars: Decoded character bytes
             bits_consumed: Number of bits consumed to read these characters
             
         Returns:
             DecodeResult with ASCII string or error
         """
-        try:
-            result_str = bytes(chars).decode('ascii')
-            return DecodeResult(
-                success=True,
-                error_code=DECODE_OK,
-                decoded_value=result_str,
-                bits_consumed=bits_consumed
-            )
-        except UnicodeDecodeError as e:
+        if not chars.isascii():
+            position = next(i for i, char_byte in enumerate(chars) if char_byte > 0x7F)
             return DecodeResult(
                 success=False,
                 error_code=ERROR_INVALID_VALUE,
-                error_message=f"Non-ASCII character encountered: {e}"
+                error_message=f"Non-ASCII character encountered: byte 0x{chars[position]:02x} in position {position}"
             )
 
+        return DecodeResult(
+            success=True,
+            error_code=DECODE_OK,
+            decoded_value=chars.decode('ascii'),
+            bits_consumed=bits_consumed
+        )
+
     def _decode_integer_big_endian(self, bits: int, signed: bool) -> DecodeResult[int]:
         """Helper method to decode integer in big-endian format."""
         try:
@@ -1309,22 +1301,11 @@ class ACNDecoder(Decoder):
                     error_message=f"Insufficient data: need {bits} bits"
                 )
 
-            unsigned_val = 0
-            bytes_count = bits // 8
-            for i in range(bytes_count):
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return result
-                byte_val = result.decoded_value
-                unsigned_val = (unsigned_val << 8) | byte_val
-
-            if signed:
-                sign_bit = 1 << (bits - 1)
-                if unsigned_val & sign_bit:
-                    signed_val = unsigned_val - (1 << bits)
-                else:
-                    signed_val = unsigned_val
-                value = signed_val
+            # Read all bytes with a single bitstream access
+            unsigned_val = int.from_bytes(self._bitstream.read_bytes(bits // 8), "big")
+
+            if signed and unsigned_val >> (bits - 1):
+                value = unsigned_val - (1 << bits)
             else:
                 value = unsigned_val
 
@@ -1351,22 +1332,11 @@ class ACNDecoder(Decoder):
                     error_message=f"Insufficient data: need {bits} bits"
                 )
 
-            unsigned_val = 0
-            bytes_count = bits // 8
-            for i in range(bytes_count):
-                result = self.read_byte()
-                if not result.success or result.decoded_value is None:
-                    return result
-                byte_val = result.decoded_value
-                unsigned_val |= (byte_val << (i * 8))
-
-            if signed:
-                sign_bit = 1 << (bits - 1)
-                if unsigned_val & sign_bit:
-                    signed_val = unsigned_val - (1 << bits)
-                else:
-                    signed_val = unsigned_val
-                value = signed_val
+            # Read all bytes with a single bitstream access
+            unsigned_val = int.from_bytes(self._bitstream.read_bytes(bits // 8), "little")
+
+            if signed and unsigned_val >> (bits - 1):
+                value = unsigned_val - (1 << bits)
             else:
                 value = unsigned_val
 
@@ -1426,43 +1396,30 @@ class ACNDecoder(Decoder):
             )
             
         try:
-            # Calculate bits needed per character index
-            char_set_size = len(allowed_char_set)
-            bits_per_char = self._get_bits_per_char_decode(char_set_size)
-            
-            chars = []
-            bits_consumed = 0
-            
-            for i in range(characters_to_decode):
-                if self._bitstream.remaining_bits < bits_per_char:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message=f"Insufficient data: need {characters_to_decode - i} more character indices"
-                    )
+            # Read all character indices as one bit field and map them through the cached table
+            char_codec = get_char_index_codec(allowed_char_set)
+            bits_consumed = characters_to_decode * char_codec.bits_per_char
 
-                # Read character index as constrained integer (0 to char_set_size-1)
-                result = self.decode_unsigned_integer(bits_per_char)
-                if not result.success or result.decoded_value is None:
-                    return self._error_str(result)
-                char_index = result.decoded_value
+            if self._bitstream.remaining_bits < bits_consumed:
+                available = self._bitstream.remaining_bits // char_codec.bits_per_char
+                return DecodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=f"Insufficient data: need {characters_to_decode - available} more character indices"
+                )
+
+            packed = self._bitstream.read_bits_wide(bits_consumed)
+            chars = char_codec.unpack(packed, characters_to_decode)
 
-                # Validate index is within allowed range
-                if char_index >= char_set_size:
-                    return DecodeResult(
-                        success=False,
-                        error_code=ERROR_INVALID_VALUE,
-                        error_message=f"Character index {char_index} exceeds allowed range 0-{char_set_size-1}"
-                    )
-                    
-                # Map index back to character
-                char_byte = allowed_char_set[char_index]
-                chars.append(char_byte)
-                bits_consumed += bits_per_char
-                
             # Convert bytes to ASCII string using common helper
             return self._bytes_to_ascii_string(chars, bits_consumed)
-                
+
+        except ValueError as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
         except BitStreamError as e:
             return DecodeResult(
                 success=False,
@@ -1479,16 +1436,7 @@ class ACNDecoder(Decoder):
         Returns:
             Number of bits needed per character index
         """
-        if char_set_size <= 1:
-            return 1  # Special case: need at least 1 bit
-        
-        # Calculate ceil(log2(char_set_size))
-        bits_needed = 0
-        temp = char_set_size - 1
-        while temp > 0:
-            bits_needed += 1
-            temp >>= 1
-        return bits_needed
+        return CharIndexCodec.bits_per_char_for(char_set_size)
 
     def _dec_uint_ascii_const_size_impl(self, encoded_size_in_bytes: int) -> DecodeResult:
         """Helper method to decode unsigned integer from ASCII with constant size."""
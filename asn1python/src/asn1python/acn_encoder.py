@@ -6,31 +6,34 @@ ACN allows custom binary encodings for ASN.1 types to support legacy protocols.
 """
 
 import struct
-from typing import Union
+from typing import Sequence, Union
 
 from .acn_decoder import ACNDecoder
 from .bitstream import BitStreamError
+from .char_index_codec import IA5_CHAR_SET, CharIndexCodec, get_char_index_codec
 from .codec import EncodeResult, ENCODE_OK, ERROR_INVALID_VALUE
 from .encoder import Encoder
 
 
-# Global IA5 character set (International Alphabet No. 5 - 7-bit ASCII 0-127)
-# Defined with individual byte values to match Scala reference implementation
-IA5_CHAR_SET = bytes([
-    0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09,
-    0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12, 0x13,
-    0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x1B, 0x1C, 0x1D,
-    0x1E, 0x1F, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27,
-    0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D, 0x2E, 0x2F, 0x30, 0x31,
-    0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B,
-    0x3C, 0x3D, 0x3E, 0x3F, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45,
-    0x46, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4E, 0x4F,
-    0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
-    0x5A, 0x5B, 0x5C, 0x5D, 0x5E, 0x5F, 0x60, 0x61, 0x62, 0x63,
-    0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x6B, 0x6C, 0x6D,
-    0x6E, 0x6F, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77,
-    0x78, 0x79, 0x7A, 0x7B, 0x7C, 0x7D, 0x7E, 0x7F
-])
+class AcnInsertedFieldRef:
+    """
+    Deferred ACN determinant (length, presence or choice determinant).
+
+    The encoder reserves the determinant bits when the field is reached and
+    back-patches the value once the determined field has been encoded, so the
+    content is encoded exactly once (see ACNEncoder.acn_init_det_* /
+    acn_patch_det_*). The decoder only uses value / str_value to hand the
+    decoded determinant to the fields that depend on it.
+    """
+
+    __slots__ = ("bit_position", "n_bits", "is_set", "value", "str_value")
+
+    def __init__(self) -> None:
+        self.bit_position = 0
+        self.n_bits = 0
+        self.is_set = False
+        self.value = 0
+        self.str_value = ""
 
 
 class ACNEncoder(Encoder):
@@ -491,6 +494,277 @@ class ACNEncoder(Encoder):
                 error_message=str(e)
             )
 
+    # ============================================================================
+    # BIT PATTERN ENCODING
+    # ============================================================================
+
+    def append_bit_pattern_uint(self, pattern_value: int, n_bits: int) -> EncodeResult:
+        """Write a precompiled bit pattern with a single bitstream write.
+
+        Used by: generated ACN code for BOOLEAN true/false values and NULL patterns,
+        which folds the pattern into an integer constant (see bit_pattern_to_uint)
+
+        Args:
+            pattern_value: Pattern as unsigned integer of n_bits bits
+            n_bits: Number of pattern bits
+        """
+        try:
+            self._bitstream.write_bits_wide(pattern_value, n_bits)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=n_bits
+            )
+        except BitStreamError as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
+    # ============================================================================
+    # DEFERRED DETERMINANT PATCHING
+    # ============================================================================
+
+    def patch_bits(self, bit_index: int, value: int, n_bits: int) -> EncodeResult:
+        """Overwrite n_bits already encoded bits at bit_index, keeping the current position.
+
+        Used by: deferred determinants and post-encoding checksum functions
+        (see acn_post_encoding)
+        """
+        bitstream = self._bitstream
+        current_position = bitstream.current_used_bits
+        try:
+            bitstream.set_bit_index(bit_index)
+            bitstream.write_bits_wide(value, n_bits)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=0
+            )
+        except BitStreamError as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+        finally:
+            bitstream.set_bit_index(current_position)
+
+    def _acn_init_det(self, det: AcnInsertedFieldRef, n_bits: int) -> EncodeResult:
+        """Remember the current position in det and reserve n_bits zero bits."""
+        det.bit_position = self._bitstream.current_used_bits
+        det.n_bits = n_bits
+        det.is_set = False
+        det.value = 0
+        det.str_value = ""
+        try:
+            self._bitstream.write_bits_wide(0, n_bits)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=n_bits
+            )
+        except BitStreamError as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
+    def _acn_patch_det(self, det: AcnInsertedFieldRef, bits_value: int, value: Union[int, str]) -> EncodeResult:
+        """Write bits_value over the bits reserved by _acn_init_det.
+
+        The first call patches the stream and records value in det. Every
+        further call (a determinant shared by several fields) only checks that
+        the same value is requested again.
+        """
+        if det.is_set:
+            current = det.str_value if isinstance(value, str) else det.value
+            if current != value:
+                return EncodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=f"Determinant already patched with {current!r}, cannot patch with {value!r}"
+                )
+            return EncodeResult(success=True, error_code=ENCODE_OK, bits_encoded=0)
+
+        result = self.patch_bits(det.bit_position, bits_value, det.n_bits)
+        if not result:
+            return result
+
+        if isinstance(value, str):
+            det.str_value = value
+        else:
+            det.value = value
+        det.is_set = True
+        return EncodeResult(success=True, error_code=ENCODE_OK, bits_encoded=0)
+
+    def _acn_patch_det_uint(self, value: int, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        if not 0 <= value < (1 << n_bits):
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Value {value} out of range [0, {(1 << n_bits) - 1}] for {n_bits}-bit unsigned determinant"
+            )
+        return self._acn_patch_det(det, value, value)
+
+    def _acn_patch_det_int(self, value: int, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        min_val = -(1 << (n_bits - 1))
+        max_val = (1 << (n_bits - 1)) - 1
+        if not min_val <= value <= max_val:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Value {value} out of range [{min_val}, {max_val}] for {n_bits}-bit signed determinant"
+            )
+        return self._acn_patch_det(det, value & ((1 << n_bits) - 1), value)
+
+    def _acn_patch_det_uint_le(self, value: int, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        if not 0 <= value < (1 << n_bits):
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Value {value} out of range [0, {(1 << n_bits) - 1}] for {n_bits}-bit unsigned determinant"
+            )
+        swapped = int.from_bytes(value.to_bytes(n_bits // 8, "little"), "big")
+        return self._acn_patch_det(det, swapped, value)
+
+    def acn_init_det_u8(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 8)
+
+    def acn_patch_det_u8(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint(value, 8, det)
+
+    def acn_init_det_u16_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 16)
+
+    def acn_patch_det_u16_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint(value, 16, det)
+
+    def acn_init_det_u32_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 32)
+
+    def acn_patch_det_u32_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint(value, 32, det)
+
+    def acn_init_det_u64_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 64)
+
+    def acn_patch_det_u64_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint(value, 64, det)
+
+    def acn_init_det_u16_le(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 16)
+
+    def acn_patch_det_u16_le(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint_le(value, 16, det)
+
+    def acn_init_det_u32_le(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 32)
+
+    def acn_patch_det_u32_le(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint_le(value, 32, det)
+
+    def acn_init_det_u64_le(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 64)
+
+    def acn_patch_det_u64_le(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint_le(value, 64, det)
+
+    def acn_init_det_i8(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 8)
+
+    def acn_patch_det_i8(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_int(value, 8, det)
+
+    def acn_init_det_i16_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 16)
+
+    def acn_patch_det_i16_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_int(value, 16, det)
+
+    def acn_init_det_i32_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 32)
+
+    def acn_patch_det_i32_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_int(value, 32, det)
+
+    def acn_init_det_i64_be(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 64)
+
+    def acn_patch_det_i64_be(self, value: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_int(value, 64, det)
+
+    def acn_init_det_bool1(self, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, 1)
+
+    def acn_patch_det_bool1(self, value: Union[bool, int], det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det(det, 1 if value else 0, 1 if value else 0)
+
+    def acn_init_det_const_size(self, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, n_bits)
+
+    def acn_patch_det_const_size(self, value: int, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_uint(value, n_bits, det)
+
+    def acn_init_det_twos_complement_const_size(self, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, n_bits)
+
+    def acn_patch_det_twos_complement_const_size(self, value: int, n_bits: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_patch_det_int(value, n_bits, det)
+
+    def acn_init_det_ia5_string_fix_size(self, n_chars: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        return self._acn_init_det(det, n_chars * 7)
+
+    def acn_patch_det_ia5_string_fix_size(self, str_value: str, n_chars: int, det: AcnInsertedFieldRef) -> EncodeResult:
+        """Patch an IA5String determinant: n_chars 7-bit characters, space padded."""
+        if not str_value.isascii():
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Non-IA5 character in determinant value {str_value!r}"
+            )
+        str_bytes = str_value[:n_chars].ljust(n_chars).encode("ascii")
+        packed = get_char_index_codec(IA5_CHAR_SET).pack(str_bytes)
+        return self._acn_patch_det(det, packed, str_value[:n_chars])
+
+    # ============================================================================
+    # FIXED-WIDTH ARRAY ENCODING
+    # ============================================================================
+
+    def enc_fixed_width_array(self, values: Sequence[Union[int, float]], count: int, item_format: str) -> EncodeResult:
+        """Encode the first count items of an array of fixed-width integers or IEEE 754 reals in one block.
+
+        Args:
+            values: Items to encode
+            count: Number of items to encode
+            item_format: struct format of one item including the byte order, e.g. '>H' or '<d'
+        """
+        items = values if len(values) == count else values[:count]
+        try:
+            data = struct.pack(f"{item_format[0]}{count}{item_format[1:]}", *items)
+        except (struct.error, OverflowError) as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Array item not encodable as '{item_format}': {e}"
+            )
+
+        try:
+            self._bitstream.write_bytes(data)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=len(data) * 8
+            )
+        except BitStreamError as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     # ============================================================================
     # STRING ENCODING
     # ============================================================================
@@ -533,11 +807,9 @@ class ACNEncoder(Encoder):
             chars_written, bits_encoded = self._enc_string_ascii_private(max_len, str_val)
             
             # Pad remaining bytes with null terminators (fixed size specific behavior)
-            for i in range(chars_written, max_len):
-                result = self.append_byte(0)
-                if not result.success:
-                    return result
-                bits_encoded += 8
+            padding = max_len - chars_written
+            self._bitstream.write_bytes(bytes(padding))
+            bits_encoded += padding * 8
                 
             return EncodeResult(
                 success=True,
@@ -638,9 +910,7 @@ class ACNEncoder(Encoder):
             chars_written, bits_encoded = self._enc_string_ascii_private(max_len, str_val)
             
             # Append the null termination character sequence (multi-byte null terminated specific behavior)
-            result = self.append_byte_array(null_characters, len(null_characters))
-            if not result.success:
-                return result
+            self._bitstream.write_bytes(bytes(null_characters))
             bits_encoded += len(null_characters) * 8
                 
             return EncodeResult(
@@ -735,11 +1005,7 @@ class ACNEncoder(Encoder):
             )
             
         # Calculate effective string length (up to first null or max_len)
-        effective_len = 0
-        for i in range(min(len(str_bytes), max_len)):
-            if str_bytes[i] == 0:  # Stop at first null character
-                break
-            effective_len += 1
+        effective_len = self._get_effective_length(str_bytes, max_len)
             
         if effective_len < min_len:
             return EncodeResult(
@@ -800,32 +1066,23 @@ class ACNEncoder(Encoder):
             
         try:
             # Fixed size method: encode exactly max_len characters (do NOT stop at null terminators)
-            str_bytes = str_val.encode('ascii')
-            char_set_size = len(allowed_char_set)
-            bits_per_char = self._get_bits_per_char(char_set_size)
-            bits_encoded = 0
-            
-            # Always encode exactly max_len characters
-            for i in range(max_len):
-                if i < len(str_bytes):
-                    # Find character index in allowed set (including null terminators if they exist)
-                    char_index = self._get_char_index(str_bytes[i], allowed_char_set)
-                    if char_index == -1:
-                        return EncodeResult(
-                            success=False,
-                            error_code=ERROR_INVALID_VALUE,
-                            error_message=f"Character '{chr(str_bytes[i])}' (0x{str_bytes[i]:02x}) not found in allowed character set"
-                        )
-                else:
-                    # Pad with index 0 (first character in set)
-                    char_index = 0
-                
-                # Encode index as constrained integer (0 to char_set_size-1)
-                result = self.encode_unsigned_integer(char_index, bits_per_char)
-                if not result.success:
-                    return result
-                bits_encoded += bits_per_char
-                    
+            str_bytes = str_val.encode('ascii')[:max_len]
+            char_codec = get_char_index_codec(allowed_char_set)
+            bits_per_char = char_codec.bits_per_char
+            try:
+                packed = char_codec.pack(str_bytes)
+            except ValueError as e:
+                return EncodeResult(
+                    success=False,
+                    error_code=ERROR_INVALID_VALUE,
+                    error_message=str(e)
+                )
+
+            # Pad with index 0 (first character in set) up to max_len characters
+            padding_bits = (max_len - len(str_bytes)) * bits_per_char
+            bits_encoded = max_len * bits_per_char
+            self._bitstream.write_bits_wide(packed << padding_bits, bits_encoded)
+
             return EncodeResult(
                 success=True,
                 error_code=ENCODE_OK,
@@ -927,11 +1184,7 @@ class ACNEncoder(Encoder):
         try:
             # Calculate effective string length (up to first null or max_len) for validation
             str_bytes = str_val.encode('ascii')
-            effective_len = 0
-            for i in range(min(len(str_bytes), max_len)):
-                if str_bytes[i] == 0:  # Stop at first null character
-                    break
-                effective_len += 1
+            effective_len = self._get_effective_length(str_bytes, max_len)
                 
             if effective_len < min_len:
                 return EncodeResult(
@@ -1020,11 +1273,7 @@ class ACNEncoder(Encoder):
             
         try:
             str_bytes = str_val.encode('ascii')
-            effective_len = 0
-            for i in range(min(len(str_bytes), max_len)):
-                if str_bytes[i] == 0:  # Stop at first null character
-                    break
-                effective_len += 1
+            effective_len = self._get_effective_length(str_bytes, max_len)
                 
             if effective_len < min_len:
                 return EncodeResult(
@@ -1170,9 +1419,7 @@ class ACNEncoder(Encoder):
                 bits_encoded += 8
 
             # Append null termination characters
-            result = self.append_byte_array(null_characters, len(null_characters))
-            if not result.success:
-                return result
+            self._bitstream.write_bytes(bytes(null_characters))
             bits_encoded += len(null_characters) * 8
             
             return EncodeResult(
@@ -1333,9 +1580,7 @@ class ACNEncoder(Encoder):
                 bits_encoded += 8
 
             # Append null termination characters
-            result = self.append_byte_array(null_characters, len(null_characters))
-            if not result.success:
-                return result
+            self._bitstream.write_bytes(bytes(null_characters))
             bits_encoded += len(null_characters) * 8
             
             return EncodeResult(
@@ -1376,21 +1621,28 @@ class ACNEncoder(Encoder):
         """
         # Convert string to bytes using ASCII encoding (may raise UnicodeEncodeError)
         str_bytes = str_val.encode('ascii')
-        
-        bits_encoded = 0
-        chars_written = 0
-        
-        # Write string characters until null terminator (0) or max_len
-        for i in range(min(len(str_bytes), max_len)):
-            if str_bytes[i] == 0:  # Stop at first null character
-                break
-            result = self.append_byte(str_bytes[i])
-            if not result.success:
-                raise BitStreamError(result.error_message)
-            bits_encoded += 8
-            chars_written += 1
-            
-        return chars_written, bits_encoded
+
+        # Write string characters until null terminator (0) or max_len in one bulk write
+        chars_written = self._get_effective_length(str_bytes, max_len)
+        self._bitstream.write_bytes(str_bytes[:chars_written])
+
+        return chars_written, chars_written * 8
+
+    @staticmethod
+    def _get_effective_length(str_bytes: bytes, max_len: int) -> int:
+        """Number of characters up to the first null character, capped at max_len.
+
+        Args:
+            str_bytes: ASCII bytes of the string
+            max_len: Maximum number of characters
+
+        Returns:
+            Number of characters that are actually encoded
+        """
+        null_pos = str_bytes.find(0, 0, max_len)
+        if null_pos != -1:
+            return null_pos
+        return min(len(str_bytes), max_len)
 
     def _enc_string_char_index_private(self, max_len: int, allowed_char_set: Union[bytes, bytearray], str_val: str) -> tuple[int, int]:
         """Private helper method to encode string using character indices until null terminator or max_len.
@@ -1416,31 +1668,17 @@ class ACNEncoder(Encoder):
         """
         # Convert string to bytes using ASCII encoding (may raise UnicodeEncodeError)
         str_bytes = str_val.encode('ascii')
-        
-        # Calculate bits needed per character index
-        char_set_size = len(allowed_char_set)
-        bits_per_char = self._get_bits_per_char(char_set_size)
-        
-        bits_encoded = 0
-        chars_written = 0
-        
-        # Write string characters as indices until null terminator (0) or max_len
-        for i in range(min(len(str_bytes), max_len)):
-            if str_bytes[i] == 0:  # Stop at first null character
-                break
-                
-            # Find character index in allowed set
-            char_index = self._get_char_index(str_bytes[i], allowed_char_set)
-            if char_index == -1:
-                raise ValueError(f"Character '{chr(str_bytes[i])}' (0x{str_bytes[i]:02x}) not found in allowed character set")
-                
-            # Encode index as constrained integer (0 to char_set_size-1)
-            result = self.encode_unsigned_integer(char_index, bits_per_char)
-            if not result.success:
-                raise BitStreamError(result.error_message)
-            bits_encoded += bits_per_char
-            chars_written += 1
-            
+
+        # Stop at first null character or max_len
+        str_bytes = str_bytes[:self._get_effective_length(str_bytes, max_len)]
+
+        # Map all characters through the cached index table and write them as one bit field
+        char_codec = get_char_index_codec(allowed_char_set)
+        packed = char_codec.pack(str_bytes)
+        chars_written = len(str_bytes)
+        bits_encoded = chars_written * char_codec.bits_per_char
+        self._bitstream.write_bits_wide(packed, bits_encoded)
+
         return chars_written, bits_encoded
 
     @staticmethod
@@ -1454,10 +1692,7 @@ class ACNEncoder(Encoder):
         Returns:
             Index position in allowed_char_set, or -1 if not found
         """
-        try:
-            return allowed_char_set.index(char_byte)
-        except ValueError:
-            return -1
+        return get_char_index_codec(allowed_char_set).index_table[char_byte]
     
     @staticmethod
     def _get_bits_per_char(char_set_size: int) -> int:
@@ -1469,16 +1704,7 @@ class ACNEncoder(Encoder):
         Returns:
             Number of bits needed per character index
         """
-        if char_set_size <= 1:
-            return 1  # Special case: need at least 1 bit
-        
-        # Calculate ceil(log2(char_set_size))
-        bits_needed = 0
-        temp = char_set_size - 1
-        while temp > 0:
-            bits_needed += 1
-            temp >>= 1
-        return bits_needed
+        return CharIndexCodec.bits_per_char_for(char_set_size)
 
     def _enc_uint_ascii_const_size_impl(self, int_val: int, encoded_size_in_bytes: int, total_bits: int) -> EncodeResult:
         """Helper method to encode unsigned integer as ASCII with constant size."""
@@ -1571,19 +1797,12 @@ class ACNEncoder(Encoder):
             unsigned_val = int_val
 
         try:
-            # Encode bytes in big-endian order (most significant byte first)
-            bits_encoded = 0
-            for i in range(num_bytes - 1, -1, -1):
-                byte_val = (unsigned_val >> (i * 8)) & 0xFF
-                result = self.append_byte(byte_val)
-                if not result.success:
-                    return result
-                bits_encoded += 8
-
+            # Encode all bytes in big-endian order (most significant byte first) with a single write
+            self._bitstream.write_bytes(unsigned_val.to_bytes(num_bytes, "big"))
             return EncodeResult(
                 success=True,
                 error_code=ENCODE_OK,
-                bits_encoded=bits_encoded
+                bits_encoded=num_bits
             )
         except BitStreamError as e:
             return EncodeResult(
@@ -1635,19 +1854,12 @@ class ACNEncoder(Encoder):
             unsigned_val = int_val
 
         try:
-            # Encode bytes in little-endian order (least significant byte first)
-            bits_encoded = 0
-            for i in range(num_bytes):
-                byte_val = (unsigned_val >> (i * 8)) & 0xFF
-                result = self.append_byte(byte_val)
-                if not result.success:
-                    return result
-                bits_encoded += 8
-
+            # Encode all bytes in little-endian order (least significant byte first) with a single write
+            self._bitstream.write_bytes(unsigned_val.to_bytes(num_bytes, "little"))
             return EncodeResult(
                 success=True,
                 error_code=ENCODE_OK,
-                bits_encoded=bits_encoded
+                bits_encoded=num_bits
             )
         except BitStreamError as e:
             return EncodeResult(
@@ -0,0 +1,146 @@
+"""
+ASN.1 Python Runtime Library - ACN Post-Encoding Functions
+
+This module provides the built-in ACN post-encoding functions and
+post-decoding validators for checksums (e.g. the PUS packet error control
+field). The generated code records the bit position where the SEQUENCE
+starts and where each child starts, then calls the function named by the
+ACN 'post-encoding-function' / 'post-decoding-validator' attribute as
+
+    function(pdu, start_bit_index, positions, codec)
+
+The checksum is computed in one pass over a zero-copy view of the encoded
+bytes and written to (or compared with) the checksum field in place.
+"""
+
+import binascii
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .acn_decoder import ACNDecoder
+from .acn_encoder import ACNEncoder
+from .codec import DecodeResult, EncodeResult, DECODE_OK, ERROR_INVALID_VALUE
+
+ChecksumFunction = Callable[[Union[memoryview, bytes]], int]
+
+
+class AcnBitStreamPositions:
+    """
+    Bit positions saved by the generated code for a post-encoding function.
+
+    Every child of the SEQUENCE gets an attribute with the bit index at which
+    its encoding starts.
+    """
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"AcnBitStreamPositions({items})"
+
+
+def crc16_ccitt(data: Union[memoryview, bytes]) -> int:
+    """CRC-16/CCITT-FALSE (polynomial 0x1021, initial value 0xFFFF) as used by ECSS PUS."""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def crc32(data: Union[memoryview, bytes]) -> int:
+    """CRC-32 (ISO-HDLC, as zlib / Ethernet)."""
+    return zlib.crc32(data)
+
+
+_checksum_functions: Dict[str, Tuple[ChecksumFunction, int]] = {
+    "crc16_ccitt": (crc16_ccitt, 16),
+    "crc32": (crc32, 32),
+}
+
+
+def register_checksum_function(name: str, function: ChecksumFunction, n_bits: int) -> None:
+    """Register a checksum function producing an n_bits wide value under name."""
+    if n_bits <= 0:
+        raise ValueError(f"Checksum width must be positive, got {n_bits}")
+    _checksum_functions[name] = (function, n_bits)
+
+
+def get_checksum_function(name: str) -> Tuple[ChecksumFunction, int]:
+    """Return the registered (function, n_bits) pair for name."""
+    try:
+        return _checksum_functions[name]
+    except KeyError:
+        raise ValueError(f"Unknown checksum function '{name}'") from None
+
+
+def _resolve_checksum(checksum: Union[str, ChecksumFunction], n_bits: Optional[int]) -> Tuple[ChecksumFunction, int]:
+    if isinstance(checksum, str):
+        function, registered_bits = get_checksum_function(checksum)
+        return function, registered_bits if n_bits is None else n_bits
+    if n_bits is None:
+        raise ValueError("n_bits is required for a checksum callable")
+    return checksum, n_bits
+
+
+def checksum_post_encoding_function(checksum: Union[str, ChecksumFunction], field_name: str,
+                                    n_bits: Optional[int] = None) -> Callable[[Any, int, AcnBitStreamPositions, ACNEncoder], EncodeResult]:
+    """Create a post-encoding function that fills in a checksum field.
+
+    The checksum covers everything from the start of the SEQUENCE up to the
+    checksum field, which must already be encoded (e.g. as a zero placeholder).
+
+    Args:
+        checksum: Name of a registered checksum function or a callable
+        field_name: Name of the SEQUENCE child holding the checksum
+        n_bits: Width of the checksum field (defaults to the registered width)
+    """
+    function, width = _resolve_checksum(checksum, n_bits)
+
+    def post_encoding_function(pdu: Any, start_bit_index: int, positions: AcnBitStreamPositions,
+                               codec: ACNEncoder) -> EncodeResult:
+        field_bit_index = getattr(positions, field_name)
+        data = codec.bit_range_view(start_bit_index, field_bit_index)
+        try:
+            value = function(data) & ((1 << width) - 1)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+        return codec.patch_bits(field_bit_index, value, width)
+
+    return post_encoding_function
+
+
+def checksum_post_decoding_validator(checksum: Union[str, ChecksumFunction], field_name: str,
+                                     n_bits: Optional[int] = None) -> Callable[[Any, int, AcnBitStreamPositions, ACNDecoder], DecodeResult[int]]:
+    """Create a post-decoding validator that verifies a checksum field.
+
+    Args:
+        checksum: Name of a registered checksum function or a callable
+        field_name: Name of the SEQUENCE child holding the checksum
+        n_bits: Width of the checksum field (defaults to the registered width)
+    """
+    function, width = _resolve_checksum(checksum, n_bits)
+
+    def post_decoding_validator(pdu: Any, start_bit_index: int, positions: AcnBitStreamPositions,
+                                codec: ACNDecoder) -> DecodeResult[int]:
+        field_bit_index = getattr(positions, field_name)
+        stored = codec.peek_bits(field_bit_index, width)
+        if not stored:
+            return stored
+
+        data = codec.bit_range_view(start_bit_index, field_bit_index)
+        try:
+            expected = function(data) & ((1 << width) - 1)
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+
+        if stored.decoded_value != expected:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"Checksum mismatch in '{field_name}': expected 0x{expected:X}, found 0x{stored.decoded_value:X}"
+            )
+        return DecodeResult(
+            success=True,
+            error_code=DECODE_OK,
+            decoded_value=expected,
+            bits_consumed=0
+        )
+
+    return post_decoding_validator
@@ -5,13 +5,22 @@ This module provides sized integer types and ASN.1 semantic types
 that match the behavior of the C and Scala runtime libraries.
 """
 
+import copyreg
+import importlib
+import math
+import os
+import pkgutil
 from abc import ABC
+from array import array
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
 from dataclasses import dataclass, fields, is_dataclass
-from typing import Self
+from types import ModuleType, NoneType, UnionType
+from typing import Any, Callable, Iterable, Optional, Self, Union, get_args, get_origin, get_type_hints
 
 from .asn1_exceptions import *
 from .encoder import Encoder
 from .decoder import Decoder
+from .codec import Encoding
 
 @dataclass(frozen=True)
 class Asn1ConstraintValidResult:
@@ -31,48 +40,59 @@ class Asn1ConstraintValidResult:
 
 class Asn1Base(ABC):
 
+    # No per-instance __dict__ here, so generated types declared with
+    # asn1_dataclass in slots mode are fully slotted
+    __slots__ = ()
+
     # Generic encode/decode dispatch. These live on the base class rather than
-    # being duplicated into every generated type: the only per-type input is
-    # the size constant, which every type exposes under the same names on its
-    # nested EncodeConstants class. Imports are function-local to avoid the
-    # import cycle between this module and the codec modules.
-    def encode(self, encoding: "Encoding") -> bytearray:
-        from .codec import Encoding
-        if encoding == Encoding.uPER:
-            from .codec_uper import UPEREncoder
-            encoder = UPEREncoder.of_size(type(self).EncodeConstants.REQUIRED_BYTES_FOR_ENCODING)
-            self.encode_uper(encoder)
-            return encoder.get_bitstream_buffer()
-        elif encoding == Encoding.ACN:
-            from .acn_encoder import ACNEncoder
-            encoder = ACNEncoder.of_size(type(self).EncodeConstants.REQUIRED_BYTES_FOR_ACN_ENCODING)
-            self.encode_acn(encoder)
-            return encoder.get_bitstream_buffer()
-        elif encoding == Encoding.XER:
-            from .xer_encoder import XEREncoder
-            encoder = XEREncoder.of_size(0)
-            self.encode_xer(encoder)
-            return encoder.get_bitstream_buffer()
-        else:
-            raise Asn1Exception(f"Invalid encoding type {encoding}")
+    # being duplicated into every generated type. The codec of each encoding
+    # comes from the codec registry and is resolved once per type, into the
+    # _codec_bindings dict each subclass gets from __init_subclass__; after
+    # that a call costs one dict lookup on the class. The registry is imported
+    # only then, as it pulls in the codec modules.
+    def encode(self, encoding: "Encoding", check_constraints: bool = True) -> bytearray:
+        binding = type(self)._codec_bindings.get(encoding)
+        if binding is None:
+            from .codec_registry import bind_codec
+            binding = bind_codec(type(self), encoding)
+        encoder = binding[0]()
+        binding[1](self, encoder, check_constraints)
+        return encoder.get_bitstream_buffer()
 
     @classmethod
-    def decode(cls, encoding: "Encoding", data: bytearray) -> Self:
-        from .codec import Encoding
-        if encoding == Encoding.uPER:
-            from .codec_uper import UPERDecoder
-            decoder = UPERDecoder.from_buffer(data)
-            return cls.decode_uper(decoder)
-        elif encoding == Encoding.ACN:
-            from .acn_decoder import ACNDecoder
-            decoder = ACNDecoder.from_buffer(data)
-            return cls.decode_acn(decoder)
-        elif encoding == Encoding.XER:
-            from .xer_decoder import XERDecoder
-            decoder = XERDecoder.from_buffer(data)
-            return cls.decode_xer(decoder)
-        else:
-            raise Asn1Exception(f"Invalid encoding type {encoding}")
+    def decode(cls, encoding: "Encoding", data: bytearray, check_constraints: bool = True) -> Self:
+        binding = cls._codec_bindings.get(encoding)
+        if binding is None:
+            from .codec_registry import bind_codec
+            binding = bind_codec(cls, encoding)
+        return binding[3](binding[2](data), check_constraints)
+
+    # Conversion to and from plain Python values (dicts, lists, str, ...) for
+    # JSON and data frames. The code generator emits straight-line overrides
+    # for the SEQUENCE, CHOICE, SEQUENCE OF, ENUMERATED and string types; the
+    # remaining types (INTEGER, REAL, time types, ...) are kept as they are.
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        """
+        Return the value as plain Python data: a dict for SEQUENCE and CHOICE types.
+
+        Args:
+            enum_names: ENUMERATED values as enumerant names (True) or integer values (False)
+            hex_octets: OCTET STRING values as hex strings (True) or bytes (False)
+        """
+        return self
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> Self:
+        """Create a value from the plain Python data returned by to_dict() with the same options."""
+        return data
+
+    # Pickling (and copying) through the uPER encoding when enabled with
+    # set_uper_pickling; see _reduce_uper. Runtime wrappers without a uPER
+    # codec, and all types while it is disabled, pickle as usual.
+    def __reduce_ex__(self, protocol):
+        if _uper_pickling and hasattr(type(self), "encode_uper"):
+            return _reduce_uper(self)
+        return super().__reduce_ex__(protocol)
 
     def is_constraint_valid(self) -> Asn1ConstraintValidResult:
         # Default for a type with no constraints: valid. Concrete (not abstract)
@@ -81,21 +101,170 @@ class Asn1Base(ABC):
         # result to chain from instead of None. Types with constraints override.
         return Asn1ConstraintValidResult(is_valid=True)
 
-    @property
-    def __FIELDS__(self) -> list[str]:
-        """Names of this type's dataclass fields (its ASN.1 children).
+    # Field metadata of generated SEQUENCE/CHOICE/SEQUENCE OF types, as tuples
+    # with one entry per dataclass field (ASN.1 child). Each attribute is
+    # computed on first access and then cached as a plain class attribute, so
+    # generic traversal does not call dataclasses.fields() per object. They
+    # are empty for the runtime primitive wrappers (Asn1Boolean, NullType,
+    # ...), which subclass Asn1Base but are not dataclasses.
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # @dataclass processes the class after this hook runs, hence the lazy attributes
+        for name, compute in _FIELD_METADATA.items():
+            setattr(cls, name, _ClassFieldMetadata(name, compute))
+        # Own dict per class: a subclass must not reuse the codec methods bound for its base
+        cls._codec_bindings = {}
 
-        Empty for the runtime primitive wrappers (Asn1Boolean, NullType, ...),
-        which subclass Asn1Base but are not dataclasses."""
-        return [f.name for f in fields(self)] if is_dataclass(self) else []
-    
-    @property
-    def __TYPES__(self) -> list[str]:
-        """Types of this type's dataclass fields (its ASN.1 children).
 
-        Empty for the runtime primitive wrappers (Asn1Boolean, NullType, ...),
-        which subclass Asn1Base but are not dataclasses."""
-        return [f.type for f in fields(self)] if is_dataclass(self) else []
+class _ClassFieldMetadata:
+    """Class attribute computed from its owner on first access, then replaced by the result."""
+
+    def __init__(self, name: str, compute: Callable[[type], tuple]) -> None:
+        self._name = name
+        self._compute = compute
+
+    def __get__(self, instance: Any, owner: type) -> tuple:
+        value = self._compute(owner)
+        setattr(owner, self._name, value)
+        return value
+
+
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Names of the dataclass fields."""
+    return tuple(f.name for f in fields(cls)) if is_dataclass(cls) else ()
+
+
+def _field_types(cls: type) -> tuple[Any, ...]:
+    """Field types as declared (strings in generated modules)."""
+    return tuple(f.type for f in fields(cls)) if is_dataclass(cls) else ()
+
+
+def _field_optional(cls: type) -> tuple[bool, ...]:
+    """True for OPTIONAL children, which the generated code declares as Optional[T] = None."""
+    return tuple(f.default is None for f in fields(cls)) if is_dataclass(cls) else ()
+
+
+def _field_classes(cls: type) -> tuple[Any, ...]:
+    """Resolved field types, without the Optional[] wrapper of OPTIONAL children."""
+    if not is_dataclass(cls):
+        return ()
+    hints = get_type_hints(cls)
+    classes = []
+    for f in fields(cls):
+        hint = hints[f.name]
+        if get_origin(hint) in (Union, UnionType):
+            args = tuple(arg for arg in get_args(hint) if arg is not NoneType)
+            if len(args) == 1:
+                hint = args[0]
+        classes.append(hint)
+    return tuple(classes)
+
+
+_FIELD_METADATA: dict[str, Callable[[type], tuple]] = {
+    "__FIELDS__": _field_names,
+    "__TYPES__": _field_types,
+    "__OPTIONAL__": _field_optional,
+    "__CHILD_CLASSES__": _field_classes,
+}
+for _name, _compute in _FIELD_METADATA.items():
+    setattr(Asn1Base, _name, _ClassFieldMetadata(_name, _compute))
+del _name, _compute
+
+
+# Generated SEQUENCE, CHOICE, SEQUENCE OF, ... classes are declared with
+# @asn1_dataclass. With slots enabled they become @dataclass(slots=True): no
+# per-instance __dict__, so every object of a decoded graph is smaller. The
+# setting is read when a generated module is imported.
+_dataclass_slots = os.environ.get("ASN1PYTHON_DATACLASS_SLOTS", "0") not in ("", "0")
+
+
+def set_dataclass_slots(enabled: bool) -> None:
+    """
+    Choose whether generated types imported from now on use __slots__.
+
+    Call before importing the generated modules; classes that already exist
+    are not changed. The default comes from the ASN1PYTHON_DATACLASS_SLOTS
+    environment variable.
+    """
+    global _dataclass_slots
+    _dataclass_slots = enabled
+
+
+def asn1_dataclass(cls: type) -> type:
+    """Class decorator of the generated types: @dataclass, slotted if enabled."""
+    # SEQUENCE OF types with typed items keep the item-wise __eq__ of Asn1SequenceOf
+    eq = getattr(cls, "ITEM_TYPECODE", None) is None
+    if not _dataclass_slots:
+        return dataclass(cls, eq=eq)
+    slotted = dataclass(cls, eq=eq, slots=True)
+    _rebind_class_cells(slotted, cls)
+    return slotted
+
+
+def _rebind_class_cells(new_cls: type, old_cls: type) -> None:
+    # dataclass(slots=True) returns a new class, but methods using zero-argument
+    # super() (subtype constraint checks, __eq__, ...) still refer to the old one
+    for member in vars(new_cls).values():
+        if isinstance(member, (classmethod, staticmethod)):
+            functions = (member.__func__,)
+        elif isinstance(member, property):
+            functions = (member.fget, member.fset, member.fdel)
+        else:
+            functions = (member,)
+        for function in functions:
+            closure = getattr(function, "__closure__", None)
+            if not closure:
+                continue
+            for name, cell in zip(function.__code__.co_freevars, closure):
+                if name == "__class__" and cell.cell_contents is old_cls:
+                    cell.cell_contents = new_cls
+
+
+# Values of generated types can be pickled as (class, uPER encoding) instead of
+# their whole object graph: near wire size, for sending decoded PDUs between
+# processes. The value must be encodable. Enabled for all generated types with
+# set_uper_pickling (default from the ASN1PYTHON_UPER_PICKLING environment
+# variable), or per package with register_uper_pickling.
+_uper_pickling = os.environ.get("ASN1PYTHON_UPER_PICKLING", "0") not in ("", "0")
+
+
+def set_uper_pickling(enabled: bool) -> None:
+    """Choose whether values of generated types pickle and copy through their uPER encoding."""
+    global _uper_pickling
+    _uper_pickling = enabled
+
+
+def _reduce_uper(value: "Asn1Base"):
+    # Constraints are not checked again: the value is rebuilt exactly as it was
+    return _from_uper, (type(value), bytes(value.encode(Encoding.uPER, check_constraints=False)))
+
+
+def _from_uper(cls: type, data: bytes) -> "Asn1Base":
+    return cls.decode(Encoding.uPER, bytearray(data), check_constraints=False)
+
+
+def register_uper_pickling(package: ModuleType) -> list[type]:
+    """
+    Pickle the generated types of a module, or of all modules of a package, through their uPER encoding.
+
+    The types are registered with copyreg, so this applies whatever
+    set_uper_pickling says. Submodules of a package are imported.
+
+    Returns:
+        The registered types
+    """
+    modules = [package]
+    if hasattr(package, "__path__"):
+        modules += [importlib.import_module(info.name)
+                    for info in pkgutil.walk_packages(package.__path__, package.__name__ + ".")]
+    registered = []
+    for module in modules:
+        for obj in vars(module).values():
+            if isinstance(obj, type) and issubclass(obj, Asn1Base) and obj.__module__ == module.__name__ \
+                    and hasattr(obj, "encode_uper"):
+                copyreg.pickle(obj, _reduce_uper)
+                registered.append(obj)
+    return registered
 
 
 # Integer types using ctypes for automatic range validation and conversion
@@ -104,12 +273,26 @@ class Asn1Base(ABC):
 class Asn1Boolean(Asn1Base):
     """
     ASN.1 Boolean wrapper that behaves as closely as possible to Python's bool.
+
+    Like bool, each class has exactly two immutable instances: calling
+    Asn1Boolean(x) (or a generated BOOLEAN subtype) returns the interned
+    instance for bool(x), so decoding booleans allocates nothing.
     """
 
     __slots__ = ("_val",)
 
-    def __init__(self, val):
-        self._val = bool(val)
+    def __new__(cls, val):
+        return cls._instances[1 if val else 0]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = (cls._intern(False), cls._intern(True))
+
+    @classmethod
+    def _intern(cls, val: bool) -> 'Asn1Boolean':
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "_val", val)
+        return instance
 
     # --- Core protocol ---
     def __bool__(self) -> bool:
@@ -156,9 +339,15 @@ class Asn1Boolean(Asn1Base):
     def __invert__(self) -> 'Asn1Boolean':
         return Asn1Boolean(not self._val)
 
-    # --- Attribute delegation (for any method/properties bool has) ---
-    def __getattr__(self, name):
-        return getattr(self._val, name)
+    # --- Immutability / pickling: values map back to the interned instances ---
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self._val,))
 
     # --- Conversion helpers ---
     @property
@@ -166,10 +355,32 @@ class Asn1Boolean(Asn1Base):
         """Explicit access to the inner bool."""
         return self._val
 
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> bool:
+        return self._val
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Asn1Boolean':
+        return cls(data)
+
     # --- Stub-Implementations of Asn1Base Methods ---
     def is_constraint_valid(self) -> Asn1ConstraintValidResult:
         raise NotImplementedError()
 
+
+Asn1Boolean._instances = (Asn1Boolean._intern(False), Asn1Boolean._intern(True))
+
+
+# Public methods and properties of bool (bit_length, to_bytes, real, ...)
+# forward to the inner bool through class attributes instead of __getattr__
+def _delegate_to_bool(name: str) -> property:
+    return property(lambda self: getattr(self._val, name))
+
+
+for _name in dir(bool):
+    if not _name.startswith("_") and not hasattr(Asn1Boolean, _name):
+        setattr(Asn1Boolean, _name, _delegate_to_bool(_name))
+del _name
+
 import struct as _struct
 
 class Real32(float):
@@ -220,6 +431,13 @@ class NullType(Asn1Base):
     def __delattr__(self, name) -> None:
         raise AttributeError(f"'{self.__class__.__name__}' object has no attributes")
     
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> None:
+        return None
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'NullType':
+        return cls()
+
     def is_constraint_valid(self) -> Asn1ConstraintValidResult:
         # todo: evaluate if NullType.is_constraint_valid should return True or False
         return Asn1ConstraintValidResult(is_valid=True)
@@ -252,6 +470,254 @@ class NullType(Asn1Base):
 # def BitString_equal(...):
 
 
+class Asn1IA5String(Asn1Base):
+    """
+    Base class of the generated IA5String, NumericString and VisibleString types.
+
+    The characters are kept in the `arr` field as a Python str. Values built
+    from a list of character codes (older list-style code) are converted on
+    construction, stopping at the first NUL like the C runtime does.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        if isinstance(self.arr, list):
+            codes = self.arr[:self.arr.index(0)] if 0 in self.arr else self.arr
+            object.__setattr__(self, "arr", "".join(map(chr, codes)))
+
+    def as_list(self) -> list[int]:
+        """Return the characters as a list of character codes, for list-style code."""
+        return list(self.arr.encode("ascii"))
+
+    def __str__(self) -> str:
+        return self.arr
+
+
+class _Asn1ByteArray(Asn1Base):
+    """
+    Shared storage of the OCTET STRING and BIT STRING types.
+
+    The bytes are kept in the `arr` field as a bytes-like object: a read-only
+    memoryview into the decoded buffer after an aligned decode, bytes or a
+    bytearray otherwise. Values built from a list of ints (the initializers and
+    older list-style code) are stored as a mutable bytearray.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self) -> None:
+        if isinstance(self.arr, list):
+            object.__setattr__(self, "arr", bytearray(self.arr))
+
+    def _octets(self):
+        return self.arr
+
+    def to_bytes(self) -> bytes:
+        """Return the used bytes, detached from the decoded buffer."""
+        return bytes(self._octets())
+
+    def as_list(self) -> list[int]:
+        """Return the used bytes as a list of ints, for list-style code."""
+        return list(self._octets())
+
+    # --- Pickling / copy compatibility (memoryviews cannot be pickled) ---
+    def __getstate__(self) -> dict:
+        return {name: bytes(value) if isinstance(value, memoryview) else value
+                for name, value in ((name, getattr(self, name)) for name in self.__FIELDS__)}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+class Asn1OctetString(_Asn1ByteArray):
+    """
+    Base class of the generated OCTET STRING types.
+
+    Variable size types use the first nCount octets of `arr`.
+    """
+
+    __slots__ = ()
+
+    def _octets(self):
+        n_count = getattr(self, "nCount", None)
+        return self.arr if n_count is None else self.arr[:n_count]
+
+
+class Asn1BitString(_Asn1ByteArray):
+    """
+    Base class of the generated BIT STRING types.
+
+    The bits are packed MSB-first into the bytes of `arr`; variable size types
+    use the first nCount bits. Named bits are tested and changed by masking
+    a single byte.
+    """
+
+    __slots__ = ()
+
+    def bit_count(self) -> int:
+        """Return the number of bits in use: nCount, or all bits of arr for fixed size types."""
+        n_count = getattr(self, "nCount", None)
+        return len(self.arr) * 8 if n_count is None else n_count
+
+    def _octets(self):
+        return self.arr[:(self.bit_count() + 7) // 8]
+
+    def to_int(self, num_bits: Optional[int] = None) -> int:
+        """Return the first num_bits bits (default: bit_count()) as an unsigned integer, first bit most significant."""
+        num_bits = self.bit_count() if num_bits is None else num_bits
+        num_bytes = (num_bits + 7) // 8
+        return int.from_bytes(self.arr[:num_bytes], "big") >> (num_bytes * 8 - num_bits)
+
+    def to_bit_str(self, num_bits: Optional[int] = None) -> str:
+        """Return the first num_bits bits (default: bit_count()) as a string of '0' and '1'."""
+        num_bits = self.bit_count() if num_bits is None else num_bits
+        return format(self.to_int(num_bits), f"0{num_bits}b") if num_bits else ""
+
+    @staticmethod
+    def pack_int(value: int, num_bits: int) -> bytearray:
+        """Pack the num_bits low-order bits of value MSB-first into bytes, zero padding the last byte."""
+        num_bytes = (num_bits + 7) // 8
+        return bytearray((value << (num_bytes * 8 - num_bits)).to_bytes(num_bytes, "big"))
+
+    @staticmethod
+    def pack_bit_str(bit_str: str) -> bytearray:
+        """Pack a string of '0' and '1' characters MSB-first into bytes, zero padding the last byte."""
+        return Asn1BitString.pack_int(int(bit_str, 2) if bit_str else 0, len(bit_str))
+
+    # --- Named bits: `bit` is the NamedBits mask (1 << position) ---
+    def has_bit(self, bit: int) -> bool:
+        n = int(bit).bit_length() - 1
+        return n >> 3 < len(self.arr) and bool(self.arr[n >> 3] & (0x80 >> (n & 7)))
+
+    def set_bit(self, bit: int) -> None:
+        n = int(bit).bit_length() - 1
+        arr = self._writable_arr(n >> 3)
+        arr[n >> 3] |= 0x80 >> (n & 7)
+        if getattr(self, "nCount", n + 1) < n + 1:
+            self.nCount = n + 1
+
+    def clear_bit(self, bit: int) -> None:
+        n = int(bit).bit_length() - 1
+        if n >> 3 < len(self.arr):
+            self._writable_arr(n >> 3)[n >> 3] &= ~(0x80 >> (n & 7)) & 0xFF
+
+    def _writable_arr(self, byte_index: int) -> bytearray:
+        arr = self.arr
+        if not isinstance(arr, bytearray):
+            arr = bytearray(arr)
+        if len(arr) <= byte_index:
+            arr.extend(bytes(byte_index + 1 - len(arr)))
+        if arr is not self.arr:
+            object.__setattr__(self, "arr", arr)
+        return arr
+
+
+# SEQUENCE OF INTEGER and SEQUENCE OF REAL values can keep their items in a
+# typed array instead of a list of boxed Python objects: "array" stores them in
+# an array.array, "numpy" in a NumPy array. The setting is read whenever such a
+# value is created.
+_sequence_of_arrays = os.environ.get("ASN1PYTHON_SEQUENCE_OF_ARRAYS", "")
+_numpy = None
+
+
+def set_sequence_of_arrays(kind: Optional[str]) -> None:
+    """
+    Choose how SEQUENCE OF INTEGER/REAL values created from now on store their items.
+
+    kind is None for plain lists (the default), "array" for array.array or
+    "numpy" for NumPy arrays. The default comes from the
+    ASN1PYTHON_SEQUENCE_OF_ARRAYS environment variable.
+
+    Raises:
+        ValueError: If kind is not one of the above
+        ImportError: If kind is "numpy" and NumPy is not installed
+    """
+    global _sequence_of_arrays
+    if kind not in (None, "array", "numpy"):
+        raise ValueError(f"Unknown SEQUENCE OF representation '{kind}', expected None, 'array' or 'numpy'")
+    if kind == "numpy":
+        _import_numpy()
+    _sequence_of_arrays = kind or ""
+
+
+def _import_numpy():
+    global _numpy
+    if _numpy is None:
+        import numpy
+        _numpy = numpy
+    return _numpy
+
+
+class Asn1SequenceOf(Asn1Base):
+    """
+    Base class of the generated SEQUENCE OF types.
+
+    SEQUENCE OF INTEGER/REAL types declare the array typecode of their items
+    in ITEM_TYPECODE, chosen from the integer constraint. Their `arr` is a list,
+    an array.array or a NumPy array depending on set_sequence_of_arrays, and
+    is converted on construction. Variable size types use the first nCount
+    items.
+    """
+
+    __slots__ = ()
+
+    ITEM_TYPECODE: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        typecode = self.ITEM_TYPECODE
+        if typecode is None:
+            return
+        arr = self.arr
+        kind = _sequence_of_arrays
+        if kind == "array":
+            if not (isinstance(arr, array) and arr.typecode == typecode):
+                object.__setattr__(self, "arr", array(typecode, arr))
+        elif kind == "numpy":
+            object.__setattr__(self, "arr", _import_numpy().asarray(arr, dtype=typecode))
+        elif not isinstance(arr, list):
+            object.__setattr__(self, "arr", arr.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return getattr(self, "nCount", None) == getattr(other, "nCount", None) and \
+            _items_equal(self.arr, other.arr)
+
+
+def _items_equal(a, b) -> bool:
+    if len(a) != len(b):
+        return False
+    if type(a) is not type(b):
+        return list(a) == list(b)
+    result = a == b
+    # NumPy compares item-wise
+    return result if isinstance(result, bool) else bool(result.all())
+
+
+class Asn1Enumerated(Asn1Base):
+    """
+    Base class of the generated ENUMERATED types.
+
+    The enumerant is kept in the `val` field as a member of the IntEnum
+    generated next to the type.
+    """
+
+    __slots__ = ()
+
+
+class Asn1Choice(Asn1Base):
+    """
+    Base class of the generated CHOICE types.
+
+    `kind` holds the member of the generated ...InUse IntEnum of the selected
+    alternative and `data` its value.
+    """
+
+    __slots__ = ()
+
+
 OBJECT_IDENTIFIER_MAX_LENGTH = 20
 
 
@@ -306,9 +772,166 @@ class Asn1ObjectIdentifier(Asn1Base):
 
 
 # Time types
-class Asn1TimeZone:
+#
+# The time values are immutable and slotted: they can be shared between
+# decoded values, hashed and pickled compactly. Seconds fractions are kept as
+# the integer of their decimal digits (ASN.1 TIME "fraction" property), so the
+# conversions take the number of fraction digits of the type; they are exact
+# down to microseconds. Epoch conversions use integer calendar arithmetic and
+# do not create datetime objects.
+
+_SECONDS_PER_DAY = 86400
+_US_PER_SECOND = 1_000_000
+
+
+def _days_from_civil(years: int, months: int, days: int) -> int:
+    """Days since 1970-01-01 of a proleptic Gregorian date."""
+    years -= months <= 2
+    era = years // 400
+    year_of_era = years - era * 400
+    day_of_year = (153 * (months + (-3 if months > 2 else 9)) + 2) // 5 + days - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(day_number: int) -> tuple[int, int, int]:
+    """Proleptic Gregorian (years, months, days) of a day number since 1970-01-01."""
+    day_number += 719468
+    era = day_number // 146097
+    day_of_era = day_number - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month_index = (5 * day_of_year + 2) // 153
+    days = day_of_year - (153 * month_index + 2) // 5 + 1
+    months = month_index + (3 if month_index < 10 else -9)
+    return year_of_era + era * 400 + (months <= 2), months, days
+
+
+def _seconds_to_us(seconds: Union[int, float]) -> int:
+    # The whole seconds are split off first so that the fraction rounds like datetime.fromtimestamp
+    whole = math.floor(seconds)
+    return whole * _US_PER_SECOND + round((seconds - whole) * _US_PER_SECOND)
+
+
+def _fraction_to_us(fraction: int, fraction_digits: int) -> int:
+    if fraction_digits <= 6:
+        return fraction * 10 ** (6 - fraction_digits)
+    return fraction // 10 ** (fraction_digits - 6)
+
+
+def _us_to_fraction(us: int, fraction_digits: int) -> int:
+    if fraction_digits <= 6:
+        return us // 10 ** (6 - fraction_digits)
+    return us * 10 ** (fraction_digits - 6)
+
+
+class _Asn1TimeValue:
+    """
+    Immutable base of the time types.
+
+    _FIELDS lists the attributes in constructor order; equality, hashing and
+    pickling are defined on them. Values of different time types never
+    compare equal, but a subclass of a time type compares with the type.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "_FIELDS" in vars(cls):
+            cls._time_kind = cls
+
+    @classmethod
+    def _make(cls, *values) -> Self:
+        """Create an instance from already validated values."""
+        instance = object.__new__(cls)
+        for name, value in zip(cls._FIELDS, values):
+            object.__setattr__(instance, name, value)
+        return instance
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, self._time_kind):
+            return self._values() == other._values()
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self._time_kind.__name__, self._values()))
+
+    def __reduce__(self):
+        return (self.__class__, self._values())
+
+
+class _Asn1Timestamp(_Asn1TimeValue):
+    """
+    Base of the time types that denote a point in time (DATE and DATE-TIME).
+
+    Subclasses convert from and to microseconds since 1970-01-01T00:00:00Z;
+    this class adds the epoch and batch conversions on top.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_epoch_us(cls, us: int, fraction_digits: int) -> Self:
+        raise NotImplementedError
+
+    def _to_epoch_us(self, fraction_digits: int) -> int:
+        raise NotImplementedError
+
+    @classmethod
+    def from_epoch(cls, seconds: Union[int, float], fraction_digits: int = 0) -> Self:
+        """Create a value from POSIX seconds since 1970-01-01T00:00:00Z."""
+        return cls._from_epoch_us(_seconds_to_us(seconds), fraction_digits)
+
+    def to_epoch(self, fraction_digits: int = 0) -> float:
+        """Return the POSIX seconds since 1970-01-01T00:00:00Z."""
+        return self._to_epoch_us(fraction_digits) / _US_PER_SECOND
+
+    @classmethod
+    def from_epochs(cls, seconds: Iterable[Union[int, float]], fraction_digits: int = 0) -> list[Self]:
+        """Convert a sequence of POSIX seconds to values."""
+        from_us = cls._from_epoch_us
+        return [from_us(_seconds_to_us(s), fraction_digits) for s in seconds]
+
+    @staticmethod
+    def to_epochs(values: Iterable["_Asn1Timestamp"], fraction_digits: int = 0) -> list[float]:
+        """Convert a sequence of values to POSIX seconds."""
+        return [v._to_epoch_us(fraction_digits) / _US_PER_SECOND for v in values]
+
+    @classmethod
+    def from_datetime64(cls, values, fraction_digits: int = 0) -> list[Self]:
+        """Convert a NumPy datetime64 array (UTC) to values."""
+        from_us = cls._from_epoch_us
+        us_values = values.astype("datetime64[us]").astype("int64").tolist()
+        return [from_us(us, fraction_digits) for us in us_values]
+
+    @staticmethod
+    def to_datetime64(values: Iterable["_Asn1Timestamp"], fraction_digits: int = 0):
+        """Convert a sequence of values to a NumPy datetime64[us] array (UTC).
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        numpy = _import_numpy()
+        us_values = [v._to_epoch_us(fraction_digits) for v in values]
+        return numpy.array(us_values, dtype="int64").astype("datetime64[us]")
+
+
+class Asn1TimeZone(_Asn1TimeValue):
     """ASN.1 timezone information"""
     __slots__ = ('sign', 'hours', 'mins')
+    _FIELDS = __slots__
 
     def __init__(self, sign: int, hours: int, mins: int):
         """
@@ -326,9 +949,31 @@ class Asn1TimeZone:
         if not (0 <= mins <= 59):
             raise Asn1InvalidValueException(f"Timezone minutes must be 0-59, got {mins}")
         
-        self.sign = sign
-        self.hours = hours
-        self.mins = mins
+        object.__setattr__(self, "sign", sign)
+        object.__setattr__(self, "hours", hours)
+        object.__setattr__(self, "mins", mins)
+
+    def offset_seconds(self) -> int:
+        """Return the offset from UTC in seconds."""
+        return self.sign * (self.hours * 3600 + self.mins * 60)
+
+    @classmethod
+    def from_offset_seconds(cls, seconds: int) -> "Asn1TimeZone":
+        """Create a timezone from an offset from UTC in whole minutes, given in seconds."""
+        hours, mins = divmod(abs(seconds) // 60, 60)
+        return cls(-1 if seconds < 0 else 1, hours, mins)
+
+    def to_tzinfo(self) -> tzinfo:
+        """Return the offset as a datetime.timezone."""
+        return timezone(timedelta(seconds=self.offset_seconds()))
+
+    @classmethod
+    def from_tzinfo(cls, tz: tzinfo, dt: Optional[datetime] = None) -> "Asn1TimeZone":
+        """Create a timezone from the UTC offset of tz (at dt, for zones with daylight saving)."""
+        offset = tz.utcoffset(dt)
+        if offset is None:
+            raise Asn1InvalidValueException(f"Timezone {tz} has no UTC offset")
+        return cls.from_offset_seconds(int(offset.total_seconds()))
 
     def __str__(self) -> str:
         sign_str = "+" if self.sign == 1 else "-"
@@ -337,15 +982,14 @@ class Asn1TimeZone:
     def __repr__(self) -> str:
         return f"Asn1TimeZone({self.sign}, {self.hours}, {self.mins})"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1TimeZone):
-            return self.sign == other.sign and self.hours == other.hours and self.mins == other.mins
-        return False
 
+_UTC_TIME_ZONE = Asn1TimeZone(1, 0, 0)
 
-class Asn1Date:
+
+class Asn1Date(_Asn1Timestamp):
     """ASN.1 DATE type"""
     __slots__ = ('years', 'months', 'days')
+    _FIELDS = __slots__
 
     def __init__(self, years: int, months: int, days: int):
         """
@@ -361,9 +1005,25 @@ class Asn1Date:
         if not (1 <= days <= 31):
             raise Asn1InvalidValueException(f"Day must be 1-31, got {days}")
         
-        self.years = years
-        self.months = months
-        self.days = days
+        object.__setattr__(self, "years", years)
+        object.__setattr__(self, "months", months)
+        object.__setattr__(self, "days", days)
+
+    def to_date(self) -> date:
+        """Return the date as a datetime.date."""
+        return date(self.years, self.months, self.days)
+
+    @classmethod
+    def from_date(cls, value: date) -> Self:
+        """Create a date from a datetime.date (or the date part of a datetime)."""
+        return cls._make(value.year, value.month, value.day)
+
+    @classmethod
+    def _from_epoch_us(cls, us: int, fraction_digits: int) -> Self:
+        return cls._make(*_civil_from_days(us // (_SECONDS_PER_DAY * _US_PER_SECOND)))
+
+    def _to_epoch_us(self, fraction_digits: int) -> int:
+        return _days_from_civil(self.years, self.months, self.days) * _SECONDS_PER_DAY * _US_PER_SECOND
 
     def __str__(self) -> str:
         return f"{self.years:04d}-{self.months:02d}-{self.days:02d}"
@@ -371,15 +1031,55 @@ class Asn1Date:
     def __repr__(self) -> str:
         return f"Asn1Date({self.years}, {self.months}, {self.days})"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1Date):
-            return self.years == other.years and self.months == other.months and self.days == other.days
-        return False
 
+class _Asn1TimeOfDay(_Asn1TimeValue):
+    """Shared validation and conversions of the TIME types: hours, mins, secs and fraction first."""
+
+    __slots__ = ()
+
+    def _init_time(self, hours: int, mins: int, secs: int, fraction: int) -> None:
+        if not (0 <= hours <= 23):
+            raise Asn1InvalidValueException(f"Hours must be 0-23, got {hours}")
+        if not (0 <= mins <= 59):
+            raise Asn1InvalidValueException(f"Minutes must be 0-59, got {mins}")
+        if not (0 <= secs <= 59):
+            raise Asn1InvalidValueException(f"Seconds must be 0-59, got {secs}")
+        if fraction < 0:
+            raise Asn1InvalidValueException(f"Fraction must be non-negative, got {fraction}")
+
+        object.__setattr__(self, "hours", hours)
+        object.__setattr__(self, "mins", mins)
+        object.__setattr__(self, "secs", secs)
+        object.__setattr__(self, "fraction", fraction)
 
-class Asn1LocalTime:
+    def _tzinfo(self) -> Optional[tzinfo]:
+        return None
+
+    def _offset_seconds(self) -> int:
+        return 0
+
+    def _day_us(self, fraction_digits: int) -> int:
+        seconds = self.hours * 3600 + self.mins * 60 + self.secs
+        return seconds * _US_PER_SECOND + _fraction_to_us(self.fraction, fraction_digits)
+
+    def to_time(self, fraction_digits: int = 0) -> time:
+        """Return the time as a datetime.time; fraction_digits is the number of digits of fraction."""
+        return time(self.hours, self.mins, self.secs,
+                    _fraction_to_us(self.fraction, fraction_digits), tzinfo=self._tzinfo())
+
+    @classmethod
+    def _from_day_us(cls, us: int, fraction_digits: int, tz: Optional[Asn1TimeZone]) -> Self:
+        seconds, us = divmod(us, _US_PER_SECOND)
+        minutes, secs = divmod(seconds, 60)
+        hours, mins = divmod(minutes, 60)
+        values = (hours, mins, secs, _us_to_fraction(us, fraction_digits))
+        return cls._make(*values) if tz is None else cls._make(*values, tz)
+
+
+class Asn1LocalTime(_Asn1TimeOfDay):
     """ASN.1 TIME (local time) type"""
     __slots__ = ('hours', 'mins', 'secs', 'fraction')
+    _FIELDS = __slots__
 
     def __init__(self, hours: int, mins: int, secs: int, fraction: int = 0):
         """
@@ -391,19 +1091,12 @@ class Asn1LocalTime:
             secs: Seconds (0-59)
             fraction: Fractional seconds (implementation-specific precision)
         """
-        if not (0 <= hours <= 23):
-            raise Asn1InvalidValueException(f"Hours must be 0-23, got {hours}")
-        if not (0 <= mins <= 59):
-            raise Asn1InvalidValueException(f"Minutes must be 0-59, got {mins}")
-        if not (0 <= secs <= 59):
-            raise Asn1InvalidValueException(f"Seconds must be 0-59, got {secs}")
-        if fraction < 0:
-            raise Asn1InvalidValueException(f"Fraction must be non-negative, got {fraction}")
-        
-        self.hours = hours
-        self.mins = mins
-        self.secs = secs
-        self.fraction = fraction
+        self._init_time(hours, mins, secs, fraction)
+
+    @classmethod
+    def from_time(cls, value: time, fraction_digits: int = 0) -> Self:
+        """Create a local time from the wall clock fields of a datetime.time."""
+        return cls._make(value.hour, value.minute, value.second, _us_to_fraction(value.microsecond, fraction_digits))
 
     def __str__(self) -> str:
         if self.fraction == 0:
@@ -414,16 +1107,11 @@ class Asn1LocalTime:
     def __repr__(self) -> str:
         return f"Asn1LocalTime({self.hours}, {self.mins}, {self.secs}, {self.fraction})"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1LocalTime):
-            return (self.hours == other.hours and self.mins == other.mins and 
-                   self.secs == other.secs and self.fraction == other.fraction)
-        return False
-
 
-class Asn1UtcTime:
+class Asn1UtcTime(_Asn1TimeOfDay):
     """ASN.1 TIME (UTC time) type"""
     __slots__ = ('hours', 'mins', 'secs', 'fraction')
+    _FIELDS = __slots__
 
     def __init__(self, hours: int, mins: int, secs: int, fraction: int = 0):
         """
@@ -435,19 +1123,19 @@ class Asn1UtcTime:
             secs: Seconds (0-59)
             fraction: Fractional seconds (implementation-specific precision)
         """
-        if not (0 <= hours <= 23):
-            raise Asn1InvalidValueException(f"Hours must be 0-23, got {hours}")
-        if not (0 <= mins <= 59):
-            raise Asn1InvalidValueException(f"Minutes must be 0-59, got {mins}")
-        if not (0 <= secs <= 59):
-            raise Asn1InvalidValueException(f"Seconds must be 0-59, got {secs}")
-        if fraction < 0:
-            raise Asn1InvalidValueException(f"Fraction must be non-negative, got {fraction}")
-        
-        self.hours = hours
-        self.mins = mins
-        self.secs = secs
-        self.fraction = fraction
+        self._init_time(hours, mins, secs, fraction)
+
+    def _tzinfo(self) -> Optional[tzinfo]:
+        return timezone.utc
+
+    @classmethod
+    def from_time(cls, value: time, fraction_digits: int = 0) -> Self:
+        """Create a UTC time from a datetime.time; a time with a fixed UTC offset is converted to UTC."""
+        offset = value.utcoffset()
+        day_us = (value.hour * 3600 + value.minute * 60 + value.second) * _US_PER_SECOND + value.microsecond
+        if offset is not None:
+            day_us = (day_us - int(offset.total_seconds()) * _US_PER_SECOND) % (_SECONDS_PER_DAY * _US_PER_SECOND)
+        return cls._from_day_us(day_us, fraction_digits, None)
 
     def __str__(self) -> str:
         if self.fraction == 0:
@@ -458,16 +1146,11 @@ class Asn1UtcTime:
     def __repr__(self) -> str:
         return f"Asn1UtcTime({self.hours}, {self.mins}, {self.secs}, {self.fraction})"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1UtcTime):
-            return (self.hours == other.hours and self.mins == other.mins and 
-                   self.secs == other.secs and self.fraction == other.fraction)
-        return False
-
 
-class Asn1TimeWithTimeZone:
+class Asn1TimeWithTimeZone(_Asn1TimeOfDay):
     """ASN.1 TIME (time with time zone) type"""
     __slots__ = ('hours', 'mins', 'secs', 'fraction', 'tz')
+    _FIELDS = __slots__
 
     def __init__(self, hours: int, mins: int, secs: int, fraction: int, tz: Asn1TimeZone):
         """
@@ -480,21 +1163,23 @@ class Asn1TimeWithTimeZone:
             fraction: Fractional seconds (implementation-specific precision)
             tz: Timezone information
         """
-        if not (0 <= hours <= 23):
-            raise Asn1InvalidValueException(f"Hours must be 0-23, got {hours}")
-        if not (0 <= mins <= 59):
-            raise Asn1InvalidValueException(f"Minutes must be 0-59, got {mins}")
-        if not (0 <= secs <= 59):
-            raise Asn1InvalidValueException(f"Seconds must be 0-59, got {secs}")
-        if fraction < 0:
-            raise Asn1InvalidValueException(f"Fraction must be non-negative, got {fraction}")
         assert isinstance(tz, Asn1TimeZone)
-        
-        self.hours = hours
-        self.mins = mins
-        self.secs = secs
-        self.fraction = fraction
-        self.tz = tz
+        self._init_time(hours, mins, secs, fraction)
+        object.__setattr__(self, "tz", tz)
+
+    def _tzinfo(self) -> Optional[tzinfo]:
+        return self.tz.to_tzinfo()
+
+    def _offset_seconds(self) -> int:
+        return self.tz.offset_seconds()
+
+    @classmethod
+    def from_time(cls, value: time, fraction_digits: int = 0) -> Self:
+        """Create a time with time zone from a datetime.time with a fixed UTC offset."""
+        if value.tzinfo is None:
+            raise Asn1InvalidValueException("A time with time zone needs an aware datetime.time")
+        return cls._make(value.hour, value.minute, value.second,
+                         _us_to_fraction(value.microsecond, fraction_digits), Asn1TimeZone.from_tzinfo(value.tzinfo))
 
     def __str__(self) -> str:
         time_str = f"{self.hours:02d}:{self.mins:02d}:{self.secs:02d}"
@@ -505,17 +1190,63 @@ class Asn1TimeWithTimeZone:
     def __repr__(self) -> str:
         return f"Asn1TimeWithTimeZone({self.hours}, {self.mins}, {self.secs}, {self.fraction}, {self.tz!r})"
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1TimeWithTimeZone):
-            return (self.hours == other.hours and self.mins == other.mins and 
-                   self.secs == other.secs and self.fraction == other.fraction and 
-                   self.tz == other.tz)
-        return False
 
+class _Asn1DateTime(_Asn1Timestamp):
+    """Shared conversions of the DATE-TIME types, made of a date and a time of _TIME_CLASS."""
+
+    __slots__ = ()
+
+    _TIME_CLASS: type = _Asn1TimeOfDay
+
+    def _init_date_time(self, date: Asn1Date, time: _Asn1TimeOfDay) -> None:
+        assert isinstance(date, Asn1Date)
+        assert isinstance(time, self._TIME_CLASS)
+
+        object.__setattr__(self, "date", date)
+        object.__setattr__(self, "time", time)
+
+    def to_datetime(self, fraction_digits: int = 0) -> datetime:
+        """Return the value as a datetime.datetime; fraction_digits is the number of digits of the seconds fraction."""
+        d, t = self.date, self.time
+        return datetime(d.years, d.months, d.days, t.hours, t.mins, t.secs,
+                        _fraction_to_us(t.fraction, fraction_digits), tzinfo=t._tzinfo())
+
+    @classmethod
+    def from_datetime(cls, value: datetime, fraction_digits: int = 0) -> Self:
+        """Create a value from the fields of a datetime.datetime."""
+        return cls._make(Asn1Date._make(value.year, value.month, value.day),
+                         cls._TIME_CLASS._make(value.hour, value.minute, value.second,
+                                               _us_to_fraction(value.microsecond, fraction_digits)))
+
+    @classmethod
+    def _from_epoch_us(cls, us: int, fraction_digits: int, tz: Optional[Asn1TimeZone] = None) -> Self:
+        if tz is not None:
+            us += tz.offset_seconds() * _US_PER_SECOND
+        day_number, day_us = divmod(us, _SECONDS_PER_DAY * _US_PER_SECOND)
+        return cls._make(Asn1Date._make(*_civil_from_days(day_number)),
+                         cls._TIME_CLASS._from_day_us(day_us, fraction_digits, tz))
+
+    def _to_epoch_us(self, fraction_digits: int) -> int:
+        d, t = self.date, self.time
+        day_number = _days_from_civil(d.years, d.months, d.days)
+        return day_number * _SECONDS_PER_DAY * _US_PER_SECOND + t._day_us(fraction_digits) - t._offset_seconds() * _US_PER_SECOND
 
-class Asn1DateLocalTime:
-    """ASN.1 DATE-TIME (local time) type"""
+    def __str__(self) -> str:
+        return f"{self.date}T{self.time}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.date!r}, {self.time!r})"
+
+
+class Asn1DateLocalTime(_Asn1DateTime):
+    """
+    ASN.1 DATE-TIME (local time) type
+
+    Epoch conversions read the local wall clock as if it were UTC.
+    """
     __slots__ = ('date', 'time')
+    _FIELDS = __slots__
+    _TIME_CLASS = Asn1LocalTime
 
     def __init__(self, date: Asn1Date, time: Asn1LocalTime):
         """
@@ -525,27 +1256,14 @@ class Asn1DateLocalTime:
             date: Date component
             time: Local time component
         """
-        assert isinstance(date, Asn1Date)
-        assert isinstance(time, Asn1LocalTime)
-        
-        self.date = date
-        self.time = time
-
-    def __str__(self) -> str:
-        return f"{self.date}T{self.time}"
-
-    def __repr__(self) -> str:
-        return f"Asn1DateLocalTime({self.date!r}, {self.time!r})"
-
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1DateLocalTime):
-            return self.date == other.date and self.time == other.time
-        return False
+        self._init_date_time(date, time)
 
 
-class Asn1DateUtcTime:
+class Asn1DateUtcTime(_Asn1DateTime):
     """ASN.1 DATE-TIME (UTC time) type"""
     __slots__ = ('date', 'time')
+    _FIELDS = __slots__
+    _TIME_CLASS = Asn1UtcTime
 
     def __init__(self, date: Asn1Date, time: Asn1UtcTime):
         """
@@ -555,27 +1273,21 @@ class Asn1DateUtcTime:
             date: Date component
             time: UTC time component
         """
-        assert isinstance(date, Asn1Date)
-        assert isinstance(time, Asn1UtcTime)
-
-        self.date = date
-        self.time = time
+        self._init_date_time(date, time)
 
-    def __str__(self) -> str:
-        return f"{self.date}T{self.time}"
-
-    def __repr__(self) -> str:
-        return f"Asn1DateUtcTime({self.date!r}, {self.time!r})"
-
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1DateUtcTime):
-            return self.date == other.date and self.time == other.time
-        return False
+    @classmethod
+    def from_datetime(cls, value: datetime, fraction_digits: int = 0) -> Self:
+        """Create a value from a datetime.datetime; aware datetimes are converted to UTC, naive ones are taken as UTC."""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return super().from_datetime(value, fraction_digits)
 
 
-class Asn1DateTimeWithTimeZone:
+class Asn1DateTimeWithTimeZone(_Asn1DateTime):
     """ASN.1 DATE-TIME (time with time zone) type"""
     __slots__ = ('date', 'time')
+    _FIELDS = __slots__
+    _TIME_CLASS = Asn1TimeWithTimeZone
 
     def __init__(self, date: Asn1Date, time: Asn1TimeWithTimeZone):
         """
@@ -585,19 +1297,32 @@ class Asn1DateTimeWithTimeZone:
             date: Date component
             time: Time with timezone component
         """
-        assert isinstance(date, Asn1Date)
-        assert isinstance(time, Asn1TimeWithTimeZone)
-        
-        self.date = date
-        self.time = time
+        self._init_date_time(date, time)
 
-    def __str__(self) -> str:
-        return f"{self.date}T{self.time}"
+    @classmethod
+    def from_datetime(cls, value: datetime, fraction_digits: int = 0) -> Self:
+        """Create a value from an aware datetime.datetime, keeping its UTC offset."""
+        if value.tzinfo is None:
+            raise Asn1InvalidValueException("A date-time with time zone needs an aware datetime.datetime")
+        tz = Asn1TimeZone.from_tzinfo(value.tzinfo, value)
+        return cls._make(Asn1Date._make(value.year, value.month, value.day),
+                         Asn1TimeWithTimeZone._make(value.hour, value.minute, value.second,
+                                                    _us_to_fraction(value.microsecond, fraction_digits), tz))
 
-    def __repr__(self) -> str:
-        return f"Asn1DateTimeWithTimeZone({self.date!r}, {self.time!r})"
+    @classmethod
+    def from_epoch(cls, seconds: Union[int, float], fraction_digits: int = 0,
+                   tz: Asn1TimeZone = _UTC_TIME_ZONE) -> Self:
+        """Create a value from POSIX seconds, expressed in the time zone tz (default UTC)."""
+        return cls._from_epoch_us(_seconds_to_us(seconds), fraction_digits, tz)
+
+    @classmethod
+    def from_epochs(cls, seconds: Iterable[Union[int, float]], fraction_digits: int = 0,
+                    tz: Asn1TimeZone = _UTC_TIME_ZONE) -> list[Self]:
+        """Convert a sequence of POSIX seconds to values in the time zone tz (default UTC)."""
+        from_us = cls._from_epoch_us
+        return [from_us(_seconds_to_us(s), fraction_digits, tz) for s in seconds]
+
+    @classmethod
+    def _from_epoch_us(cls, us: int, fraction_digits: int, tz: Optional[Asn1TimeZone] = None) -> Self:
+        return super()._from_epoch_us(us, fraction_digits, _UTC_TIME_ZONE if tz is None else tz)
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Asn1DateTimeWithTimeZone):
-            return self.date == other.date and self.time == other.time
-        return False
\ No newline at end of file
@@ -5,7 +5,7 @@ This module provides bit-level reading and writing operations
 that match the behavior of the C and Scala bitstream implementations.
 """
 
-from typing import List
+from typing import List, Union
 from .asn1_constants import NO_OF_BITS_IN_BYTE
 
 class BitStreamError(Exception):
@@ -180,6 +180,87 @@ class BitStream:
         """Read a complete byte"""
         return self.read_bits(8)
 
+    def read_bits_wide(self, bit_count: int) -> int:
+        """Read an arbitrary number of bits in one step and return them as integer.
+
+        Unlike read_bits this is not limited to 64 bits: the covered bytes are
+        converted with a single int.from_bytes and the requested field is
+        shifted and masked out, so the cost does not grow per bit.
+        """
+        if bit_count < 0:
+            raise BitStreamError(f"Bit count {bit_count} must not be negative")
+
+        if self.remaining_bits < bit_count:
+            raise BitStreamError("Cannot read beyond end of bitstream")
+
+        if bit_count == 0:
+            return 0
+
+        total_bits = self._current_bit + bit_count
+        n_bytes = (total_bits + NO_OF_BITS_IN_BYTE - 1) // NO_OF_BITS_IN_BYTE
+        shift = n_bytes * NO_OF_BITS_IN_BYTE - total_bits
+        chunk = int.from_bytes(self._buffer[self._current_byte:self._current_byte + n_bytes], "big")
+
+        self.set_bit_index(self.current_used_bits + bit_count)
+        return (chunk >> shift) & ((1 << bit_count) - 1)
+
+    def read_bytes(self, byte_count: int) -> bytes:
+        """Read byte_count complete bytes in one step.
+
+        Byte aligned reads are a plain slice of the buffer; otherwise the bytes
+        are extracted as a single wide bit field.
+        """
+        if byte_count < 0:
+            raise BitStreamError(f"Byte count {byte_count} must not be negative")
+
+        if self.remaining_bits < byte_count * NO_OF_BITS_IN_BYTE:
+            raise BitStreamError("Cannot read beyond end of bitstream")
+
+        if self._current_bit != 0:
+            return self.read_bits_wide(byte_count * NO_OF_BITS_IN_BYTE).to_bytes(byte_count, "big")
+
+        start = self._current_byte
+        data = bytes(self._buffer[start:start + byte_count])
+        self.set_position(0, start + byte_count)
+        return data
+
+    def read_bytes_view(self, byte_count: int) -> Union[memoryview, bytes]:
+        """Read byte_count complete bytes without copying them when possible.
+
+        Byte aligned reads return a read-only memoryview of the buffer, so the
+        result stays valid only as long as the buffer is not modified; other
+        reads fall back to read_bytes.
+        """
+        if self._current_bit != 0 or byte_count < 0 or self.remaining_bits < byte_count * NO_OF_BITS_IN_BYTE:
+            return self.read_bytes(byte_count)
+
+        start = self._current_byte
+        view = memoryview(self._buffer)[start:start + byte_count].toreadonly()
+        self.set_position(0, start + byte_count)
+        return view
+
+    def bit_range_view(self, start_bit: int, end_bit: int) -> Union[memoryview, bytes]:
+        """Return the bits [start_bit, end_bit) as bytes without moving the position.
+
+        When both ends are byte aligned this is a zero-copy memoryview of the
+        buffer (release it before the stream grows). Otherwise the range is
+        extracted as one wide field, left aligned and zero padded to whole bytes.
+        """
+        if not 0 <= start_bit <= end_bit <= self.buffer_size * NO_OF_BITS_IN_BYTE:
+            raise BitStreamError(f"Bit range [{start_bit}, {end_bit}) outside of bitstream")
+
+        if start_bit % NO_OF_BITS_IN_BYTE == 0 and end_bit % NO_OF_BITS_IN_BYTE == 0:
+            return memoryview(self._buffer)[start_bit // NO_OF_BITS_IN_BYTE:end_bit // NO_OF_BITS_IN_BYTE]
+
+        bit_count = end_bit - start_bit
+        first_byte = start_bit // NO_OF_BITS_IN_BYTE
+        last_byte = (end_bit + NO_OF_BITS_IN_BYTE - 1) // NO_OF_BITS_IN_BYTE
+        chunk = int.from_bytes(self._buffer[first_byte:last_byte], "big")
+        chunk >>= last_byte * NO_OF_BITS_IN_BYTE - end_bit
+        n_bytes = (bit_count + NO_OF_BITS_IN_BYTE - 1) // NO_OF_BITS_IN_BYTE
+        padding = n_bytes * NO_OF_BITS_IN_BYTE - bit_count
+        return ((chunk & ((1 << bit_count) - 1)) << padding).to_bytes(n_bytes, "big")
+
     #endregion
     #region Write
 
@@ -231,6 +312,60 @@ class BitStream:
             self.__write_bit(bit)
             i = i + 1
 
+    def write_bits_wide(self, value: int, bit_count: int) -> None:
+        """Write an arbitrary number of bits from an integer value in one step.
+
+        Unlike write_bits this is not limited to 64 bits: the field is merged into
+        the covered bytes with a single int.to_bytes, preserving the bits around it
+        exactly like the bitwise path does.
+        """
+        if bit_count < 0:
+            raise BitStreamError(f"Bit count {bit_count} must not be negative")
+
+        if self.remaining_bits < bit_count:
+            if self._growable:
+                self._grow_to_fit(bit_count)
+            else:
+                raise BitStreamError("Cannot write beyond end of bitstream")
+
+        if value < 0 or value >= (1 << bit_count):
+            raise BitStreamError(f"Value {value} does not fit in {bit_count} bits")
+
+        if bit_count == 0:
+            return
+
+        start = self._current_byte
+        total_bits = self._current_bit + bit_count
+        n_bytes = (total_bits + NO_OF_BITS_IN_BYTE - 1) // NO_OF_BITS_IN_BYTE
+        shift = n_bytes * NO_OF_BITS_IN_BYTE - total_bits
+        mask = ((1 << bit_count) - 1) << shift
+        chunk = int.from_bytes(self._buffer[start:start + n_bytes], "big")
+        chunk = (chunk & ~mask) | (value << shift)
+        self._buffer[start:start + n_bytes] = chunk.to_bytes(n_bytes, "big")
+
+        self.set_bit_index(self.current_used_bits + bit_count)
+
+    def write_bytes(self, data: bytes) -> None:
+        """Write all bytes of data in one step.
+
+        Byte aligned writes are a plain slice assignment into the buffer; otherwise
+        the bytes are merged in as a single wide bit field.
+        """
+        byte_count = len(data)
+        if self._current_bit != 0:
+            self.write_bits_wide(int.from_bytes(data, "big"), byte_count * NO_OF_BITS_IN_BYTE)
+            return
+
+        if self.remaining_bits < byte_count * NO_OF_BITS_IN_BYTE:
+            if self._growable:
+                self._grow_to_fit(byte_count * NO_OF_BITS_IN_BYTE)
+            else:
+                raise BitStreamError("Cannot write beyond end of bitstream")
+
+        start = self._current_byte
+        self._buffer[start:start + byte_count] = data
+        self.set_position(0, start + byte_count)
+
     def write_byte(self, byte_value: int) -> None:
         """Write a complete byte"""
         if byte_value < 0 or byte_value > 255:
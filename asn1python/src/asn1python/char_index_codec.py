@@ -0,0 +1,154 @@
+"""
+ASN.1 Python Runtime Library - Character Index Tables
+
+This module provides the per-alphabet lookup tables used by the ACN
+character index string encodings. A table is built once per allowed
+character set and cached, so encoding and decoding a string becomes a
+byte translation plus a single big-integer bit field instead of a linear
+search and a bitstream call per character.
+"""
+
+from functools import lru_cache
+from typing import Tuple, Union
+
+from .asn1_constants import NO_OF_BITS_IN_BYTE
+
+
+# Global IA5 character set (International Alphabet No. 5 - 7-bit ASCII 0-127)
+# Defined with individual byte values to match Scala reference implementation
+IA5_CHAR_SET = bytes([
+    0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09,
+    0x0A, 0x0B, 0x0C, 0x0D, 0x0E, 0x0F, 0x10, 0x11, 0x12, 0x13,
+    0x14, 0x15, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x1B, 0x1C, 0x1D,
+    0x1E, 0x1F, 0x20, 0x21, 0x22, 0x23, 0x24, 0x25, 0x26, 0x27,
+    0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D, 0x2E, 0x2F, 0x30, 0x31,
+    0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3A, 0x3B,
+    0x3C, 0x3D, 0x3E, 0x3F, 0x40, 0x41, 0x42, 0x43, 0x44, 0x45,
+    0x46, 0x47, 0x48, 0x49, 0x4A, 0x4B, 0x4C, 0x4D, 0x4E, 0x4F,
+    0x50, 0x51, 0x52, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59,
+    0x5A, 0x5B, 0x5C, 0x5D, 0x5E, 0x5F, 0x60, 0x61, 0x62, 0x63,
+    0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6A, 0x6B, 0x6C, 0x6D,
+    0x6E, 0x6F, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77,
+    0x78, 0x79, 0x7A, 0x7B, 0x7C, 0x7D, 0x7E, 0x7F
+])
+
+
+class CharIndexCodec:
+    """
+    Translation tables for one allowed character set.
+
+    index_table maps every byte value (0-255) to its index in the character
+    set (-1 if it is not part of it); char_set is the inverse mapping from
+    index back to byte value. A string of n characters is packed into one
+    integer of n * bits_per_char bits, first character in the most
+    significant position, which is exactly the bit order produced by writing
+    the indices one after another.
+    """
+
+    __slots__ = ("char_set", "bits_per_char", "index_table",
+                 "_translate_table", "_inverse_table", "_index_patterns", "_pattern_indices")
+
+    def __init__(self, char_set: bytes):
+        if len(char_set) == 0:
+            raise ValueError("Allowed character set cannot be empty")
+
+        self.char_set = char_set
+        self.bits_per_char = CharIndexCodec.bits_per_char_for(len(char_set))
+
+        index_table = [-1] * 256
+        for index, char_byte in enumerate(char_set):
+            if index_table[char_byte] == -1:
+                index_table[char_byte] = index
+        self.index_table: Tuple[int, ...] = tuple(index_table)
+
+        # bytes.translate tables: byte value -> index, and index -> byte value
+        self._translate_table = bytes(max(index, 0) for index in index_table)
+        self._inverse_table = (char_set + bytes(256))[:256]
+
+        # Fixed-width binary digits of every index and the reverse lookup
+        width = self.bits_per_char
+        self._index_patterns = tuple(format(index, f"0{width}b") for index in range(1 << width))
+        self._pattern_indices = {pattern: index for index, pattern in enumerate(self._index_patterns)}
+
+    @staticmethod
+    def bits_per_char_for(char_set_size: int) -> int:
+        """Calculate minimum bits needed to represent indices in a character set.
+
+        Args:
+            char_set_size: Size of the character set
+
+        Returns:
+            Number of bits needed per character index (at least 1)
+        """
+        if char_set_size <= 1:
+            return 1
+        return (char_set_size - 1).bit_length()
+
+    def pack(self, str_bytes: bytes) -> int:
+        """Map every character to its index and pack all indices into one integer.
+
+        Args:
+            str_bytes: ASCII bytes of the characters to encode
+
+        Returns:
+            Integer of len(str_bytes) * bits_per_char bits
+
+        Raises:
+            ValueError: If a character is not part of the character set
+        """
+        missing = str_bytes.translate(None, self.char_set)
+        if missing:
+            char_byte = missing[0]
+            raise ValueError(f"Character '{chr(char_byte)}' (0x{char_byte:02x}) not found in allowed character set")
+
+        indices = str_bytes.translate(self._translate_table)
+        if self.bits_per_char == NO_OF_BITS_IN_BYTE:
+            return int.from_bytes(indices, "big")
+        if not indices:
+            return 0
+        return int("".join(map(self._index_patterns.__getitem__, indices)), 2)
+
+    def unpack(self, value: int, count: int) -> bytes:
+        """Split a packed integer of count indices and map them back to characters.
+
+        Args:
+            value: Integer of count * bits_per_char bits
+            count: Number of characters packed in value
+
+        Returns:
+            The decoded character bytes
+
+        Raises:
+            ValueError: If an index is outside of the character set
+        """
+        if count == 0:
+            return b""
+
+        width = self.bits_per_char
+        if width == NO_OF_BITS_IN_BYTE:
+            indices = value.to_bytes(count, "big")
+        else:
+            digits = format(value, f"0{count * width}b")
+            lookup = self._pattern_indices.__getitem__
+            indices = bytes(map(lookup, (digits[i:i + width] for i in range(0, count * width, width))))
+
+        char_set_size = len(self.char_set)
+        if max(indices) >= char_set_size:
+            bad_index = next(index for index in indices if index >= char_set_size)
+            raise ValueError(f"Character index {bad_index} exceeds allowed range 0-{char_set_size - 1}")
+
+        return indices.translate(self._inverse_table)
+
+
+@lru_cache(maxsize=256)
+def _char_index_codec_for(char_set: bytes) -> CharIndexCodec:
+    return CharIndexCodec(char_set)
+
+
+def get_char_index_codec(allowed_char_set: Union[bytes, bytearray]) -> CharIndexCodec:
+    """Return the cached CharIndexCodec for an allowed character set.
+
+    Generated code passes a fresh bytearray on every call, so the cache is
+    keyed by the (immutable) byte content rather than the object.
+    """
+    return _char_index_codec_for(bytes(allowed_char_set))
@@ -5,7 +5,7 @@ This module provides the base codec framework for ASN.1 encoding/decoding operat
 """
 
 from abc import ABC
-from typing import Optional, Self, TypeVar, Generic
+from typing import Optional, Self, TypeVar, Generic, Union
 from dataclasses import dataclass
 from enum import IntEnum
 from .bitstream import BitStream, BitStreamError
@@ -118,7 +118,16 @@ class Codec(ABC):
             Current bit position (0-based index)
         """
         return self._bitstream.current_used_bits
-    
+
+    def bit_range_view(self, start_bit: int, end_bit: int) -> Union[memoryview, bytes]:
+        """
+        Get the encoded bits [start_bit, end_bit) as bytes, e.g. for checksums.
+
+        Byte aligned ranges are a zero-copy memoryview of the buffer
+        (see BitStream.bit_range_view).
+        """
+        return self._bitstream.bit_range_view(start_bit, end_bit)
+
     @property
     def remaining_bits(self) -> int:
         return self._bitstream.remaining_bits
\ No newline at end of file
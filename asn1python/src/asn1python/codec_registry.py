@@ -0,0 +1,102 @@
+"""
+ASN.1 Python Runtime Library - Codec Registry
+
+This module maps each encoding to the codec classes and generated method
+names that Asn1Base.encode() and Asn1Base.decode() dispatch to. The codec
+resolved for a generated type is cached on the class itself, in its
+_codec_bindings dict, and dropped again when a codec is (re-)registered.
+"""
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from weakref import WeakSet
+
+from .asn1_exceptions import Asn1Exception
+from .codec import Encoding
+from .codec_uper import UPEREncoder, UPERDecoder
+from .acn_encoder import ACNEncoder
+from .acn_decoder import ACNDecoder
+
+
+@dataclass(frozen=True)
+class CodecRegistration:
+    """
+    How to encode and decode values of generated types in one encoding.
+
+    The encoder class must provide of_size() and get_bitstream_buffer(), the
+    decoder class from_buffer(), like the built-in codecs.
+    """
+    encoder_class: type
+    decoder_class: type
+    encode_method: str
+    decode_method: str
+    size_constant: Optional[str] = None  # EncodeConstants attribute passed to of_size()
+
+
+_registry: Dict[Hashable, CodecRegistration] = {}
+_bound_classes: "WeakSet[type]" = WeakSet()  # classes with a non-empty _codec_bindings dict
+
+
+def register_codec(encoding: Hashable, registration: CodecRegistration) -> None:
+    """
+    Register (or replace) the codec used for an encoding.
+
+    Args:
+        encoding: An Encoding member, or any other hashable key for third-party codecs
+        registration: Codec classes and generated method names
+    """
+    _registry[encoding] = registration
+    for cls in _bound_classes:
+        cls._codec_bindings.clear()
+    _bound_classes.clear()
+
+
+def get_codec(encoding: Hashable) -> CodecRegistration:
+    """
+    Return the registration of an encoding.
+
+    Raises:
+        Asn1Exception: If no codec is registered for the encoding
+    """
+    registration = _registry.get(encoding)
+    if registration is None:
+        raise Asn1Exception(f"Invalid encoding type {encoding}")
+    return registration
+
+
+def bind_codec(cls: type, encoding: Hashable) -> Tuple[Callable, Callable, Callable, Callable]:
+    """
+    Resolve the codec of an encoding for one generated type, caching the result
+    in the _codec_bindings dict of the class.
+
+    Returns:
+        (new_encoder, encode, new_decoder, decode): new_encoder() creates an
+        encoder sized for cls, encode(value, encoder, check_constraints) and
+        decode(decoder, check_constraints) are the generated methods.
+    """
+    binding = cls._codec_bindings.get(encoding)
+    if binding is None:
+        registration = get_codec(encoding)
+        size = 0
+        if registration.size_constant is not None:
+            size = getattr(cls.EncodeConstants, registration.size_constant)
+        binding = cls._codec_bindings[encoding] = (
+            partial(registration.encoder_class.of_size, size),
+            getattr(cls, registration.encode_method),
+            registration.decoder_class.from_buffer,
+            getattr(cls, registration.decode_method),
+        )
+        _bound_classes.add(cls)
+    return binding
+
+
+register_codec(Encoding.uPER, CodecRegistration(
+    UPEREncoder, UPERDecoder, "encode_uper", "decode_uper", "REQUIRED_BYTES_FOR_ENCODING"))
+register_codec(Encoding.ACN, CodecRegistration(
+    ACNEncoder, ACNDecoder, "encode_acn", "decode_acn", "REQUIRED_BYTES_FOR_ACN_ENCODING"))
+try:
+    from .xer_encoder import XEREncoder
+    from .xer_decoder import XERDecoder
+    register_codec(Encoding.XER, CodecRegistration(XEREncoder, XERDecoder, "encode_xer", "decode_xer"))
+except ImportError:
+    pass
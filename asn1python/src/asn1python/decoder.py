@@ -1,7 +1,10 @@
-from typing import List, Optional, TypeVar
+from array import array
+from typing import List, Optional, TypeVar, Union
 
 from .codec import Codec, DecodeResult, ERROR_INSUFFICIENT_DATA, DECODE_OK, BitStreamError, ERROR_INVALID_VALUE, ERROR_CONSTRAINT_VIOLATION
 from .bitstream import BitStream
+from .char_index_codec import IA5_CHAR_SET, get_char_index_codec
+from .int_array_codec import bits_per_item_for, unpack_whole_numbers
 
 DecType = TypeVar("DecType")
 
@@ -336,11 +339,8 @@ class Decoder(Codec):
                     error_message=f"Insufficient data for bit string: need {length} bits"
                 )
 
-            bit_string = ""
-            for _ in range(length):
-                bit = self._bitstream.read_bit()
-                bit_string += '1' if bit else '0'
-                bits_consumed += 1
+            bit_string = format(self._bitstream.read_bits_wide(length), f'0{length}b') if length else ""
+            bits_consumed += length
 
             return DecodeResult(
                 success=True,
@@ -413,18 +413,11 @@ class Decoder(Codec):
                     error_message=f"Insufficient data: need {num_bytes * 8} bits, have {self._bitstream.remaining_bits}"
                 )
 
-            result = bytearray()
-            bits_consumed = 0
-            for _ in range(num_bytes):
-                byte_val = self._bitstream.read_bits(8)
-                result.append(byte_val)
-                bits_consumed += 8
-
             return DecodeResult(
                 success=True,
                 error_code=DECODE_OK,
-                decoded_value=result,
-                bits_consumed=bits_consumed
+                decoded_value=bytearray(self._bitstream.read_bytes(num_bytes)),
+                bits_consumed=num_bytes * 8
             )
         except BitStreamError as e:
             return DecodeResult(
@@ -439,7 +432,7 @@ class Decoder(Codec):
 
         Matches Scala: BitStream.readBits(nBits: Long): Array[UByte]
         Matches C: BitStream_ReadBits(pBitStrm, BuffToWrite, nbits)
-        Used by: ACN for bit patterns and partial byte reads
+        Used by: UPER, ACN for BIT STRING values and bit patterns
 
         Args:
             num_bits: Number of bits to read
@@ -471,31 +464,15 @@ class Decoder(Codec):
                     error_message=f"Insufficient data: need {num_bits} bits, have {self._bitstream.remaining_bits}"
                 )
 
-            # Calculate required buffer size
+            # Read all bits as one field and align it to the MSB of the first byte
             num_bytes = (num_bits + 7) // 8
-            result = bytearray(num_bytes)
-            bits_consumed = 0
-
-            # Read complete bytes
-            complete_bytes = num_bits // 8
-            for i in range(complete_bytes):
-                result[i] = self._bitstream.read_bits(8)
-                bits_consumed += 8
-
-            # Read remaining bits into partial byte
-            remaining_bits = num_bits % 8
-            if remaining_bits > 0:
-                # Read the remaining bits
-                partial_byte = self._bitstream.read_bits(remaining_bits)
-                # Shift to align to MSB (high-order bits)
-                result[complete_bytes] = partial_byte << (8 - remaining_bits)
-                bits_consumed += remaining_bits
+            value = self._bitstream.read_bits_wide(num_bits) << (num_bytes * 8 - num_bits)
 
             return DecodeResult(
                 success=True,
                 error_code=DECODE_OK,
-                decoded_value=result,
-                bits_consumed=bits_consumed
+                decoded_value=bytearray(value.to_bytes(num_bytes, 'big')),
+                bits_consumed=num_bits
             )
         except BitStreamError as e:
             return DecodeResult(
@@ -541,23 +518,12 @@ class Decoder(Codec):
                     error_message=f"Insufficient data: need {num_bytes * 8} bits, have {self._bitstream.remaining_bits}"
                 )
 
-            # Check if we're byte-aligned
-            if self._bitstream.current_bit_position == 0:
-                # Optimized path: byte-aligned, can read directly
-                result = bytearray()
-                for _ in range(num_bytes):
-                    byte_val = self._bitstream.read_bits(8)
-                    result.append(byte_val)
-
-                return DecodeResult(
-                    success=True,
-                    error_code=DECODE_OK,
-                    decoded_value=bytearray(result),
-                    bits_consumed=num_bytes * 8
-                )
-            else:
-                # Not byte-aligned, use read_byte_array which handles bit offset
-                return self.read_byte_array(num_bytes)
+            return DecodeResult(
+                success=True,
+                error_code=DECODE_OK,
+                decoded_value=bytearray(self._bitstream.read_bytes(num_bytes)),
+                bits_consumed=num_bytes * 8
+            )
 
         except BitStreamError as e:
             return DecodeResult(
@@ -566,6 +532,40 @@ class Decoder(Codec):
                 error_message=str(e)
             )
 
+    def decode_octet_string_no_length_view(self, num_bytes: int) -> DecodeResult[Union[memoryview, bytes]]:
+        """
+        Decode octet string without length prefix, without copying when byte-aligned.
+
+        Used by: UPER, ACN for OCTET STRING values
+
+        Args:
+            num_bytes: Number of bytes to decode
+
+        Returns:
+            DecodeResult containing a read-only memoryview of the decoder's
+            buffer when byte-aligned, bytes otherwise
+        """
+        if num_bytes < 0:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"num_bytes must be non-negative, got {num_bytes}"
+            )
+
+        if self._bitstream.remaining_bits < num_bytes * 8:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INSUFFICIENT_DATA,
+                error_message=f"Insufficient data: need {num_bytes * 8} bits, have {self._bitstream.remaining_bits}"
+            )
+
+        return DecodeResult(
+            success=True,
+            error_code=DECODE_OK,
+            decoded_value=self._bitstream.read_bytes_view(num_bytes),
+            bits_consumed=num_bytes * 8
+        )
+
     def decode_octet_string_no_length_vec(self, num_bytes: int) -> DecodeResult[list[int]]:
         """
         Decode octet string without length prefix, returning as list.
@@ -595,6 +595,51 @@ class Decoder(Codec):
                 error_message=result.error_message
             )
 
+    def decode_string_char_index(self, num_chars: int, allowed_char_set: bytes = IA5_CHAR_SET) -> DecodeResult[str]:
+        """
+        Decode num_chars characters packed as one bit field of character indices.
+
+        Inverse of Encoder.encode_string_char_index.
+        Used by: UPER for IA5String, NumericString and VisibleString values
+
+        Args:
+            num_chars: Number of characters to decode
+            allowed_char_set: Permitted alphabet, in index order
+
+        Returns:
+            DecodeResult containing the decoded string
+        """
+        if num_chars < 0:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"num_chars must be non-negative, got {num_chars}"
+            )
+
+        char_codec = get_char_index_codec(allowed_char_set)
+        bits_consumed = num_chars * char_codec.bits_per_char
+        if self._bitstream.remaining_bits < bits_consumed:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INSUFFICIENT_DATA,
+                error_message=f"Insufficient data: need {bits_consumed} bits, have {self._bitstream.remaining_bits}"
+            )
+
+        try:
+            chars = char_codec.unpack(self._bitstream.read_bits_wide(bits_consumed), num_chars)
+            return DecodeResult(
+                success=True,
+                error_code=DECODE_OK,
+                decoded_value=chars.decode('ascii'),
+                bits_consumed=bits_consumed
+            )
+        except (BitStreamError, ValueError) as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     def check_bit_pattern_present(self, pattern: bytearray, num_bits: int) -> DecodeResult[int]:
         """
         Check if a bit pattern is present at the current position.
@@ -845,6 +890,59 @@ class Decoder(Codec):
         """
         return self.decode_integer(min_val=min_val, max_val=max_val)
 
+    def decode_constrained_whole_number_array(self, count: int, min_val: int, max_val: int, typecode: str = "q") -> DecodeResult[array]:
+        """
+        Decode count constrained whole numbers packed as one bit field.
+
+        Inverse of Encoder.encode_constrained_whole_number_array.
+        Used by: UPER for SEQUENCE OF constrained INTEGER
+
+        Args:
+            count: Number of items to decode
+            min_val: Minimum allowed value of an item
+            max_val: Maximum allowed value of an item
+            typecode: array.array typecode of the result, wide enough for min_val..max_val
+
+        Returns:
+            DecodeResult containing an array.array of the decoded items
+        """
+        if count < 0:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"count must be non-negative, got {count}"
+            )
+
+        width = bits_per_item_for(min_val, max_val)
+        bits_consumed = count * width
+        if self._bitstream.remaining_bits < bits_consumed:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INSUFFICIENT_DATA,
+                error_message=f"Insufficient data: need {bits_consumed} bits, have {self._bitstream.remaining_bits}"
+            )
+
+        try:
+            values = unpack_whole_numbers(self._bitstream.read_bits_wide(bits_consumed), count, min_val, max_val, typecode)
+            return DecodeResult(
+                success=True,
+                error_code=DECODE_OK,
+                decoded_value=values,
+                bits_consumed=bits_consumed
+            )
+        except ValueError as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_CONSTRAINT_VIOLATION,
+                error_message=str(e)
+            )
+        except (BitStreamError, OverflowError) as e:
+            return DecodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     def decode_semi_constrained_whole_number(self, min_val: int) -> DecodeResult[int]:
         """
         Decode semi-constrained whole number (signed, only lower bound).
@@ -1,7 +1,9 @@
 from abc import abstractmethod, ABC
-from typing import Optional, List, Self, Union
+from typing import Optional, List, Self, Sequence, Union
 
 from .bitstream import BitStream
+from .char_index_codec import IA5_CHAR_SET, get_char_index_codec
+from .int_array_codec import bits_per_item_for, pack_whole_numbers
 from .codec import Codec, EncodeResult, ENCODE_OK, BitStreamError, ERROR_INVALID_VALUE, \
     ERROR_CONSTRAINT_VIOLATION
 
@@ -248,7 +250,7 @@ class Encoder(Codec, ABC):
         """Encode a bit string value"""
         try:
             # Validate bit string format
-            if not all(c in '01' for c in value):
+            if value.strip('01'):
                 return EncodeResult(
                     success=False,
                     error_code=ERROR_INVALID_VALUE,
@@ -279,9 +281,9 @@ class Encoder(Codec, ABC):
                 bits_encoded += length_bits
 
             # Encode bit string data
-            for bit_char in value:
-                self._bitstream.write_bit(bit_char == '1')
-                bits_encoded += 1
+            if value:
+                self._bitstream.write_bits_wide(int(value, 2), len(value))
+                bits_encoded += len(value)
 
             return EncodeResult(
                 success=True,
@@ -367,15 +369,15 @@ class Encoder(Codec, ABC):
                 error_message=str(e)
             )
 
-    def append_bits(self, data: bytearray, num_bits: int) -> EncodeResult:
+    def append_bits(self, data: Union[bytes, bytearray, memoryview, list], num_bits: int) -> EncodeResult:
         """
         Append arbitrary bits from a buffer to the bitstream.
 
         Matches Scala: BitStream.appendBits(arr: Array[Byte], nBits: Int)
-        Used by: ACN for bit patterns and partial byte writes
+        Used by: UPER, ACN for BIT STRING values and bit patterns
 
         Args:
-            data: Buffer containing bits to write
+            data: Buffer (or list of byte values) containing the bits to write, MSB-first
             num_bits: Number of bits to write from the buffer
         """
         try:
@@ -402,46 +404,32 @@ class Encoder(Codec, ABC):
                     error_message=f"num_bits {num_bits} requires {num_bytes} bytes but data has {len(data)} bytes"
                 )
 
-            bits_encoded = 0
-
-            # Write complete bytes
-            complete_bytes = num_bits // 8
-            for i in range(complete_bytes):
-                self._bitstream.write_bits(data[i], 8)
-                bits_encoded += 8
-
-            # Write remaining bits from partial byte
-            remaining_bits = num_bits % 8
-            if remaining_bits > 0:
-                # Extract the high-order bits from the next byte
-                byte_val = data[complete_bytes]
-                # Shift to get only the desired high-order bits
-                shifted_val = byte_val >> (8 - remaining_bits)
-                self._bitstream.write_bits(shifted_val, remaining_bits)
-                bits_encoded += remaining_bits
+            # Blit all bits as one field: the high-order num_bits bits of the used bytes
+            value = int.from_bytes(bytes(data[:num_bytes]), 'big') >> (num_bytes * 8 - num_bits)
+            self._bitstream.write_bits_wide(value, num_bits)
 
             return EncodeResult(
                 success=True,
                 error_code=ENCODE_OK,
-                bits_encoded=bits_encoded
+                bits_encoded=num_bits
             )
-        except BitStreamError as e:
+        except (BitStreamError, ValueError, TypeError) as e:
             return EncodeResult(
                 success=False,
                 error_code=ERROR_INVALID_VALUE,
                 error_message=str(e)
             )
 
-    def encode_octet_string_no_length(self, data: bytearray, num_bytes: int) -> EncodeResult:
+    def encode_octet_string_no_length(self, data: Union[bytes, bytearray, memoryview, list], num_bytes: int) -> EncodeResult:
         """
         Encode octet string without length prefix.
 
         Matches C: BitStream_EncodeOctetString_no_length(pBitStrm, arr, nCount)
         Matches Scala: BitStream.appendByteArray without length encoding
-        Used by: ACN for fixed-size or externally-determined length octet strings
+        Used by: UPER, ACN for OCTET STRING values and CONTAINING payloads
 
         Args:
-            data: bytearray to encode
+            data: bytes-like object (or list of byte values) to encode
             num_bytes: Number of bytes to encode from data
 
         Returns:
@@ -462,22 +450,16 @@ class Encoder(Codec, ABC):
                     error_message=f"num_bytes {num_bytes} exceeds data length {len(data)}"
                 )
 
-            # Check if we're byte-aligned
-            if self._bitstream.current_bit_position == 0:
-                # Optimized path: byte-aligned, can write directly
-                for i in range(num_bytes):
-                    self._bitstream.write_bits(data[i], 8)
-            else:
-                # Not byte-aligned, use append_byte_array which handles bit offset
-                result = self.append_byte_array(data, num_bytes)
-                return result
+            chunk = data if num_bytes == len(data) else data[:num_bytes]
+            # One bulk write; lists of ints are accepted for list-style callers
+            self._bitstream.write_bytes(bytes(chunk) if isinstance(chunk, list) else chunk)
 
             return EncodeResult(
                 success=True,
                 error_code=ENCODE_OK,
                 bits_encoded=num_bytes * 8
             )
-        except BitStreamError as e:
+        except (BitStreamError, ValueError, TypeError) as e:
             return EncodeResult(
                 success=False,
                 error_code=ERROR_INVALID_VALUE,
@@ -516,6 +498,46 @@ class Encoder(Codec, ABC):
                 error_message=f"Invalid data for octet string: {e}"
             )
 
+    def encode_string_char_index(self, value: str, num_chars: int, allowed_char_set: bytes = IA5_CHAR_SET) -> EncodeResult:
+        """
+        Encode the first num_chars characters of a string as one packed bit field.
+
+        Every character is written as its index in allowed_char_set, first
+        character in the most significant bits. With the default IA5 set the
+        index of a character is its 7-bit code.
+        Used by: UPER for IA5String, NumericString and VisibleString values
+
+        Args:
+            value: String to encode
+            num_chars: Number of characters to encode from value
+            allowed_char_set: Permitted alphabet, in index order
+
+        Returns:
+            EncodeResult with success/failure status
+        """
+        if num_chars > len(value):
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"num_chars {num_chars} exceeds string length {len(value)}"
+            )
+
+        try:
+            char_codec = get_char_index_codec(allowed_char_set)
+            bits_encoded = num_chars * char_codec.bits_per_char
+            self._bitstream.write_bits_wide(char_codec.pack(value[:num_chars].encode('ascii')), bits_encoded)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=bits_encoded
+            )
+        except (BitStreamError, ValueError) as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     def encode_unsigned_integer(self, value: int, num_bits: int) -> EncodeResult:
         """
         Encode unsigned integer with specified number of bits.
@@ -584,6 +606,57 @@ class Encoder(Codec, ABC):
         """
         return self.encode_integer(value, min_val=min_val, max_val=max_val)
 
+    def encode_constrained_whole_number_array(self, values: Sequence[int], count: int, min_val: int, max_val: int) -> EncodeResult:
+        """
+        Encode the first count items of an array of constrained whole numbers as one packed bit field.
+
+        Produces the same bits as count calls of encode_constrained_whole_number.
+        Used by: UPER for SEQUENCE OF constrained INTEGER
+
+        Args:
+            values: Items to encode: a list, an array.array or a NumPy array
+            count: Number of items to encode
+            min_val: Minimum allowed value of an item
+            max_val: Maximum allowed value of an item
+        """
+        if count > len(values):
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=f"count {count} exceeds array length {len(values)}"
+            )
+
+        items = values if len(values) == count else values[:count]
+        if count > 0:
+            if min(items) < min_val:
+                return EncodeResult(
+                    success=False,
+                    error_code=ERROR_CONSTRAINT_VIOLATION,
+                    error_message=f"Value {min(items)} below minimum {min_val}"
+                )
+            if max(items) > max_val:
+                return EncodeResult(
+                    success=False,
+                    error_code=ERROR_CONSTRAINT_VIOLATION,
+                    error_message=f"Value {max(items)} above maximum {max_val}"
+                )
+
+        try:
+            width = bits_per_item_for(min_val, max_val)
+            bits_encoded = count * width
+            self._bitstream.write_bits_wide(pack_whole_numbers(items, min_val, width), bits_encoded)
+            return EncodeResult(
+                success=True,
+                error_code=ENCODE_OK,
+                bits_encoded=bits_encoded
+            )
+        except (BitStreamError, OverflowError, TypeError) as e:
+            return EncodeResult(
+                success=False,
+                error_code=ERROR_INVALID_VALUE,
+                error_message=str(e)
+            )
+
     def encode_semi_constrained_whole_number(self, value: int, min_val: int) -> EncodeResult:
         """
         Encode semi-constrained whole number (signed, only lower bound).
@@ -2,4 +2,32 @@
 ASN.1 Python Runtime Library - Helper Functions
 
 This module provides utility functions for ASN.1 operations.
-"""
\ No newline at end of file
+"""
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar('T')
+
+_dispatch_tables: Dict[Tuple[type, str], Any] = {}
+
+
+def dispatch_table(owner: type, key: str, build: Callable[[], T]) -> T:
+    """
+    Return the lookup table registered for (owner, key), building it on first use.
+
+    Generated code maps ACN encoding values to enumeration members (and back),
+    and ACN CHOICE determinant values to the decode functions of the
+    alternatives, through these tables instead of if/elif chains, so the
+    lookup cost does not grow with the number of items.
+
+    Args:
+        owner: Generated class the table belongs to
+        key: Name of the table, unique within the owner
+        build: Called once to create the table
+
+    Returns:
+        The cached table
+    """
+    table = _dispatch_tables.get((owner, key))
+    if table is None:
+        table = _dispatch_tables[(owner, key)] = build()
+    return table
@@ -0,0 +1,79 @@
+"""
+ASN.1 Python Runtime Library - Whole Number Arrays
+
+This module packs the items of a SEQUENCE OF constrained INTEGER into one
+big-integer bit field and back, so the uPER codec writes and reads the whole
+array with a single bitstream call. Items are stored as offsets from the
+lower bound, each in the same number of bits, first item in the most
+significant position: exactly the layout of encoding them one by one.
+"""
+
+import sys
+from array import array
+from typing import Sequence
+
+from .asn1_constants import NO_OF_BITS_IN_BYTE
+
+
+# Unsigned array typecode of every byte-sized item width ('L' is 4 or 8 bytes
+# depending on the platform, so the fixed-size codes after it take precedence)
+_UNSIGNED_TYPECODES = {}
+for _typecode in "LQIHB":
+    _UNSIGNED_TYPECODES[array(_typecode).itemsize * NO_OF_BITS_IN_BYTE] = _typecode
+del _typecode
+
+_SWAP_TO_BIG_ENDIAN = sys.byteorder == "little"
+
+
+def bits_per_item_for(min_val: int, max_val: int) -> int:
+    """Return the number of bits of one item of the range min_val..max_val (0 for a single value)."""
+    return (max_val - min_val).bit_length()
+
+
+def pack_whole_numbers(values: Sequence[int], min_val: int, width: int) -> int:
+    """Pack the offsets of values from min_val into one integer of len(values) * width bits.
+
+    The values must already be within range: offsets are not masked.
+    """
+    if width == 0 or len(values) == 0:
+        return 0
+
+    typecode = _UNSIGNED_TYPECODES.get(width)
+    if typecode is not None:
+        items = array(typecode, values if min_val == 0 else [v - min_val for v in values])
+        if _SWAP_TO_BIG_ENDIAN:
+            items.byteswap()
+        return int.from_bytes(items.tobytes(), "big")
+
+    pattern = f"0{width}b"
+    return int("".join([format(v - min_val, pattern) for v in values]), 2)
+
+
+def unpack_whole_numbers(value: int, count: int, min_val: int, max_val: int, typecode: str) -> array:
+    """Split a packed integer of count items back into an array of the given typecode.
+
+    Raises:
+        ValueError: If an item is above max_val
+    """
+    width = bits_per_item_for(min_val, max_val)
+    if count == 0 or width == 0:
+        return array(typecode, [min_val]) * count
+
+    unsigned_typecode = _UNSIGNED_TYPECODES.get(width)
+    if unsigned_typecode is not None:
+        offsets = array(unsigned_typecode)
+        offsets.frombytes(value.to_bytes(count * width // NO_OF_BITS_IN_BYTE, "big"))
+        if _SWAP_TO_BIG_ENDIAN:
+            offsets.byteswap()
+    else:
+        digits = format(value, f"0{count * width}b")
+        offsets = [int(digits[i:i + width], 2) for i in range(0, count * width, width)]
+
+    if max(offsets) > max_val - min_val:
+        raise ValueError(f"Decoded value {max(offsets) + min_val} above maximum {max_val}")
+
+    if min_val == 0:
+        if isinstance(offsets, array) and offsets.typecode == typecode:
+            return offsets
+        return array(typecode, offsets)
+    return array(typecode, [v + min_val for v in offsets])
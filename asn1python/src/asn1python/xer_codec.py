@@ -5,9 +5,14 @@ This module provides shared XER functionality including indentation and XML esca
 """
 
 XER_INDENT_UNIT = "    "  # 4 spaces per nesting level
+XER_PDU_STREAM_TAG = "PDUs"  # default wrapper element of a multi-PDU document
 
 
 def xml_escape(text: str) -> str:
     """Escape special XML characters in text."""
     return (text.replace("&", "&amp;").replace("<", "&lt;")
                 .replace(">", "&gt;"))
+
+
+# Translate table for the same escapes, built once for the compact encoder
+XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
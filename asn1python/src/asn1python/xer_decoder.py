@@ -2,13 +2,27 @@
 ASN.1 XER (XML Encoding Rules) decoder.
 
 This module provides the XERDecoder for decoding ASN.1 values from XML,
-using xml.etree.ElementTree.iterparse for bounded-memory streaming decoding.
+using xml.etree.ElementTree.XMLPullParser for bounded-memory incremental
+decoding, the ExpatXERDecoder which drives xml.parsers.expat directly
+without building elements, and the XERPushDecoder which is fed chunks by
+the caller and never waits for input.
 """
 
-from io import BytesIO
-from typing import Optional, Tuple
+import os
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 import xml.etree.ElementTree as ET
+from xml.parsers import expat
 from .asn1_exceptions import Asn1InvalidValueException
+from .xer_codec import XER_PDU_STREAM_TAG
+
+if TYPE_CHECKING:
+    from .asn1_types import Asn1Base
+
+XER_DECODE_CHUNK_SIZE = 64 * 1024  # bytes fed to the XML parser at a time
+
+XER_NEED_MORE_DATA: Tuple = ()  # returned by XERPushDecoder when no PDU is complete yet
 
 
 def _local(tag: str) -> str:
@@ -16,33 +30,136 @@ def _local(tag: str) -> str:
     return tag.rsplit("}", 1)[-1]
 
 
+def _buffer_chunks(buffer, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Yield zero-copy slices of a bytes-like object (bytes, bytearray, mmap).
+
+    No view is kept between two slices and the decoder releases each slice
+    once it is parsed, so an mmap can be closed while its decoder is alive.
+    """
+    for start in range(0, len(buffer), chunk_size):
+        yield memoryview(buffer)[start:start + chunk_size]
+
+
+def _release_chunk(chunk) -> None:
+    """Release a parsed memoryview slice, so that the buffer it views is no longer exported."""
+    if type(chunk) is memoryview:
+        chunk.release()
+
+
+def _file_chunks(file: BinaryIO, chunk_size: int, close: bool) -> Iterator[bytes]:
+    """Yield the content of a binary file chunk by chunk."""
+    try:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        if close:
+            file.close()
+
+
 class XERDecoder:
     """
-    XER decoder that streams XML events via iterparse.
+    XER decoder that pulls XML events from an XMLPullParser.
 
     Maintains a one-event lookahead so callers can ask "is the next start
     element <tag>?" without consuming it. Calls elem.clear() on end events
     to keep memory bounded.
+
+    The input is fed to the parser one chunk at a time, only when the
+    lookahead runs dry, so the document never has to be in memory as a
+    whole. When the chunks come from a socket or a generator, decoding
+    simply waits for the next chunk.
     """
 
-    def __init__(self, buffer: bytearray) -> None:
-        self._iter = ET.iterparse(BytesIO(bytes(buffer)), events=("start", "end"))
+    def __init__(self, buffer, chunk_size: int = XER_DECODE_CHUNK_SIZE) -> None:
+        self._init_chunks(_buffer_chunks(buffer, chunk_size))
+
+    def _init_chunks(self, chunks: Iterator) -> None:
+        self._chunks = chunks
+        self._parser: Optional[ET.XMLPullParser] = ET.XMLPullParser(events=("start", "end"))
+        self._events: Iterator[Tuple[str, ET.Element]] = iter(())
         self._lookahead: Optional[Tuple[str, ET.Element]] = None
-        self._advance()
+        self._consumed = True
+
+    @classmethod
+    def _from_chunk_iterator(cls, chunks: Iterator) -> "XERDecoder":
+        decoder = cls.__new__(cls)
+        decoder._init_chunks(chunks)
+        return decoder
+
+    @classmethod
+    def _from_events(cls, events: Iterable[Tuple[str, ET.Element]]) -> "XERDecoder":
+        decoder = cls._from_chunk_iterator(iter(()))
+        decoder._events = iter(events)
+        decoder._parser = None
+        return decoder
 
     @classmethod
     def from_buffer(cls, buffer: bytearray) -> "XERDecoder":
         """
         Create a decoder from a bytearray of XML-encoded data.
 
+        The buffer is not copied; it must not change while decoding.
+
         Args:
-            buffer: UTF-8 encoded XML bytes.
+            buffer: UTF-8 encoded XML bytes (bytes, bytearray, memoryview or mmap).
 
         Returns:
             A new XERDecoder instance.
         """
         return cls(buffer)
 
+    @classmethod
+    def from_mmap(cls, mapped, chunk_size: int = XER_DECODE_CHUNK_SIZE) -> "XERDecoder":
+        """
+        Create a decoder over a memory-mapped XML document.
+
+        Args:
+            mapped: An mmap.mmap (or any other bytes-like object).
+            chunk_size: Number of bytes fed to the parser at a time.
+
+        Returns:
+            A new XERDecoder instance.
+        """
+        return cls(mapped, chunk_size)
+
+    @classmethod
+    def from_file(cls, file: Union[str, os.PathLike, BinaryIO], chunk_size: int = XER_DECODE_CHUNK_SIZE) -> "XERDecoder":
+        """
+        Create a decoder that reads an XML document from a path or an open binary file.
+
+        A file opened from a path is closed once its end is reached.
+
+        Args:
+            file: Path of the document, or a file object opened in binary mode.
+            chunk_size: Number of bytes read per call.
+
+        Returns:
+            A new XERDecoder instance.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            return cls._from_chunk_iterator(_file_chunks(open(file, "rb"), chunk_size, close=True))
+        return cls._from_chunk_iterator(_file_chunks(file, chunk_size, close=False))
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[bytes]) -> "XERDecoder":
+        """
+        Create a decoder fed by an iterable of byte chunks (e.g. data received from a socket).
+
+        Chunks are pulled only when the decoder needs more events, so a chunk
+        generator that blocks on a socket suspends decoding until data arrives.
+
+        Args:
+            chunks: Iterable of bytes-like chunks of one XML document.
+
+        Returns:
+            A new XERDecoder instance.
+        """
+        return cls._from_chunk_iterator(iter(chunks))
+
     @classmethod
     def from_codec(cls, codec) -> "XERDecoder":
         """
@@ -57,12 +174,59 @@ class XERDecoder:
         return cls(codec.get_bitstream_buffer())
 
     def _advance(self) -> None:
-        """Pull the next event from the iterator into the lookahead slot."""
+        """
+        Consume the lookahead event.
+
+        The next event is only read when it is first looked at, so consuming
+        the end of a value never waits for input that follows it.
+        """
+        self._consumed = True
+
+    def _peek(self):
+        """Return the lookahead event, reading it first if the previous one was consumed."""
+        if self._consumed:
+            self._consumed = False
+            self._read_event()
+        return self._lookahead
+
+    def _read_event(self) -> None:
+        """Pull the next event into the lookahead slot, feeding the parser as needed."""
         try:
-            ev, el = next(self._iter)
-            self._lookahead = (ev, el)
-        except StopIteration:
-            self._lookahead = None
+            while True:
+                event = next(self._events, None)
+                if event is not None:
+                    self._lookahead = event
+                    return
+                if self._parser is None:
+                    self._lookahead = None
+                    return
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self._parser.close()
+                    self._events = self._parser.read_events()
+                    self._release_input()
+                else:
+                    try:
+                        self._parser.feed(chunk)
+                    finally:
+                        _release_chunk(chunk)
+                    self._events = self._parser.read_events()
+        except BaseException:
+            self._release_input()
+            raise
+
+    def _release_input(self) -> None:
+        """
+        Drop the parser and the chunk source once the document has ended or failed to parse.
+
+        This breaks the reference cycle between an ExpatXERDecoder and its
+        parser callbacks and closes a file opened by from_file().
+        """
+        chunks, self._chunks = self._chunks, iter(())
+        self._parser = None
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
 
     def peek_start_tag(self) -> Optional[str]:
         """
@@ -70,8 +234,9 @@ class XERDecoder:
 
         Does not consume the event.
         """
-        if self._lookahead and self._lookahead[0] == "start":
-            return _local(self._lookahead[1].tag)
+        lookahead = self._peek()
+        if lookahead and lookahead[0] == "start":
+            return _local(lookahead[1].tag)
         return None
 
     def next_start_element_is(self, tag: str) -> bool:
@@ -88,10 +253,11 @@ class XERDecoder:
 
         Used for SEQUENCE OF loop termination.
         """
+        lookahead = self._peek()
         return (
-            self._lookahead is not None
-            and self._lookahead[0] == "end"
-            and _local(self._lookahead[1].tag) == tag
+            lookahead is not None
+            and lookahead[0] == "end"
+            and _local(lookahead[1].tag) == tag
         )
 
     def expect_start(self, tag: str) -> ET.Element:
@@ -112,7 +278,7 @@ class XERDecoder:
                 f"XER decode: expected <{tag}>, got {self.peek_start_tag()}",
                 field_name=tag,
             )
-        el = self._lookahead[1]
+        el = self._lookahead[1]  # already read by next_start_element_is()
         self._advance()
         return el
 
@@ -131,7 +297,7 @@ class XERDecoder:
         """
         depth = 0
         while True:
-            if self._lookahead is None:
+            if self._peek() is None:
                 raise Asn1InvalidValueException(
                     f"XER decode: missing </{tag}>", field_name=tag
                 )
@@ -170,7 +336,7 @@ class XERDecoder:
         # Outer start is already consumed; track depth for any nested same-named elements.
         depth = 0
         while True:
-            if self._lookahead is None:
+            if self._peek() is None:
                 raise Asn1InvalidValueException(
                     f"XER decode: missing </{tag}>", field_name=tag
                 )
@@ -241,3 +407,255 @@ class XERDecoder:
 
     def complex_end(self, tag: str) -> None:
         self.expect_end(tag)
+
+    def iter_pdus(self, pdu_type: "type[Asn1Base]", wrapper_tag: str = XER_PDU_STREAM_TAG,
+                  check_constraints: bool = True, xml_tag: Optional[str] = None) -> Iterator["Asn1Base"]:
+        """
+        Decode the PDUs of a multi-PDU document, as written by XERPduStreamWriter.
+
+        Each PDU is yielded as soon as its closing tag has been read, and its
+        elements are released, so memory use does not grow with the number
+        of PDUs.
+
+        Args:
+            pdu_type: Generated ASN.1 type with a decode_xer() classmethod.
+            wrapper_tag: Local name of the element holding the PDUs.
+            check_constraints: Validate every decoded PDU.
+            xml_tag: Element name of the PDUs; defaults to the type assignment name.
+
+        Yields:
+            The decoded PDUs, in document order.
+
+        Raises:
+            Asn1InvalidValueException: If the wrapper or a PDU element is malformed.
+        """
+        wrapper = self.expect_start(wrapper_tag)
+        while not self.at_end_element(wrapper_tag):
+            pdu = pdu_type.decode_xer(self, check_constraints, xml_tag)
+            self._release_children(wrapper)
+            yield pdu
+        self.expect_end(wrapper_tag)
+
+    def _release_children(self, element: ET.Element) -> None:
+        # Cleared PDU elements would otherwise stay attached to the wrapper
+        del element[:]
+
+
+class ExpatXERDecoder(XERDecoder):
+    """
+    XER decoder built directly on xml.parsers.expat.
+
+    The expat callbacks append (event, local name, text) tokens to a queue;
+    no ElementTree elements are created, and the local name of each distinct
+    tag is computed once and interned. The interface is the one of XERDecoder,
+    except that expect_start() and complex_start() return the local tag name.
+    """
+
+    def _init_chunks(self, chunks: Iterator) -> None:
+        self._chunks = chunks
+        self._tokens: Deque[Tuple[str, str, Optional[str]]] = deque()
+        self._text_stack: List[Union[List[str], str]] = []
+        self._local_names: Dict[str, str] = {}
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = self._on_start
+        parser.EndElementHandler = self._on_end
+        parser.CharacterDataHandler = self._on_text
+        self._parser = parser
+        self._lookahead: Optional[Tuple[str, str, Optional[str]]] = None
+        self._consumed = True
+
+    def _local_name(self, name: str) -> str:
+        local = self._local_names.get(name)
+        if local is None:
+            local = self._local_names[name] = sys.intern(_local(name))
+        return local
+
+    def _on_start(self, name: str, attributes: dict) -> None:
+        stack = self._text_stack
+        # Like Element.text, only the text before the first child is kept
+        if stack and type(stack[-1]) is list:
+            stack[-1] = "".join(stack[-1])
+        stack.append([])
+        self._tokens.append(("start", self._local_name(name), None))
+
+    def _on_end(self, name: str) -> None:
+        text = self._text_stack.pop()
+        if type(text) is list:
+            text = "".join(text)
+        self._tokens.append(("end", self._local_name(name), text))
+
+    def _on_text(self, data: str) -> None:
+        if self._text_stack:
+            top = self._text_stack[-1]
+            if type(top) is list:
+                top.append(data)
+
+    def _read_event(self) -> None:
+        """Pop the next token into the lookahead slot, feeding the parser as needed."""
+        tokens = self._tokens
+        try:
+            while not tokens:
+                if self._parser is None:
+                    self._lookahead = None
+                    return
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self._parser.Parse(b"", True)
+                    self._release_input()
+                else:
+                    try:
+                        self._parser.Parse(chunk, False)
+                    finally:
+                        _release_chunk(chunk)
+        except BaseException:
+            self._release_input()
+            raise
+        self._lookahead = tokens.popleft()
+
+    def peek_start_tag(self) -> Optional[str]:
+        lookahead = self._peek()
+        if lookahead is not None and lookahead[0] == "start":
+            return lookahead[1]
+        return None
+
+    def at_end_element(self, tag: str) -> bool:
+        lookahead = self._peek()
+        return lookahead is not None and lookahead[0] == "end" and lookahead[1] == tag
+
+    def expect_start(self, tag: str) -> str:
+        if self.peek_start_tag() != tag:
+            raise Asn1InvalidValueException(
+                f"XER decode: expected <{tag}>, got {self.peek_start_tag()}",
+                field_name=tag,
+            )
+        self._advance()
+        return tag
+
+    def _skip_to_end(self, tag: str) -> Optional[str]:
+        """Consume tokens up to and including the end of the current <tag>; return its text."""
+        depth = 0
+        while True:
+            if self._peek() is None:
+                raise Asn1InvalidValueException(
+                    f"XER decode: missing </{tag}>", field_name=tag
+                )
+            ev, local, text = self._lookahead
+            self._advance()
+            if local == tag:
+                if ev == "start":
+                    depth += 1
+                elif depth == 0:
+                    return text
+                else:
+                    depth -= 1
+
+    def expect_end(self, tag: str) -> None:
+        self._skip_to_end(tag)
+
+    def read_text_element(self, tag: str) -> str:
+        self.expect_start(tag)
+        return self._skip_to_end(tag) or ""
+
+    def _release_children(self, element: str) -> None:
+        pass  # no element tree is built
+
+
+class XERPushDecoder:
+    """
+    Push-style XER decoder: the caller feeds chunks as they arrive and gets back
+    the PDUs they complete, without ever blocking for input.
+
+    The parser events of the next PDU are buffered until its closing tag has
+    been fed; only then is decode_xer() run over them, so the generated code
+    never runs out of lookahead. With a wrapper_tag, the document is a stream
+    of PDUs as written by XERPduStreamWriter; without one, it is a single PDU.
+    """
+
+    def __init__(self, pdu_type: "type[Asn1Base]", wrapper_tag: Optional[str] = None,
+                 check_constraints: bool = True, xml_tag: Optional[str] = None) -> None:
+        self._pdu_type = pdu_type
+        self._wrapper_tag = wrapper_tag
+        self._check_constraints = check_constraints
+        self._xml_tag = xml_tag
+        self._parser: Optional[ET.XMLPullParser] = ET.XMLPullParser(events=("start", "end"))
+        self._pending: List[Tuple[str, ET.Element]] = []
+        self._depth = 0
+        self._pdu_depth = 0 if wrapper_tag is None else 1
+        self._wrapper: Optional[ET.Element] = None
+        self._complete = False
+
+    def feed(self, chunk: bytes) -> Sequence["Asn1Base"]:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            chunk: Bytes-like chunk; chunks may split tags and UTF-8 sequences anywhere.
+
+        Returns:
+            The PDUs completed by this chunk, in document order, or
+            XER_NEED_MORE_DATA (an empty tuple) if no PDU is complete yet.
+
+        Raises:
+            ValueError: If the decoder has been closed.
+            xml.etree.ElementTree.ParseError: If the XML is malformed.
+            Asn1InvalidValueException: If a PDU or the wrapper is malformed.
+        """
+        if self._parser is None:
+            raise ValueError("XERPushDecoder is closed")
+        self._parser.feed(chunk)
+        return self._decode_events(self._parser)
+
+    def close(self) -> Sequence["Asn1Base"]:
+        """
+        Signal the end of the document. Closing twice does nothing.
+
+        Returns:
+            The PDUs completed by the end of the input, or XER_NEED_MORE_DATA.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is truncated or malformed.
+            Asn1InvalidValueException: If the document ended before its PDUs were complete.
+        """
+        parser, self._parser = self._parser, None
+        if parser is None:
+            return XER_NEED_MORE_DATA
+        parser.close()
+        pdus = self._decode_events(parser)
+        if not self._complete:
+            raise Asn1InvalidValueException("XER decode: document ended before its last PDU was complete")
+        return pdus
+
+    @property
+    def complete(self) -> bool:
+        """True once the end of the document element has been fed."""
+        return self._complete
+
+    def _decode_events(self, parser: ET.XMLPullParser) -> Sequence["Asn1Base"]:
+        pdus = []
+        for event in parser.read_events():
+            kind, element = event
+            if kind == "start":
+                self._depth += 1
+                if self._depth == self._pdu_depth:
+                    if _local(element.tag) != self._wrapper_tag:
+                        raise Asn1InvalidValueException(
+                            f"XER decode: expected <{self._wrapper_tag}>, got {_local(element.tag)}",
+                            field_name=self._wrapper_tag)
+                    self._wrapper = element
+                    continue
+            else:
+                self._depth -= 1
+                if self._depth < self._pdu_depth:
+                    self._complete = True
+                    continue
+            self._pending.append(event)
+            if kind == "end" and self._depth == self._pdu_depth:
+                decoder = XERDecoder._from_events(self._pending)
+                self._pending = []
+                pdus.append(self._pdu_type.decode_xer(decoder, self._check_constraints, self._xml_tag))
+                if self._wrapper is None:
+                    self._complete = True
+                else:
+                    del self._wrapper[:]
+        return pdus or XER_NEED_MORE_DATA
@@ -1,11 +1,27 @@
 """
 ASN.1 XER (XML Encoding Rules) encoder.
 
-This module provides the XEREncoder for encoding ASN.1 values to XML.
+This module provides the XEREncoder for encoding ASN.1 values to XML, and
+the XERPduStreamWriter for writing a sequence of PDUs as one XML document.
 """
 
-from typing import List
-from .xer_codec import XER_INDENT_UNIT, xml_escape
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Tuple, Type, Union
+from .xer_codec import XER_INDENT_UNIT, XER_PDU_STREAM_TAG, XML_ESCAPE_TABLE, xml_escape
+
+if TYPE_CHECKING:
+    from .asn1_types import Asn1Base
+
+XER_STREAM_BUFFER_SIZE = 64 * 1024  # characters kept in memory before a stream flush
+
+_tag_bytes_cache: Dict[str, Tuple[bytes, bytes]] = {}
+
+
+def _tag_bytes(tag: str) -> Tuple[bytes, bytes]:
+    """Return the UTF-8 start and end tags for a tag name, cached per name."""
+    tags = _tag_bytes_cache.get(tag)
+    if tags is None:
+        tags = _tag_bytes_cache[tag] = (f"<{tag}>".encode("utf-8"), f"</{tag}>".encode("utf-8"))
+    return tags
 
 
 class XEREncoder:
@@ -14,10 +30,19 @@ class XEREncoder:
 
     XER is text-based, so we accumulate output in a list and join at the end.
     No pre-allocation occurs — the size hint to of_size() is ignored.
+
+    An encoder created with to_stream() instead writes the UTF-8 encoded XML
+    to a binary writer, keeping at most about buffer_size characters in memory.
     """
 
-    def __init__(self) -> None:
-        self._parts: List[str] = []
+    def __init__(self, writer: Optional[BinaryIO] = None, buffer_size: int = XER_STREAM_BUFFER_SIZE) -> None:
+        # str parts; CompactXEREncoder appends UTF-8 encoded bytes instead
+        self._parts: List[Union[str, bytes]] = []
+        self._writer = writer
+        self._buffer_size = buffer_size
+        self._pending = 0
+        self._bytes_written = 0
+        self._append = self._parts.append if writer is None else self._append_buffered
 
     @classmethod
     def of_size(cls, buffer_byte_size: int = 0) -> "XEREncoder":
@@ -50,6 +75,56 @@ class XEREncoder:
         """
         return cls()
 
+    @classmethod
+    def to_stream(cls, writer: BinaryIO, buffer_size: int = XER_STREAM_BUFFER_SIZE) -> "XEREncoder":
+        """
+        Create a new XER encoder that writes UTF-8 XML to a binary writer.
+
+        Output is buffered and flushed to the writer whenever about buffer_size
+        characters are pending. Call flush() after the last value is encoded.
+
+        Args:
+            writer: Any object with a write(bytes) method (file, socket file, BytesIO).
+            buffer_size: Number of characters to buffer between writes.
+
+        Returns:
+            A new streaming XEREncoder instance.
+        """
+        return cls(writer, buffer_size)
+
+    def _append_buffered(self, text: Union[str, bytes]) -> None:
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the buffered XML to the writer of a streaming encoder.
+
+        Does nothing for an in-memory encoder.
+        """
+        if self._writer is None or not self._parts:
+            return
+        data = self._encoded_parts()
+        self._parts.clear()
+        self._pending = 0
+        self._writer.write(data)
+        self._bytes_written += len(data)
+
+    def _encoded_parts(self) -> bytes:
+        return "".join(self._parts).encode("utf-8")
+
+    @property
+    def is_streaming(self) -> bool:
+        """True if the XML is written to a writer instead of kept in memory."""
+        return self._writer is not None
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes a streaming encoder has flushed to its writer."""
+        return self._bytes_written
+
     def write_raw(self, text: str) -> None:
         """
         Write raw text to the encoder.
@@ -57,7 +132,7 @@ class XEREncoder:
         Args:
             text: The text to append to the output.
         """
-        self._parts.append(text)
+        self._append(text)
 
     def indent(self, level: int) -> None:
         """
@@ -67,7 +142,7 @@ class XEREncoder:
             level: The nesting level; each level is 4 spaces.
         """
         if level > 0:
-            self._parts.append(XER_INDENT_UNIT * level)
+            self._append(XER_INDENT_UNIT * level)
 
     def get_xml(self) -> str:
         """
@@ -75,7 +150,12 @@ class XEREncoder:
 
         Returns:
             The complete XML as a string.
+
+        Raises:
+            ValueError: If the encoder streams its output to a writer.
         """
+        if self._writer is not None:
+            raise ValueError("XML of a streaming XEREncoder has been written to its writer")
         return "".join(self._parts)
 
     def get_bitstream_buffer(self) -> bytearray:
@@ -101,10 +181,10 @@ class XEREncoder:
         """
         self.indent(level)
         if tag:
-            self._parts.append(f"<{tag}>{value_text}</{tag}>\n")
+            self._append(f"<{tag}>{value_text}</{tag}>\n")
         else:
             # Empty tag: emit the value content directly (e.g. Boolean with no wrapper tag in SEQUENCE OF)
-            self._parts.append(f"{value_text}\n")
+            self._append(f"{value_text}\n")
 
     def encode_integer(self, tag: str, value: int, level: int) -> None:
         """
@@ -148,7 +228,7 @@ class XEREncoder:
             level: The nesting level for indentation.
         """
         self.indent(level)
-        self._parts.append(f"<{tag} />\n")
+        self._append(f"<{tag} />\n")
 
     def encode_string(self, tag: str, value: str, level: int) -> None:
         """
@@ -181,7 +261,7 @@ class XEREncoder:
             level: The nesting level for indentation.
         """
         self.indent(level)
-        self._parts.append(f"<{tag}>\n")
+        self._append(f"<{tag}>\n")
 
     def complex_end(self, tag: str, level: int) -> None:
         """
@@ -192,7 +272,7 @@ class XEREncoder:
             level: The nesting level for indentation.
         """
         self.indent(level)
-        self._parts.append(f"</{tag}>\n")
+        self._append(f"</{tag}>\n")
 
     def encode_octet_string(self, tag: str, data: bytes, num_bytes: int, level: int) -> None:
         """
@@ -228,3 +308,194 @@ class XEREncoder:
         """
         from .xer_decoder import XERDecoder
         return XERDecoder.from_codec(self)
+
+
+class CompactXEREncoder(XEREncoder):
+    """
+    XER encoder without indentation or line breaks, for machine-to-machine exchange.
+
+    Output is kept as UTF-8 bytes: start and end tags are cached as byte
+    strings per tag name, text is escaped with a translate table and the
+    nesting level passed by the generated code is ignored.
+    """
+
+    def _encoded_parts(self) -> bytes:
+        return b"".join(self._parts)
+
+    def write_raw(self, text: str) -> None:
+        """
+        Write raw text to the encoder, UTF-8 encoded.
+
+        Args:
+            text: The text to append to the output.
+        """
+        self._append(text.encode("utf-8"))
+
+    def indent(self, level: int) -> None:
+        """
+        Write nothing: compact output has no indentation.
+
+        Args:
+            level: The nesting level; ignored.
+        """
+
+    def get_xml(self) -> str:
+        """
+        Get the accumulated XML text.
+
+        Returns:
+            The complete XML as a string, decoded from the UTF-8 parts.
+
+        Raises:
+            ValueError: If the encoder streams its output to a writer.
+        """
+        if self._writer is not None:
+            raise ValueError("XML of a streaming XEREncoder has been written to its writer")
+        return self._encoded_parts().decode("utf-8")
+
+    def get_bitstream_buffer(self) -> bytearray:
+        """
+        Get the XML as a UTF-8 encoded bytearray, without decoding it to text first.
+
+        Returns:
+            The XML encoded as UTF-8 bytes in a bytearray.
+
+        Raises:
+            ValueError: If the encoder streams its output to a writer.
+        """
+        if self._writer is not None:
+            raise ValueError("XML of a streaming XEREncoder has been written to its writer")
+        return bytearray(self._encoded_parts())
+
+    def encode_primitive(self, tag: str, value_text: str, level: int) -> None:
+        """
+        Emit a simple element with text content: <tag>value</tag>
+
+        Args:
+            tag: The element tag name; empty to emit the value content only.
+            value_text: The text content (already formatted for XML).
+            level: The nesting level; ignored.
+        """
+        if tag:
+            start, end = _tag_bytes(tag)
+            self._append(start + value_text.encode("utf-8") + end)
+        else:
+            self._append(value_text.encode("utf-8"))
+
+    def encode_string(self, tag: str, value: str, level: int) -> None:
+        """
+        Encode a string with XML escaping: <tag>escaped_value</tag>.
+
+        Args:
+            tag: The element tag name.
+            value: The string value.
+            level: The nesting level; ignored.
+        """
+        self.encode_primitive(tag, value.translate(XML_ESCAPE_TABLE), level)
+
+    def encode_null(self, tag: str, level: int) -> None:
+        """
+        Emit a self-closing element: <tag/>
+
+        Args:
+            tag: The element tag name.
+            level: The nesting level; ignored.
+        """
+        self._append(f"<{tag}/>".encode("utf-8"))
+
+    def encode_enumerated(self, tag: str, xer_value: str, level: int) -> None:
+        """
+        Encode an enumerated value as <tag><xer_value/></tag>.
+
+        Args:
+            tag: The element tag name.
+            xer_value: The enumeration value name (unescaped tag).
+            level: The nesting level; ignored.
+        """
+        self.encode_primitive(tag, f"<{xer_value}/>", level)
+
+    def complex_start(self, tag: str, level: int) -> None:
+        """
+        Emit an opening element: <tag>
+
+        Args:
+            tag: The element tag name.
+            level: The nesting level; ignored.
+        """
+        self._append(_tag_bytes(tag)[0])
+
+    def complex_end(self, tag: str, level: int) -> None:
+        """
+        Emit a closing element: </tag>
+
+        Args:
+            tag: The element tag name.
+            level: The nesting level; ignored.
+        """
+        self._append(_tag_bytes(tag)[1])
+
+
+class XERPduStreamWriter:
+    """
+    Writes an unbounded sequence of PDUs as children of one wrapper element.
+
+    The PDUs are encoded one at a time by a streaming encoder, so memory use
+    does not depend on the number of PDUs written. Use as a context manager,
+    or call close() after the last PDU to write the closing wrapper tag.
+    """
+
+    def __init__(self, writer: BinaryIO, wrapper_tag: str = XER_PDU_STREAM_TAG,
+                 encoder_cls: Type[XEREncoder] = XEREncoder,
+                 buffer_size: int = XER_STREAM_BUFFER_SIZE) -> None:
+        self._encoder = encoder_cls.to_stream(writer, buffer_size)
+        self._wrapper_tag = wrapper_tag
+        self._count = 0
+        self._closed = False
+        self._encoder.complex_start(wrapper_tag, 0)
+
+    def write(self, pdu: "Asn1Base", check_constraints: bool = True, xml_tag: Optional[str] = None) -> None:
+        """
+        Encode one PDU into the stream.
+
+        Args:
+            pdu: Generated ASN.1 value with an encode_xer() method.
+            check_constraints: Validate the PDU before encoding it.
+            xml_tag: Element name of the PDU; defaults to its type assignment name.
+
+        Raises:
+            ValueError: If the writer has been closed.
+        """
+        if self._closed:
+            raise ValueError("XERPduStreamWriter is closed")
+        pdu.encode_xer(self._encoder, check_constraints, xml_tag)
+        self._count += 1
+
+    def flush(self) -> None:
+        """Write all PDUs encoded so far to the writer."""
+        self._encoder.flush()
+
+    def close(self) -> None:
+        """Write the closing wrapper tag and flush. Closing twice does nothing."""
+        if self._closed:
+            return
+        self._encoder.complex_end(self._wrapper_tag, 0)
+        self._encoder.flush()
+        self._closed = True
+
+    @property
+    def count(self) -> int:
+        """Number of PDUs written."""
+        return self._count
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of bytes flushed to the writer."""
+        return self._encoder.bytes_written
+
+    def __enter__(self) -> "XERPduStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # On error the document is left unterminated rather than looking complete
+        if exc_type is None:
+            self.close()
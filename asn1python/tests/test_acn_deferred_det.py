@@ -0,0 +1,103 @@
+"""
+Unit tests for ACN deferred determinant patching.
+
+The encoder reserves the determinant bits, encodes the determined content once
+and then writes the determinant value back in place. These tests check that
+the patched stream matches a stream encoded with the value known up front, and
+that a shared determinant is only accepted with a consistent value.
+"""
+import pytest
+
+from asn1python.acn_encoder import ACNEncoder, AcnInsertedFieldRef
+
+
+@pytest.mark.parametrize("suffix, n_bits, value", [
+    ("u8", 8, 0xA5),
+    ("u16_be", 16, 0x1234),
+    ("u32_be", 32, 0xDEADBEEF),
+    ("u64_be", 64, 0x0102030405060708),
+    ("i8", 8, -3),
+    ("i16_be", 16, -1000),
+    ("i32_be", 32, -70000),
+    ("i64_be", 64, -(1 << 40)),
+])
+def test_patch_matches_direct_encoding(acn_encoder: ACNEncoder, suffix: str, n_bits: int, value: int) -> None:
+    det = AcnInsertedFieldRef()
+    assert acn_encoder.append_bit(True).success
+    assert getattr(acn_encoder, f"acn_init_det_{suffix}")(det).success
+    assert acn_encoder.append_byte(0x5A).success
+    assert getattr(acn_encoder, f"acn_patch_det_{suffix}")(value, det).success
+    assert acn_encoder.bit_index == 1 + n_bits + 8
+    assert det.is_set and det.value == value
+
+    decoder = acn_encoder.get_decoder()
+    assert decoder.read_bit().decoded_value
+    raw = decoder._bitstream.read_bits_wide(n_bits)
+    assert raw == value & ((1 << n_bits) - 1)
+    assert decoder.read_byte().decoded_value == 0x5A
+
+
+@pytest.mark.parametrize("suffix, n_bits", [("u16_le", 16), ("u32_le", 32), ("u64_le", 64)])
+def test_little_endian_patch(acn_encoder: ACNEncoder, suffix: str, n_bits: int) -> None:
+    value = 0x0102030405060708 & ((1 << n_bits) - 1)
+    det = AcnInsertedFieldRef()
+    assert getattr(acn_encoder, f"acn_init_det_{suffix}")(det).success
+    assert getattr(acn_encoder, f"acn_patch_det_{suffix}")(value, det).success
+    assert bytes(acn_encoder.get_bitstream_buffer()[:n_bits // 8]) == value.to_bytes(n_bits // 8, "little")
+
+
+def test_const_size_and_bool1(acn_encoder: ACNEncoder) -> None:
+    length = AcnInsertedFieldRef()
+    flag = AcnInsertedFieldRef()
+    assert acn_encoder.acn_init_det_const_size(11, length).success
+    assert acn_encoder.acn_init_det_bool1(flag).success
+    assert acn_encoder.acn_init_det_twos_complement_const_size(5, AcnInsertedFieldRef()).success
+    assert acn_encoder.acn_patch_det_bool1(True, flag).success
+    assert acn_encoder.acn_patch_det_const_size(1500, 11, length).success
+
+    decoder = acn_encoder.get_decoder()
+    stream = decoder._bitstream
+    assert stream.read_bits_wide(11) == 1500
+    assert stream.read_bits_wide(1) == 1
+    assert stream.read_bits_wide(5) == 0
+
+
+def test_ia5_string_patch(acn_encoder: ACNEncoder) -> None:
+    det = AcnInsertedFieldRef()
+    assert acn_encoder.acn_init_det_ia5_string_fix_size(4, det).success
+    assert acn_encoder.acn_patch_det_ia5_string_fix_size("ab", 4, det).success
+    assert det.str_value == "ab"
+
+    decoder = acn_encoder.get_decoder()
+    result = decoder.dec_ia5_string_char_index_external_field_determinant(4, 4)
+    assert result.success and result.decoded_value == "ab  "
+
+
+def test_shared_determinant_consistency(acn_encoder: ACNEncoder) -> None:
+    det = AcnInsertedFieldRef()
+    assert acn_encoder.acn_init_det_u8(det).success
+    assert acn_encoder.acn_patch_det_u8(7, det).success
+    assert acn_encoder.acn_patch_det_u8(7, det).success
+    mismatch = acn_encoder.acn_patch_det_u8(8, det)
+    assert not mismatch.success
+    assert det.value == 7
+    assert acn_encoder.get_bitstream_buffer()[0] == 7
+
+
+@pytest.mark.parametrize("method, value", [
+    ("acn_patch_det_u8", 256),
+    ("acn_patch_det_u8", -1),
+    ("acn_patch_det_i8", 128),
+    ("acn_patch_det_u16_le", 1 << 16),
+])
+def test_out_of_range_value_rejected(acn_encoder: ACNEncoder, method: str, value: int) -> None:
+    det = AcnInsertedFieldRef()
+    assert acn_encoder.acn_init_det_u8(det).success
+    result = getattr(acn_encoder, method)(value, det)
+    assert not result.success
+    assert not det.is_set
+
+
+def test_init_past_end_of_buffer() -> None:
+    encoder = ACNEncoder.of_size(1)
+    assert not encoder.acn_init_det_u16_be(AcnInsertedFieldRef()).success
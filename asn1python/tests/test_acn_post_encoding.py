@@ -0,0 +1,98 @@
+"""
+Unit tests for the built-in ACN post-encoding checksum functions.
+
+The tests mimic the generated code: positions are saved before every child,
+the checksum field is encoded as a placeholder and the post-encoding function
+patches it in place. The validator must accept the result and reject any
+corrupted byte.
+"""
+import binascii
+import zlib
+
+import pytest
+
+from asn1python.acn_decoder import ACNDecoder
+from asn1python.acn_encoder import ACNEncoder
+from asn1python.acn_post_encoding import (
+    AcnBitStreamPositions, checksum_post_decoding_validator, checksum_post_encoding_function,
+    crc16_ccitt, get_checksum_function, register_checksum_function,
+)
+from asn1python.bitstream import BitStream
+
+
+def _encode_packet(encoder: ACNEncoder, payload: bytes, n_bits: int, lead_bits: int = 0) -> tuple:
+    for _ in range(lead_bits):
+        assert encoder.append_bit(True).success
+    positions = AcnBitStreamPositions()
+    start = encoder.bit_index
+    positions.payload = encoder.bit_index
+    assert encoder.append_byte_array(payload, len(payload)).success
+    positions.crc = encoder.bit_index
+    assert encoder.encode_unsigned_integer(0, n_bits).success
+    return start, positions
+
+
+def test_crc16_ccitt_check_value() -> None:
+    assert crc16_ccitt(b"123456789") == 0x29B1
+
+
+@pytest.mark.parametrize("name, n_bits, reference", [
+    ("crc16_ccitt", 16, lambda data: binascii.crc_hqx(data, 0xFFFF)),
+    ("crc32", 32, zlib.crc32),
+])
+def test_round_trip(acn_encoder: ACNEncoder, name: str, n_bits: int, reference) -> None:
+    payload = bytes(range(40))
+    start, positions = _encode_packet(acn_encoder, payload, n_bits)
+    assert checksum_post_encoding_function(name, "crc")(None, start, positions, acn_encoder).success
+
+    data = bytes(acn_encoder.get_bitstream_buffer())
+    assert data[:len(payload)] == payload
+    assert int.from_bytes(data[len(payload):], "big") == reference(payload)
+
+    decoder = ACNDecoder.from_buffer(bytearray(data))
+    decoder.decode_octet_string_no_length(len(payload) + n_bits // 8)
+    result = checksum_post_decoding_validator(name, "crc")(None, start, positions, decoder)
+    assert result.success and result.decoded_value == reference(payload)
+    assert decoder.bit_index == len(data) * 8
+
+
+def test_corruption_detected(acn_encoder: ACNEncoder) -> None:
+    start, positions = _encode_packet(acn_encoder, b"telemetry", 16)
+    checksum_post_encoding_function("crc16_ccitt", "crc")(None, start, positions, acn_encoder)
+
+    data = bytearray(acn_encoder.get_bitstream_buffer())
+    data[3] ^= 0x01
+    result = checksum_post_decoding_validator("crc16_ccitt", "crc")(None, start, positions, ACNDecoder.from_buffer(data))
+    assert not result.success
+    assert "Checksum mismatch in 'crc'" in result.error_message
+
+
+def test_unaligned_range_and_custom_callable(acn_encoder: ACNEncoder) -> None:
+    xor_sum = lambda data: sum(data) & 0xFF
+    start, positions = _encode_packet(acn_encoder, b"\x01\x02\x03", 8, lead_bits=3)
+    assert checksum_post_encoding_function(xor_sum, "crc", 8)(None, start, positions, acn_encoder).success
+
+    decoder = ACNDecoder.from_buffer(bytearray(acn_encoder.get_bitstream_buffer()))
+    assert decoder.peek_bits(positions.crc, 8).decoded_value == 6
+    assert checksum_post_decoding_validator(xor_sum, "crc", 8)(None, start, positions, decoder).success
+
+
+def test_registry() -> None:
+    register_checksum_function("sum8", lambda data: sum(data), 8)
+    function, n_bits = get_checksum_function("sum8")
+    assert n_bits == 8 and function(b"\x01\x02") == 3
+    with pytest.raises(ValueError):
+        get_checksum_function("unknown")
+    with pytest.raises(ValueError):
+        checksum_post_encoding_function(lambda data: 0, "crc")
+
+
+@pytest.mark.parametrize("start, end, expected", [
+    (8, 24, b"\x34\x56"),
+    (4, 12, b"\x23"),
+    (12, 17, b"\x40"),
+])
+def test_bit_range_view(start: int, end: int, expected: bytes) -> None:
+    stream = BitStream(bytearray(b"\x12\x34\x56\x78"))
+    assert bytes(stream.bit_range_view(start, end)) == expected
+    assert stream.current_used_bits == 0
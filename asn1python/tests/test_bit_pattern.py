@@ -0,0 +1,64 @@
+"""
+Unit tests for ACN bit pattern matching (BOOLEAN true/false values and NULL patterns).
+
+Patterns are compared as a single unsigned integer of the pattern width. The
+bytearray based entry points convert the MSB aligned pattern once and must
+behave like the integer ones.
+"""
+import pytest
+
+from asn1python.acn_decoder import ACNDecoder, bit_pattern_to_uint
+from asn1python.acn_encoder import ACNEncoder
+
+
+@pytest.mark.parametrize("pattern, n_bits, expected", [
+    (bytearray([0xA0]), 3, 0b101),
+    (bytearray([0xFF, 0x80]), 9, 0x1FF),
+    (bytearray([0x12, 0x34]), 16, 0x1234),
+    (bytearray([0x00]), 1, 0),
+])
+def test_bit_pattern_to_uint(pattern: bytearray, n_bits: int, expected: int) -> None:
+    assert bit_pattern_to_uint(pattern, n_bits) == expected
+
+
+def test_bit_pattern_too_short() -> None:
+    with pytest.raises(ValueError):
+        bit_pattern_to_uint(bytearray([0xFF]), 9)
+
+
+@pytest.mark.parametrize("n_bits", [1, 3, 8, 13, 64, 100])
+def test_pattern_round_trip(acn_encoder: ACNEncoder, n_bits: int) -> None:
+    pattern = (1 << n_bits) - 1 - (1 << (n_bits // 2))
+    assert acn_encoder.append_bit(True).success
+    result = acn_encoder.append_bit_pattern_uint(pattern, n_bits)
+    assert result.success and result.bits_encoded == n_bits
+    assert acn_encoder.append_bit_pattern_uint(pattern ^ 1, n_bits).success
+
+    decoder = acn_encoder.get_decoder()
+    assert decoder.read_bit().decoded_value
+    matched = decoder.read_bit_pattern_uint(pattern, n_bits)
+    assert matched.success and matched.decoded_value is True and matched.bits_consumed == n_bits
+    mismatched = decoder.read_bit_pattern_uint(pattern, n_bits)
+    assert mismatched.success and mismatched.decoded_value is False
+
+
+def test_read_bit_pattern_bytes_matches_uint() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray([0b10110000]))
+    result = decoder.read_bit_pattern(bytearray([0b10100000]), 4)
+    assert result.success and result.decoded_value is False and result.bits_consumed == 4
+    assert decoder._bitstream.current_used_bits == 4
+
+
+def test_true_false_boolean() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray([0xAA, 0x55, 0x00]))
+    assert decoder.decode_true_false_boolean_uint(0xAA, 0x55, 8).decoded_value is True
+    assert decoder.decode_true_false_boolean(bytearray([0xAA]), bytearray([0x55]), 8).decoded_value is False
+    invalid = decoder.decode_true_false_boolean_uint(0xAA, 0x55, 8)
+    assert not invalid.success
+    assert "Invalid pattern" in invalid.error_message
+
+
+def test_ignore_value_and_insufficient_data() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray([0xFF]))
+    assert decoder.read_bit_pattern_ignore_value(5).bits_consumed == 5
+    assert not decoder.read_bit_pattern_uint(0, 4).success
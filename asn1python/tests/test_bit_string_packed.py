@@ -0,0 +1,103 @@
+"""
+Unit tests for the packed BIT STRING types and the bulk bit transfers.
+
+The class mimics what header_python.stg and uper_python.stg generate for a
+variable-size BIT STRING with named bits.
+"""
+import copy
+import pickle
+from enum import IntEnum
+
+import pytest
+
+from asn1python.asn1_types import Asn1BitString, asn1_dataclass
+from asn1python.codec import Encoding
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+
+@asn1_dataclass
+class Flags(Asn1BitString):
+    nCount: int = 0
+    arr: bytes = b""
+
+    class NamedBits(IntEnum):
+        POWER = 0x1
+        HEATER = 0x200
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 5
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        codec.encode_constrained_whole_number(self.nCount, 0, 31)
+        assert codec.append_bits(self.arr, self.nCount)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Flags":
+        n_count = codec.decode_constrained_whole_number(0, 31).decoded_value
+        return cls(n_count, codec.read_bits(n_count).decoded_value)
+
+
+def _per_bit(data: bytes, num_bits: int, offset: int) -> bytearray:
+    encoder = UPEREncoder.of_size(16)
+    for _ in range(offset):
+        encoder.append_bit(False)
+    for i in range(num_bits):
+        encoder.append_bit(bool(data[i // 8] & (0x80 >> (i % 8))))
+    return encoder.get_bitstream_buffer()
+
+
+@pytest.mark.parametrize("offset", [0, 3])
+@pytest.mark.parametrize("num_bits", [0, 5, 8, 21, 64, 100])
+def test_bulk_bits_match_per_bit_layout(offset: int, num_bits: int) -> None:
+    data = bytes(range(0xA5, 0xA5 + 13))
+    encoder = UPEREncoder.of_size(16)
+    for _ in range(offset):
+        encoder.append_bit(False)
+    res = encoder.append_bits(data, num_bits)
+    assert res and res.bits_encoded == num_bits
+    assert encoder.get_bitstream_buffer() == _per_bit(data, num_bits, offset)
+
+    decoder = UPERDecoder.from_buffer(encoder.get_bitstream_buffer())
+    for _ in range(offset):
+        decoder.read_bit()
+    decoded = decoder.read_bits(num_bits).decoded_value
+    assert decoded == Asn1BitString.pack_int(int.from_bytes(data, "big") >> (104 - num_bits), num_bits)
+
+
+def test_bit_str_codec() -> None:
+    encoder = UPEREncoder.of_size(8)
+    assert encoder.encode_bit_string("1011001110001", 0, 16)
+    assert not UPEREncoder.of_size(8).encode_bit_string("10201", 0, 16)
+    decoder = UPERDecoder.from_buffer(encoder.get_bitstream_buffer())
+    assert decoder.decode_bit_string(0, 16).decoded_value == "1011001110001"
+
+
+def test_int_and_bit_str_views() -> None:
+    flags = Flags(12, b"\xb3\x80")
+    assert flags.to_int() == 0b101100111000
+    assert flags.to_bit_str() == "101100111000"
+    assert flags.to_bit_str(3) == "101"
+    assert Asn1BitString.pack_bit_str("101100111000") == bytearray(b"\xb3\x80")
+    assert Asn1BitString.pack_bit_str("") == bytearray()
+    assert flags.to_bytes() == b"\xb3\x80" and flags.as_list() == [0xB3, 0x80]
+
+
+def test_named_bits_by_mask() -> None:
+    flags = Flags.decode(Encoding.uPER, Flags(3, b"\x00").encode(Encoding.uPER))
+    assert not flags.has_bit(Flags.NamedBits.POWER) and not flags.has_bit(Flags.NamedBits.HEATER)
+
+    flags.set_bit(Flags.NamedBits.HEATER)
+    assert isinstance(flags.arr, bytearray)
+    assert flags.has_bit(Flags.NamedBits.HEATER) and flags.nCount == 10
+    flags.set_bit(Flags.NamedBits.POWER)
+    flags.clear_bit(Flags.NamedBits.HEATER)
+    assert flags.to_bit_str() == "1000000000"
+    assert Flags.decode(Encoding.uPER, flags.encode(Encoding.uPER)) == flags
+
+
+def test_list_compatibility_and_copy() -> None:
+    flags = Flags(4, [0xF0])
+    assert isinstance(flags.arr, bytearray) and flags.to_int() == 0xF
+    decoded = Flags.decode(Encoding.uPER, flags.encode(Encoding.uPER))
+    for clone in (copy.deepcopy(decoded), pickle.loads(pickle.dumps(decoded))):
+        assert clone == flags
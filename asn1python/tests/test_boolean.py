@@ -0,0 +1,47 @@
+"""
+Unit tests for the interned Asn1Boolean instances.
+"""
+import copy
+import pickle
+
+import pytest
+
+from asn1python.asn1_types import Asn1Base, Asn1Boolean
+from asn1python.codec_uper import UPEREncoder
+
+
+class Flag(Asn1Boolean, Asn1Base):
+    """Shape of a generated BOOLEAN type assignment."""
+
+
+def test_interned_per_class() -> None:
+    assert Asn1Boolean(True) is Asn1Boolean(1) is ~Asn1Boolean(False)
+    assert Asn1Boolean(0) is Asn1Boolean(Asn1Boolean(False))
+    assert Flag(True) is Flag("yes") and type(Flag(True)) is Flag
+    assert Flag(True) is not Asn1Boolean(True) and Flag(True) == Asn1Boolean(True)
+    assert (Asn1Boolean(True) & False) is Asn1Boolean(False)
+
+
+def test_immutable_and_copies_keep_identity() -> None:
+    value = Flag(True)
+    with pytest.raises(AttributeError):
+        value._val = False
+    assert copy.copy(value) is value and copy.deepcopy(value) is value
+    assert pickle.loads(pickle.dumps(Asn1Boolean(False))) is Asn1Boolean(False)
+
+
+def test_bool_attributes_are_delegated() -> None:
+    assert Asn1Boolean(True).bit_length() == 1
+    assert Asn1Boolean(True).to_bytes(1, "big") == b"\x01"
+    assert Asn1Boolean(False).real == 0
+    assert "__getattr__" not in vars(Asn1Boolean)
+
+
+def test_decoded_sequence_of_shares_instances() -> None:
+    encoder = UPEREncoder.of_size(1)
+    for bit in (True, False, True, True):
+        encoder.append_bit(bit)
+    decoder = encoder.get_decoder()
+    values = [Flag(decoder.read_bit().decoded_value) for _ in range(4)]
+    assert values == [True, False, True, True]
+    assert values[0] is values[2] is values[3]
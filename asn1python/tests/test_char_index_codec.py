@@ -0,0 +1,106 @@
+"""
+Unit tests for the cached character index tables and the wide bit field
+operations they rely on.
+
+The char-index string encoders pack a whole string into a single bit field.
+These tests check that the packed layout is bit-identical to writing the
+indices one by one, that tables are shared per alphabet, and that invalid
+characters / indices are still reported.
+"""
+import random
+
+import pytest
+
+from asn1python.acn_encoder import ACNEncoder
+from asn1python.bitstream import BitStream, BitStreamError
+from asn1python.char_index_codec import CharIndexCodec, get_char_index_codec
+
+from conftest import charset_to_bytes, generate_test_string
+
+
+def test_codec_is_cached_per_alphabet() -> None:
+    first = get_char_index_codec(bytearray(b"ACGT"))
+    second = get_char_index_codec(bytes(b"ACGT"))
+    assert first is second
+    assert get_char_index_codec(b"ACGU") is not first
+
+
+def test_index_table_and_inverse() -> None:
+    char_codec = get_char_index_codec(b"ACGT")
+    assert char_codec.bits_per_char == 2
+    assert char_codec.index_table[ord("G")] == 2
+    assert char_codec.index_table[ord("X")] == -1
+    assert char_codec.unpack(char_codec.pack(b"GATTACA"), 7) == b"GATTACA"
+
+
+def test_packed_layout_matches_per_character_writes(seed: int, max_length: int, charset: str) -> None:
+    allowed = charset_to_bytes(charset)
+    text = generate_test_string(charset, max_length).encode("ascii")
+    char_codec = get_char_index_codec(allowed)
+
+    expected = BitStream(bytearray(max_length * 2 + 1))
+    for char_byte in text:
+        expected.write_bits(allowed.index(char_byte), char_codec.bits_per_char)
+
+    actual = BitStream(bytearray(max_length * 2 + 1))
+    actual.write_bits_wide(char_codec.pack(text), len(text) * char_codec.bits_per_char)
+
+    assert actual.get_data() == expected.get_data()
+    assert actual.current_used_bits == expected.current_used_bits
+
+
+def test_unknown_character_rejected() -> None:
+    with pytest.raises(ValueError, match="not found in allowed character set"):
+        get_char_index_codec(b"0123456789").pack(b"12a4")
+
+
+def test_index_out_of_range_rejected() -> None:
+    # 3 characters need 2 bits, so index 3 is representable but invalid
+    with pytest.raises(ValueError, match="Character index 3 exceeds allowed range 0-2"):
+        get_char_index_codec(b"abc").unpack(0b0011, 2)
+
+
+def test_empty_char_set_rejected() -> None:
+    with pytest.raises(ValueError):
+        CharIndexCodec(b"")
+
+
+def test_ia5_round_trip_unaligned(acn_encoder: ACNEncoder) -> None:
+    assert acn_encoder.append_bit(True).success
+    assert acn_encoder.enc_ia5_string_char_index_external_field_determinant(16, "Hello, world").success
+
+    decoder = acn_encoder.get_decoder()
+    assert decoder.read_bit().decoded_value
+    result = decoder.dec_ia5_string_char_index_external_field_determinant(16, 12)
+    assert result.success
+    assert result.decoded_value == "Hello, world"
+    assert result.bits_consumed == 12 * 7
+
+
+def test_wide_bits_preserve_surrounding_bits(seed: int) -> None:
+    for _ in range(50):
+        offset = random.randint(0, 15)
+        width = random.randint(1, 300)
+        value = random.getrandbits(width)
+
+        stream = BitStream(bytearray(b"\xff" * 48))
+        stream.set_bit_index(offset)
+        stream.write_bits_wide(value, width)
+        end = stream.current_used_bits
+
+        stream.set_bit_index(offset)
+        assert stream.read_bits_wide(width) == value
+        stream.set_bit_index(0)
+        assert stream.read_bits_wide(offset) == (1 << offset) - 1
+        stream.set_bit_index(end)
+        assert stream.read_bits_wide(48 * 8 - end) == (1 << (48 * 8 - end)) - 1
+
+
+def test_wide_bits_bounds() -> None:
+    stream = BitStream(bytearray(2))
+    with pytest.raises(BitStreamError):
+        stream.write_bits_wide(1 << 17, 17)
+    with pytest.raises(BitStreamError):
+        stream.write_bits_wide(4, 2)
+    with pytest.raises(BitStreamError):
+        stream.read_bits_wide(17)
@@ -0,0 +1,82 @@
+"""
+Unit tests for the check_constraints argument of Asn1Base.encode()/decode().
+
+The PDU mimics the generated encode/decode methods, which validate the value
+only when check_constraints is set.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from asn1python.asn1_exceptions import Asn1ValueOutOfRangeException
+from asn1python.asn1_types import Asn1Base, Asn1ConstraintValidResult
+from asn1python.codec import Encoding
+
+
+@dataclass
+class Reading(Asn1Base):
+    sensor: int
+    value: int
+
+    validations = 0
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 2
+
+    def is_constraint_valid(self) -> Asn1ConstraintValidResult:
+        Reading.validations += 1
+        if not 0 <= self.value <= 1000:
+            return Asn1ConstraintValidResult(is_valid=False, error_code=1)
+        return Asn1ConstraintValidResult(is_valid=True)
+
+    def _check(self, check_constraints: bool) -> None:
+        if check_constraints and not self.is_constraint_valid():
+            raise Asn1ValueOutOfRangeException("value")
+
+    def encode_uper(self, codec, check_constraints: bool = True):
+        self._check(check_constraints)
+        codec.encode_constrained_whole_number(self.sensor, 0, 15)
+        codec.encode_constrained_whole_number(self.value, 0, 1023)
+        return codec
+
+    @classmethod
+    def decode_uper(cls, codec, check_constraints: bool = True) -> "Reading":
+        value = cls(codec.decode_constrained_whole_number(0, 15).decoded_value,
+                    codec.decode_constrained_whole_number(0, 1023).decoded_value)
+        value._check(check_constraints)
+        return value
+
+    def encode_xer(self, codec, check_constraints: bool = True, xmlTag: Optional[str] = None) -> None:
+        self._check(check_constraints)
+        codec.complex_start("Reading", 0)
+        codec.encode_integer("sensor", self.sensor, 1)
+        codec.encode_integer("value", self.value, 1)
+        codec.complex_end("Reading", 0)
+
+    @classmethod
+    def decode_xer(cls, codec, check_constraints: bool = True, xmlTag: Optional[str] = None) -> "Reading":
+        codec.complex_start("Reading")
+        value = cls(codec.decode_integer("sensor"), codec.decode_integer("value"))
+        codec.complex_end("Reading")
+        value._check(check_constraints)
+        return value
+
+
+def test_round_trip_validates_when_asked() -> None:
+    Reading.validations = 0
+    uper = Reading(3, 700).encode(Encoding.uPER)
+    xer = Reading.decode(Encoding.uPER, uper).encode(Encoding.XER, check_constraints=False)
+    assert Reading.validations == 2
+    assert Reading.decode(Encoding.XER, xer) == Reading(3, 700)
+    assert Reading.decode(Encoding.XER, xer, check_constraints=False).encode(Encoding.uPER, check_constraints=False) == uper
+    assert Reading.validations == 3
+
+
+def test_invalid_value_is_rejected() -> None:
+    with pytest.raises(Asn1ValueOutOfRangeException):
+        Reading(3, 1020).encode(Encoding.uPER)
+    uper = Reading(3, 1020).encode(Encoding.uPER, check_constraints=False)
+    with pytest.raises(Asn1ValueOutOfRangeException):
+        Reading.decode(Encoding.uPER, uper)
+    assert Reading.decode(Encoding.uPER, uper, check_constraints=False) == Reading(3, 1020)
@@ -0,0 +1,95 @@
+"""
+Unit tests for the codec registry behind Asn1Base.encode/decode.
+"""
+from dataclasses import dataclass
+
+import pytest
+
+from asn1python.asn1_exceptions import Asn1Exception
+from asn1python.asn1_types import Asn1Base
+from asn1python.codec import Encoding
+from asn1python.codec_registry import CodecRegistration, bind_codec, get_codec, register_codec
+from asn1python.codec_uper import UPEREncoder
+
+
+class JsonEncoder:
+    sizes = []
+
+    def __init__(self) -> None:
+        self.text = ""
+
+    @classmethod
+    def of_size(cls, size: int) -> "JsonEncoder":
+        cls.sizes.append(size)
+        return cls()
+
+    def get_bitstream_buffer(self) -> bytearray:
+        return bytearray(self.text.encode())
+
+
+class JsonDecoder:
+    def __init__(self, data: bytes) -> None:
+        self.text = bytes(data).decode()
+
+    @classmethod
+    def from_buffer(cls, data: bytes) -> "JsonDecoder":
+        return cls(data)
+
+
+@dataclass
+class Counter(Asn1Base):
+    count: int
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 1
+        REQUIRED_BYTES_FOR_JSON_ENCODING = 12
+
+    def encode_uper(self, codec, check_constraints: bool = True):
+        codec.encode_constrained_whole_number(self.count, 0, 255)
+
+    @classmethod
+    def decode_uper(cls, codec, check_constraints: bool = True) -> "Counter":
+        return cls(codec.decode_constrained_whole_number(0, 255).decoded_value)
+
+    def encode_json(self, codec: JsonEncoder, check_constraints: bool = True) -> None:
+        codec.text = f'{{"count": {self.count}}}'
+
+    @classmethod
+    def decode_json(cls, codec: JsonDecoder, check_constraints: bool = True) -> "Counter":
+        return cls(int(codec.text.split(":")[1].rstrip("}")))
+
+
+def test_builtin_codec_is_bound_once_per_type() -> None:
+    assert get_codec(Encoding.uPER).encoder_class is UPEREncoder
+    assert Counter(200).encode(Encoding.uPER) == bytearray(b"\xc8")
+    assert bind_codec(Counter, Encoding.uPER) is bind_codec(Counter, Encoding.uPER)
+    assert Counter.decode(Encoding.uPER, bytearray(b"\xc8")) == Counter(200)
+    assert Counter._codec_bindings[Encoding.uPER] is bind_codec(Counter, Encoding.uPER)
+
+
+def test_binding_is_per_class_and_dropped_on_register() -> None:
+    class SubCounter(Counter):
+        pass
+
+    Counter(1).encode(Encoding.uPER)
+    assert Encoding.uPER not in SubCounter._codec_bindings
+    SubCounter(1).encode(Encoding.uPER)
+    assert SubCounter._codec_bindings[Encoding.uPER] is not Counter._codec_bindings[Encoding.uPER]
+
+    register_codec(Encoding.uPER, get_codec(Encoding.uPER))
+    assert Counter._codec_bindings == {} and SubCounter._codec_bindings == {}
+    assert Counter.decode(Encoding.uPER, Counter(5).encode(Encoding.uPER)) == Counter(5)
+
+
+def test_third_party_codec() -> None:
+    register_codec("JSON", CodecRegistration(
+        JsonEncoder, JsonDecoder, "encode_json", "decode_json", "REQUIRED_BYTES_FOR_JSON_ENCODING"))
+    data = Counter(7).encode("JSON")
+    assert data == bytearray(b'{"count": 7}')
+    assert JsonEncoder.sizes[-1] == 12
+    assert Counter.decode("JSON", data) == Counter(7)
+
+
+def test_unknown_encoding() -> None:
+    with pytest.raises(Asn1Exception, match="Invalid encoding type"):
+        Counter(1).encode("BER")
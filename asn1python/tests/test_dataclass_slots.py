@@ -0,0 +1,131 @@
+"""
+Unit tests and memory benchmark for the slotted generated dataclasses.
+
+The classes are declared inside a function, the way a generated module is
+executed on import, once with slots disabled and once enabled.
+"""
+import copy
+import pickle
+import tracemalloc
+from dataclasses import field
+from enum import IntEnum
+from typing import List, Optional, Union
+
+import pytest
+
+from asn1python.asn1_types import (
+    Asn1Base, Asn1Boolean, Asn1ConstraintValidResult, NullType, asn1_dataclass, set_dataclass_slots,
+)
+from asn1python.codec import Encoding
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+
+def _declare_types(slots: bool) -> dict:
+    set_dataclass_slots(slots)
+    try:
+        @asn1_dataclass
+        class Sample(Asn1Base):
+            channel: int = 0
+            value: int = 0
+            valid: Asn1Boolean = Asn1Boolean(False)
+
+        @asn1_dataclass
+        class Samples(Asn1Base):
+            nCount: int = 0
+            arr: List[Sample] = field(default_factory=list)
+
+        class ModeInUse(IntEnum):
+            idle = 0
+            sample = 1
+
+        @asn1_dataclass
+        class Mode(Asn1Base):
+            kind: ModeInUse = ModeInUse.idle
+            data: Union[NullType, Sample] = NullType()
+
+        @asn1_dataclass
+        class Record(Asn1Base):
+            seq: int = 0
+            samples: Samples = field(default_factory=Samples)
+            mode: Mode = field(default_factory=Mode)
+            note: Optional[Sample] = None
+
+            class EncodeConstants:
+                REQUIRED_BYTES_FOR_ENCODING = 16
+
+            def is_constraint_valid(self) -> Asn1ConstraintValidResult:
+                return Asn1ConstraintValidResult(is_valid=self.seq < 1000, error_code=0 if self.seq < 1000 else 1)
+
+            def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+                codec.encode_constrained_whole_number(self.seq, 0, 65535)
+                codec.encode_constrained_whole_number(self.samples.nCount, 0, 7)
+                for sample in self.samples.arr:
+                    codec.encode_constrained_whole_number(sample.channel, 0, 15)
+                    codec.encode_constrained_whole_number(sample.value, 0, 4095)
+                    codec.append_bit(bool(sample.valid))
+
+            @classmethod
+            def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Record":
+                seq = codec.decode_constrained_whole_number(0, 65535).decoded_value
+                count = codec.decode_constrained_whole_number(0, 7).decoded_value
+                arr = [Sample(codec.decode_constrained_whole_number(0, 15).decoded_value,
+                              codec.decode_constrained_whole_number(0, 4095).decoded_value,
+                              Asn1Boolean(codec.read_bit().decoded_value)) for _ in range(count)]
+                return cls(seq, Samples(count, arr), Mode(ModeInUse.sample, arr[0]))
+
+        @asn1_dataclass
+        class CheckedRecord(Record):
+            def is_constraint_valid(self) -> Asn1ConstraintValidResult:
+                ret = super().is_constraint_valid()
+                return ret if not ret else Asn1ConstraintValidResult(is_valid=self.seq % 2 == 0, error_code=0 if self.seq % 2 == 0 else 2)
+    finally:
+        set_dataclass_slots(False)
+    return locals()
+
+
+@pytest.fixture(scope="module")
+def slotted() -> dict:
+    return _declare_types(True)
+
+
+def test_no_instance_dict(slotted: dict) -> None:
+    plain = _declare_types(False)
+    for name in ("Sample", "Samples", "Mode", "Record", "CheckedRecord"):
+        assert hasattr(plain[name](), "__dict__")
+        assert not hasattr(slotted[name](), "__dict__")
+    assert slotted["CheckedRecord"].__slots__ == ()
+
+
+def test_slotted_behaviour(slotted: dict) -> None:
+    Record, CheckedRecord, Sample = slotted["Record"], slotted["CheckedRecord"], slotted["Sample"]
+    record = CheckedRecord(seq=4)
+    assert record.__FIELDS__ == ("seq", "samples", "mode", "note")
+    assert record.is_constraint_valid() and not CheckedRecord(seq=3).is_constraint_valid()
+    assert not CheckedRecord(seq=2000).is_constraint_valid()
+    record.note = Sample(1, 2)
+    with pytest.raises(AttributeError):
+        record.extra = 1
+    assert copy.deepcopy(record) == record
+    assert Record.decode(Encoding.uPER, Record(7, slotted["Samples"](1, [Sample(3, 9)])).encode(Encoding.uPER)).seq == 7
+
+
+def _bytes_per_pdu(types: dict, data: bytearray, count: int) -> float:
+    Record = types["Record"]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [Record.decode(Encoding.uPER, data) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(records) == count
+    return (after - before) / count
+
+
+def test_memory_per_decoded_pdu(slotted: dict) -> None:
+    plain = _declare_types(False)
+    Sample, Samples = plain["Sample"], plain["Samples"]
+    data = plain["Record"](42, Samples(4, [Sample(i, 100 * i, Asn1Boolean(i % 2)) for i in range(4)])).encode(Encoding.uPER)
+
+    plain_bytes = _bytes_per_pdu(plain, data, 2000)
+    slotted_bytes = _bytes_per_pdu(slotted, data, 2000)
+    print(f"\nbytes per decoded PDU: dict {plain_bytes:.0f}, slots {slotted_bytes:.0f}")
+    assert slotted_bytes < 0.75 * plain_bytes
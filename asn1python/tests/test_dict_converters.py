@@ -0,0 +1,320 @@
+"""
+Unit tests for the to_dict()/from_dict() converters.
+
+The classes mimic what header_python.stg and the dictConverterFuncs hook of
+the Python backend generate for:
+
+    Color ::= ENUMERATED { red, green, blue }
+    Label ::= IA5String (SIZE(0..20))
+    Payload ::= OCTET STRING (SIZE(0..16))
+    Digest ::= OCTET STRING (SIZE(4))
+    Flags ::= BIT STRING (SIZE(0..8))
+    Samples ::= SEQUENCE (SIZE(0..10)) OF INTEGER (0..1000)
+    Point ::= SEQUENCE { x INTEGER, y INTEGER, ok BOOLEAN }
+    Points ::= SEQUENCE (SIZE(0..5)) OF Point
+    Body ::= CHOICE { point Point, label Label, other Label, empty NULL }
+    Message ::= SEQUENCE {
+        color Color, label Label, payload Payload, digest Digest, flags Flags,
+        samples Samples, points Points, body Body, ratio REAL,
+        note Label OPTIONAL, marker NULL OPTIONAL
+    }
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import field
+from enum import IntEnum
+from typing import Any, List, Optional, Union
+
+import pytest
+
+from asn1python.asn1_exceptions import Asn1InvalidValueException
+from asn1python.asn1_types import (
+    Asn1Base, Asn1BitString, Asn1Boolean, Asn1Choice, Asn1Enumerated, Asn1IA5String, Asn1OctetString,
+    Asn1SequenceOf, NullType, asn1_dataclass, set_sequence_of_arrays,
+)
+
+
+class Color_Enum(IntEnum):
+    red = 0
+    green = 1
+    blue = 2
+
+
+@asn1_dataclass
+class Color(Asn1Enumerated):
+    val: Color_Enum = Color_Enum.red
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return self.val.name if enum_names else int(self.val)
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Color':
+        return cls(val=Color_Enum[data] if enum_names else Color_Enum(data))
+
+
+@asn1_dataclass
+class Label(Asn1IA5String):
+    arr: str = ""
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return self.arr
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Label':
+        return cls(arr=data)
+
+
+@asn1_dataclass
+class Payload(Asn1OctetString):
+    nCount: int = 0
+    arr: bytes = b""
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return self.to_bytes().hex() if hex_octets else self.to_bytes()
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Payload':
+        arr = bytes.fromhex(data) if hex_octets else bytes(data)
+        return cls(nCount=len(arr), arr=arr)
+
+
+@asn1_dataclass
+class Digest(Asn1OctetString):
+    arr: bytes = b"\0\0\0\0"
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return self.to_bytes().hex() if hex_octets else self.to_bytes()
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Digest':
+        arr = bytes.fromhex(data) if hex_octets else bytes(data)
+        return cls(arr=arr)
+
+
+@asn1_dataclass
+class Flags(Asn1BitString):
+    nCount: int = 0
+    arr: bytes = b""
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return self.to_bit_str()
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Flags':
+        return cls(nCount=len(data), arr=cls.pack_bit_str(data))
+
+
+@asn1_dataclass
+class Samples(Asn1SequenceOf):
+    nCount: int = 0
+    arr: List[int] = field(default_factory=list)
+
+    ITEM_TYPECODE = "H"
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        items = self.arr[:self.nCount]
+        return items if type(items) is list else items.tolist()
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Samples':
+        items = list(data)
+        return cls(nCount=len(items), arr=items)
+
+
+@asn1_dataclass
+class Point(Asn1Base):
+    x: int = 0
+    y: int = 0
+    ok: Asn1Boolean = field(default_factory=lambda: Asn1Boolean(False))
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        d = {"x": self.x, "y": self.y, "ok": bool(self.ok)}
+        return d
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Point':
+        return cls(x=data["x"], y=data["y"], ok=Asn1Boolean(data["ok"]))
+
+
+@asn1_dataclass
+class Points(Asn1SequenceOf):
+    nCount: int = 0
+    arr: List[Point] = field(default_factory=list)
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        return [x.to_dict(enum_names, hex_octets) for x in self.arr[:self.nCount]]
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Points':
+        items = [Point.from_dict(x, enum_names, hex_octets) for x in data]
+        return cls(nCount=len(items), arr=items)
+
+
+class BodyInUse(IntEnum):
+    point = 0
+    label = 1
+    other = 2
+    empty = 3
+
+
+@asn1_dataclass
+class Body(Asn1Choice):
+    kind: BodyInUse = BodyInUse.point
+    data: Union[NullType, Point, Label, Label, NullType] = NullType()
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        kind = self.kind
+        if kind == BodyInUse.point:
+            return {"point": self.data.to_dict(enum_names, hex_octets)}
+        if kind == BodyInUse.label:
+            return {"label": self.data.to_dict(enum_names, hex_octets)}
+        if kind == BodyInUse.other:
+            return {"other": self.data.to_dict(enum_names, hex_octets)}
+        if kind == BodyInUse.empty:
+            return {"empty": None}
+        raise Asn1InvalidValueException(f"Invalid Body kind {kind!r}")
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Body':
+        if len(data) != 1:
+            raise Asn1InvalidValueException(f"A Body value needs exactly one alternative, got {list(data)!r}")
+        (name, value), = data.items()
+        if name == "point":
+            return cls(kind=BodyInUse.point, data=Point.from_dict(value, enum_names, hex_octets))
+        if name == "label":
+            return cls(kind=BodyInUse.label, data=Label.from_dict(value, enum_names, hex_octets))
+        if name == "other":
+            return cls(kind=BodyInUse.other, data=Label.from_dict(value, enum_names, hex_octets))
+        if name == "empty":
+            return cls(kind=BodyInUse.empty, data=NullType())
+        raise Asn1InvalidValueException(f"Unknown Body alternative {name!r}")
+
+
+@asn1_dataclass
+class Message(Asn1Base):
+    color: Color = field(default_factory=Color)
+    label: Label = field(default_factory=Label)
+    payload: Payload = field(default_factory=Payload)
+    digest: Digest = field(default_factory=Digest)
+    flags: Flags = field(default_factory=Flags)
+    samples: Samples = field(default_factory=Samples)
+    points: Points = field(default_factory=Points)
+    body: Body = field(default_factory=Body)
+    ratio: float = 0.0
+    note: Optional[Label] = None
+    marker: Optional[NullType] = None
+
+    def to_dict(self, enum_names: bool = True, hex_octets: bool = True) -> Any:
+        d = {"color": self.color.to_dict(enum_names, hex_octets), "label": self.label.to_dict(enum_names, hex_octets), "payload": self.payload.to_dict(enum_names, hex_octets), "digest": self.digest.to_dict(enum_names, hex_octets), "flags": self.flags.to_dict(enum_names, hex_octets), "samples": self.samples.to_dict(enum_names, hex_octets), "points": self.points.to_dict(enum_names, hex_octets), "body": self.body.to_dict(enum_names, hex_octets), "ratio": self.ratio}
+        if self.note is not None:
+            d["note"] = self.note.to_dict(enum_names, hex_octets)
+        if self.marker is not None:
+            d["marker"] = None
+        return d
+
+    @classmethod
+    def from_dict(cls, data: Any, enum_names: bool = True, hex_octets: bool = True) -> 'Message':
+        return cls(color=Color.from_dict(data["color"], enum_names, hex_octets), label=Label.from_dict(data["label"], enum_names, hex_octets), payload=Payload.from_dict(data["payload"], enum_names, hex_octets), digest=Digest.from_dict(data["digest"], enum_names, hex_octets), flags=Flags.from_dict(data["flags"], enum_names, hex_octets), samples=Samples.from_dict(data["samples"], enum_names, hex_octets), points=Points.from_dict(data["points"], enum_names, hex_octets), body=Body.from_dict(data["body"], enum_names, hex_octets), ratio=data["ratio"], note=(Label.from_dict(data["note"], enum_names, hex_octets) if "note" in data else None), marker=(NullType() if "marker" in data else None))
+
+
+@asn1_dataclass
+class SubColor(Color):
+    pass
+
+
+def _message() -> Message:
+    return Message(
+        color=Color(Color_Enum.blue),
+        label=Label("hello"),
+        payload=Payload(3, b"\x01\xab\xff"),
+        digest=Digest(b"\xde\xad\xbe\xef"),
+        flags=Flags(5, b"\xa8"),
+        samples=Samples(3, [1, 500, 1000]),
+        points=Points(2, [Point(1, 2, Asn1Boolean(True)), Point(-3, 4)]),
+        body=Body(BodyInUse.other, Label("alt")),
+        ratio=0.5,
+        marker=NullType(),
+    )
+
+
+def test_to_dict() -> None:
+    assert _message().to_dict() == {
+        "color": "blue",
+        "label": "hello",
+        "payload": "01abff",
+        "digest": "deadbeef",
+        "flags": "10101",
+        "samples": [1, 500, 1000],
+        "points": [{"x": 1, "y": 2, "ok": True}, {"x": -3, "y": 4, "ok": False}],
+        "body": {"other": "alt"},
+        "ratio": 0.5,
+        "marker": None,
+    }
+
+
+def test_round_trip() -> None:
+    message = _message()
+    assert Message.from_dict(message.to_dict()) == message
+    assert Message.from_dict(json.loads(json.dumps(message.to_dict()))) == message
+
+    plain = message.to_dict(enum_names=False, hex_octets=False)
+    assert plain["color"] == 2 and plain["payload"] == b"\x01\xab\xff"
+    assert Message.from_dict(plain, enum_names=False, hex_octets=False) == message
+
+
+def test_optional_children() -> None:
+    message = _message()
+    message.note = Label("n")
+    message.marker = None
+    plain = message.to_dict()
+    assert plain["note"] == "n" and "marker" not in plain
+    assert Message.from_dict(plain) == message
+
+
+@pytest.mark.parametrize("body", [
+    Body(BodyInUse.point, Point(7, 8)),
+    Body(BodyInUse.label, Label("a")),
+    Body(BodyInUse.other, Label("b")),
+    Body(BodyInUse.empty, NullType()),
+])
+def test_choice_alternatives(body: Body) -> None:
+    plain = body.to_dict()
+    assert list(plain) == [body.kind.name]
+    decoded = Body.from_dict(plain)
+    assert decoded.kind == body.kind and decoded == body
+
+
+def test_invalid_choice() -> None:
+    with pytest.raises(Asn1InvalidValueException):
+        Body.from_dict({})
+    with pytest.raises(Asn1InvalidValueException):
+        Body.from_dict({"point": {"x": 0, "y": 0, "ok": False}, "label": "x"})
+    with pytest.raises(Asn1InvalidValueException):
+        Body.from_dict({"unknown": 1})
+
+
+def test_leaf_types() -> None:
+    assert Color(Color_Enum.green).to_dict() == "green"
+    assert Color.from_dict("green") == Color(Color_Enum.green)
+    assert Color.from_dict(1, enum_names=False) == Color(Color_Enum.green)
+    assert Label.from_dict("x") == Label("x")
+    assert Flags.from_dict("1") == Flags(1, b"\x80")
+
+
+def test_typed_array_items() -> None:
+    set_sequence_of_arrays("array")
+    try:
+        samples = Samples.from_dict([3, 2, 1])
+        assert samples.arr.typecode == "H"
+        plain = samples.to_dict()
+        assert plain == [3, 2, 1] and type(plain) is list
+    finally:
+        set_sequence_of_arrays(None)
+
+
+def test_subtypes_and_runtime_types() -> None:
+    # Subtypes inherit the methods of their parent type
+    assert type(SubColor.from_dict("blue")) is SubColor
+    assert Asn1Boolean.from_dict(True) is Asn1Boolean(True) and Asn1Boolean(False).to_dict() is False
+    assert NullType.from_dict(None) == NullType() and NullType().to_dict() is None
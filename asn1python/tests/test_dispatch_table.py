@@ -0,0 +1,103 @@
+"""
+Unit tests for the cached dispatch tables used by generated ACN code.
+
+The generated code maps ACN encoding values to enumeration members, and ACN
+CHOICE determinant values to the decode functions of the alternatives, with one
+dictionary per type. The table must be built once per owner and key and then
+reused.
+"""
+from enum import IntEnum
+
+import pytest
+
+from asn1python.asn1_exceptions import Asn1InvalidValueException
+from asn1python.helper import dispatch_table
+
+
+class _Service(IntEnum):
+    housekeeping = 0
+    event = 1
+    test = 2
+
+
+class _OwnerA:
+    pass
+
+
+class _OwnerB:
+    pass
+
+
+def test_built_once_per_owner_and_key() -> None:
+    calls = []
+
+    def build() -> dict:
+        calls.append(1)
+        return {3: _Service.housekeeping, 5: _Service.event, 17: _Service.test}
+
+    first = dispatch_table(_OwnerA, "ERR_SERVICE_decode", build)
+    assert dispatch_table(_OwnerA, "ERR_SERVICE_decode", build) is first
+    assert len(calls) == 1
+
+    assert dispatch_table(_OwnerB, "ERR_SERVICE_decode", build) is not first
+    assert dispatch_table(_OwnerA, "ERR_SERVICE_encode", build) is not first
+    assert len(calls) == 3
+
+    assert first.get(17) is _Service.test
+    assert first.get(4) is None
+
+
+def test_enum_member_and_int_keys_agree() -> None:
+    table = dispatch_table(_OwnerA, "ERR_SERVICE_encode_values", lambda: {
+        _Service.housekeeping: 3,
+        _Service.event: 5,
+        _Service.test: 17,
+    })
+    assert table.get(_Service.event) == 5
+    assert table.get(2) == 17
+
+
+class _Packet:
+    """Mimics the decoding the Python backend generates for a CHOICE selected by a
+    determinant: one classmethod per alternative and a table from the value to it."""
+
+    def __init__(self, kind: str, data: int) -> None:
+        self.kind = kind
+        self.data = data
+
+    @classmethod
+    def decode_acn(cls, codec: list, check_constraints: bool = True, service: int = 0) -> "_Packet":
+        packet_decode = dispatch_table(cls, "ERR_PACKET_alternatives", lambda: {
+            3: cls._decode_acn_housekeeping,
+            5: cls._decode_acn_event,
+        }).get(service)
+        if packet_decode is None:
+            raise Asn1InvalidValueException("No matching choice alternative (Error 42)")
+        packet = packet_decode(codec, check_constraints, service)
+        return packet
+
+    @classmethod
+    def _decode_acn_housekeeping(cls, codec: list, check_constraints: bool, service: int) -> "_Packet":
+        instance_housekeeping = codec.pop(0)
+        return cls(kind="housekeeping", data=instance_housekeeping)
+
+    @classmethod
+    def _decode_acn_event(cls, codec: list, check_constraints: bool, service: int) -> "_Packet":
+        instance_event = codec.pop(0) * 2
+        return cls(kind="event", data=instance_event)
+
+
+class _DerivedPacket(_Packet):
+    pass
+
+
+def test_choice_alternatives_by_determinant() -> None:
+    packet = _Packet.decode_acn([7], service=5)
+    assert (packet.kind, packet.data) == ("event", 14)
+    assert _Packet.decode_acn([7], service=3).kind == "housekeeping"
+    with pytest.raises(Asn1InvalidValueException):
+        _Packet.decode_acn([7], service=4)
+
+    # The functions in the table are bound to the class the table belongs to
+    assert type(_DerivedPacket.decode_acn([1], service=3)) is _DerivedPacket
+    assert type(_Packet.decode_acn([1], service=3)) is _Packet
@@ -0,0 +1,59 @@
+"""
+Unit tests for the whole-value big/little-endian integer paths.
+
+Endian integers are written and read as one block of bytes. These tests check
+the exact byte layout at byte aligned and unaligned positions against
+int.to_bytes, and that the surrounding bits are left untouched.
+"""
+import random
+
+import pytest
+
+from asn1python.acn_decoder import ACNDecoder
+from asn1python.acn_encoder import ACNEncoder
+
+
+@pytest.mark.parametrize("order", ["big", "little"])
+@pytest.mark.parametrize("is_signed", [False, True])
+@pytest.mark.parametrize("offset", [0, 3])
+@pytest.mark.parametrize("num_bits", [16, 32, 64])
+def test_layout_matches_to_bytes(seed: int, order: str, is_signed: bool, offset: int, num_bits: int) -> None:
+    if is_signed:
+        value = random.randint(-(1 << (num_bits - 1)), (1 << (num_bits - 1)) - 1)
+    else:
+        value = random.randint(0, (1 << num_bits) - 1)
+
+    encoder = ACNEncoder.of_size(16)
+    for _ in range(offset):
+        assert encoder.append_bit(True).success
+    if is_signed:
+        encode = encoder.enc_int_twos_complement_const_size_big_endian if order == "big" else encoder.enc_int_twos_complement_const_size_little_endian
+    else:
+        encode = encoder.enc_int_positive_integer_const_size_big_endian if order == "big" else encoder.enc_int_positive_integer_const_size_little_endian
+    result = encode(value, num_bits)
+    assert result.success and result.bits_encoded == num_bits
+    assert encoder.bit_index == offset + num_bits
+
+    expected = int.from_bytes(value.to_bytes(num_bits // 8, order, signed=is_signed), "big")
+    total_bits = offset + num_bits
+    written = int.from_bytes(encoder.get_bitstream_buffer()[:(total_bits + 7) // 8], "big")
+    written >>= (8 - total_bits % 8) % 8
+    assert written == (((1 << offset) - 1) << num_bits) | expected
+
+    decoder = ACNDecoder.from_buffer(bytearray(encoder.get_bitstream_buffer()))
+    if offset:
+        assert decoder.read_bits(offset).success
+    if is_signed:
+        decode = decoder.dec_int_twos_complement_const_size_big_endian if order == "big" else decoder.dec_int_twos_complement_const_size_little_endian
+    else:
+        decode = decoder.dec_int_positive_integer_const_size_big_endian if order == "big" else decoder.dec_int_positive_integer_const_size_little_endian
+    decoded = decode(num_bits)
+    assert decoded.success and decoded.bits_consumed == num_bits
+    assert decoded.decoded_value == value
+
+
+def test_insufficient_space() -> None:
+    encoder = ACNEncoder.of_size(3)
+    assert encoder.append_bit(True).success
+    assert not encoder.enc_int_positive_integer_const_size_little_endian(1, 32).success
+    assert not ACNDecoder.from_buffer(bytearray(3)).dec_int_twos_complement_const_size_big_endian(32).success
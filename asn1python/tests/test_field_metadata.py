@@ -0,0 +1,47 @@
+"""
+Unit tests for the per-class field metadata of Asn1Base subclasses.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from asn1python.asn1_types import Asn1Base, Asn1Boolean, NullType
+
+
+@dataclass
+class Item(Asn1Base):
+    flag: Asn1Boolean = field(default_factory=lambda: Asn1Boolean(False))
+
+
+@dataclass
+class Message(Asn1Base):
+    item: Item = field(default_factory=Item)
+    note: Optional[Item] = None
+    items: List[Item] = field(default_factory=list)
+
+
+@dataclass
+class DerivedMessage(Message):
+    pass
+
+
+def test_class_attributes() -> None:
+    assert Message.__FIELDS__ == ("item", "note", "items")
+    assert Message.__TYPES__ == ("Item", "Optional[Item]", "List[Item]")
+    assert Message.__OPTIONAL__ == (False, True, False)
+    assert Message.__CHILD_CLASSES__ == (Item, Item, List[Item])
+    assert Message().__FIELDS__ is Message.__FIELDS__
+
+
+def test_cached_per_class() -> None:
+    names = Item.__FIELDS__
+    assert "__FIELDS__" in vars(Item) and Item.__FIELDS__ is names
+    assert DerivedMessage.__FIELDS__ == Message.__FIELDS__
+    assert Item.__FIELDS__ == ("flag",)
+
+
+def test_primitive_wrappers_are_empty() -> None:
+    assert Asn1Boolean.__FIELDS__ == ()
+    assert NullType().__TYPES__ == ()
+    assert Asn1Boolean(True).__CHILD_CLASSES__ == ()
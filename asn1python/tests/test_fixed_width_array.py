@@ -0,0 +1,63 @@
+"""
+Unit tests for the bulk fixed-width array paths.
+
+SEQUENCE OF items that are fixed-width integers or IEEE 754 reals are encoded
+and decoded with one struct call. These tests check the byte layout against
+the per-item encoders at aligned and unaligned positions.
+"""
+import random
+import struct
+
+import pytest
+
+from asn1python.acn_decoder import ACNDecoder
+from asn1python.acn_encoder import ACNEncoder
+
+
+def _random_items(item_format: str, count: int) -> list:
+    code = item_format[1]
+    if code in "fd":
+        return [struct.unpack(item_format, struct.pack(item_format, random.uniform(-1e6, 1e6)))[0] for _ in range(count)]
+    n_bits = struct.calcsize(item_format) * 8
+    if code.islower():
+        return [random.randint(-(1 << (n_bits - 1)), (1 << (n_bits - 1)) - 1) for _ in range(count)]
+    return [random.randint(0, (1 << n_bits) - 1) for _ in range(count)]
+
+
+@pytest.mark.parametrize("item_format", [">B", ">b", ">H", "<H", ">i", "<i", ">Q", "<q", ">f", "<d"])
+@pytest.mark.parametrize("offset", [0, 5])
+def test_round_trip_matches_item_encoders(seed: int, item_format: str, offset: int) -> None:
+    items = _random_items(item_format, 50)
+
+    encoder = ACNEncoder.of_size(1024)
+    for _ in range(offset):
+        assert encoder.append_bit(True).success
+    result = encoder.enc_fixed_width_array(items, len(items), item_format)
+    assert result.success and result.bits_encoded == len(items) * struct.calcsize(item_format) * 8
+
+    reference = ACNEncoder.of_size(1024)
+    for _ in range(offset):
+        assert reference.append_bit(True).success
+    assert reference.append_byte_array(bytearray(struct.pack(f"{item_format[0]}{len(items)}{item_format[1:]}", *items)), len(items) * struct.calcsize(item_format)).success
+    assert encoder.get_bitstream_buffer() == reference.get_bitstream_buffer()
+
+    decoder = ACNDecoder.from_buffer(bytearray(encoder.get_bitstream_buffer()))
+    if offset:
+        assert decoder.read_bits(offset).success
+    decoded = decoder.dec_fixed_width_array(len(items), item_format)
+    assert decoded.success and decoded.decoded_value == items
+    assert decoder.bit_index == encoder.bit_index
+
+
+def test_encodes_first_count_items() -> None:
+    encoder = ACNEncoder.of_size(16)
+    assert encoder.enc_fixed_width_array([1, 2, 3, 4], 2, ">H").success
+    assert bytes(encoder.get_bitstream_buffer()) == b"\x00\x01\x00\x02"
+
+
+def test_errors() -> None:
+    encoder = ACNEncoder.of_size(16)
+    assert not encoder.enc_fixed_width_array([-1], 1, ">H").success
+    assert not encoder.enc_fixed_width_array([1e300], 1, ">f").success
+    assert not ACNEncoder.of_size(2).enc_fixed_width_array([1, 2], 2, ">H").success
+    assert not ACNDecoder.from_buffer(bytearray(3)).dec_fixed_width_array(2, ">H").success
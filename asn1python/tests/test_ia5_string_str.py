@@ -0,0 +1,84 @@
+"""
+Unit tests for the str-backed IA5String types and the packed uPER character codec.
+
+The class mimics what header_python.stg and the uPER string bulk body generate
+for a variable-size IA5String.
+"""
+import sys
+
+import pytest
+
+from asn1python.asn1_types import Asn1IA5String, asn1_dataclass
+from asn1python.codec import Encoding, ERROR_INSUFFICIENT_DATA
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+DIGITS = b" 0123456789"
+
+
+@asn1_dataclass
+class Name(Asn1IA5String):
+    arr: str = ""
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 60
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        nStringLength = len(self.arr)
+        assert codec.encode_constrained_whole_number(nStringLength, 0, 64)
+        assert codec.encode_string_char_index(self.arr, nStringLength)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Name":
+        nStringLength = codec.decode_constrained_whole_number(0, 64).decoded_value
+        return cls(codec.decode_string_char_index(nStringLength).decoded_value)
+
+
+def _per_char(text: str, char_set: bytes = bytes(range(128))) -> bytearray:
+    encoder = UPEREncoder.of_size(64)
+    last = len(char_set) - 1
+    for c in text.encode("ascii"):
+        encoder.encode_constrained_whole_number(char_set.index(c), 0, last)
+    return encoder.get_bitstream_buffer()
+
+
+@pytest.mark.parametrize("text", ["", "A", "hello, world", "\x01~" * 20])
+def test_packed_7bit_matches_per_char_layout(text: str) -> None:
+    encoder = UPEREncoder.of_size(64)
+    res = encoder.encode_string_char_index(text, len(text))
+    assert res and res.bits_encoded == 7 * len(text)
+    assert encoder.get_bitstream_buffer() == _per_char(text)
+
+    decoded = UPERDecoder.from_buffer(encoder.get_bitstream_buffer()).decode_string_char_index(len(text))
+    assert decoded.decoded_value == text
+
+
+def test_permitted_alphabet() -> None:
+    encoder = UPEREncoder.of_size(16)
+    assert encoder.encode_string_char_index("2024 10", 7, DIGITS)
+    assert encoder.get_bitstream_buffer() == _per_char("2024 10", DIGITS)
+    decoder = UPERDecoder.from_buffer(encoder.get_bitstream_buffer())
+    assert decoder.decode_string_char_index(7, DIGITS).decoded_value == "2024 10"
+
+    assert not UPEREncoder.of_size(16).encode_string_char_index("12a", 3, DIGITS)
+
+
+def test_invalid_input() -> None:
+    assert not UPEREncoder.of_size(8).encode_string_char_index("abc", 4)
+    assert not UPEREncoder.of_size(8).encode_string_char_index("café", 4)
+    result = UPERDecoder.from_buffer(bytearray(2)).decode_string_char_index(3)
+    assert not result and result.error_code == ERROR_INSUFFICIENT_DATA
+
+
+def test_round_trip_and_list_compatibility() -> None:
+    name = Name("telemetry downlink")
+    assert Name.decode(Encoding.uPER, name.encode(Encoding.uPER)) == name
+    assert str(name) == "telemetry downlink"
+
+    legacy = Name([ord(c) for c in "abc"] + [0, 0])
+    assert legacy.arr == "abc"
+    assert legacy.as_list() == [0x61, 0x62, 0x63]
+
+
+def test_str_is_smaller_than_code_list() -> None:
+    text = "x" * 200
+    assert sys.getsizeof(Name(text).arr) * 5 < sys.getsizeof([ord(c) for c in text])
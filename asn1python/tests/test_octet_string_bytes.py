@@ -0,0 +1,91 @@
+"""
+Unit tests for the bytes-backed OCTET STRING types.
+
+The classes mimic what header_python.stg and uper_python.stg generate for a
+fixed-size and a variable-size OCTET STRING.
+"""
+import copy
+import pickle
+
+import pytest
+
+from asn1python.asn1_types import Asn1OctetString, asn1_dataclass
+from asn1python.codec import Encoding
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+
+@asn1_dataclass
+class Key(Asn1OctetString):
+    arr: bytes = b""
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 4
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        assert codec.encode_octet_string_no_length(self.arr, 4)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Key":
+        return cls(codec.decode_octet_string_no_length_view(4).decoded_value)
+
+
+@asn1_dataclass
+class Payload(Asn1OctetString):
+    nCount: int = 0
+    arr: bytes = b""
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 64
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        codec.encode_constrained_whole_number(self.nCount, 0, 60)
+        assert codec.encode_octet_string_no_length(self.arr, self.nCount)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Payload":
+        n_count = codec.decode_constrained_whole_number(0, 60).decoded_value
+        return cls(n_count, codec.decode_octet_string_no_length_view(n_count).decoded_value)
+
+
+def test_aligned_decode_is_a_view() -> None:
+    data = Key(b"\x01\x02\x03\x04").encode(Encoding.uPER)
+    key = Key.decode(Encoding.uPER, data)
+    assert isinstance(key.arr, memoryview) and key.arr.readonly
+    assert key == Key(b"\x01\x02\x03\x04")
+    assert key.to_bytes() == b"\x01\x02\x03\x04"
+
+
+def test_unaligned_decode_copies() -> None:
+    payload = Payload(3, b"abc")
+    data = payload.encode(Encoding.uPER)
+    assert len(data) == 4
+    decoded = Payload.decode(Encoding.uPER, data)
+    assert isinstance(decoded.arr, bytes)
+    assert decoded == payload
+
+
+@pytest.mark.parametrize("arr", [b"\xaa\xbb\xcc\x00", bytearray(b"\xaa\xbb\xcc\x00"),
+                                 memoryview(b"\xaa\xbb\xcc\x00"), [0xAA, 0xBB, 0xCC, 0x00]])
+def test_bulk_encode_accepts_bytes_like_and_lists(arr) -> None:
+    assert Key(arr).encode(Encoding.uPER) == bytearray(b"\xaa\xbb\xcc\x00")
+    assert Payload.decode(Encoding.uPER, Payload(2, arr).encode(Encoding.uPER)).as_list() == [0xAA, 0xBB]
+
+
+def test_encode_rejects_short_data() -> None:
+    encoder = UPEREncoder.of_size(4)
+    assert not encoder.encode_octet_string_no_length(b"\x01", 2)
+
+
+def test_list_compatibility() -> None:
+    payload = Payload(2, [1, 2, 0])
+    assert isinstance(payload.arr, bytearray)
+    payload.arr[1] = 7
+    assert payload.as_list() == [1, 7]
+    assert payload == Payload(2, b"\x01\x07\x00")
+
+
+def test_copy_and_pickle_of_decoded_value() -> None:
+    key = Key.decode(Encoding.uPER, Key(b"wxyz").encode(Encoding.uPER))
+    for clone in (copy.deepcopy(key), copy.copy(key), pickle.loads(pickle.dumps(key))):
+        assert clone == key
+        assert isinstance(clone.arr, bytes)
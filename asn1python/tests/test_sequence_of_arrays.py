@@ -0,0 +1,135 @@
+"""
+Unit tests for the typed-array SEQUENCE OF representation and the packed uPER
+whole number array codec.
+
+The class mimics what header_python.stg and the uPER SEQUENCE OF bulk body
+generate for a variable-size SEQUENCE OF INTEGER (-1000..1000).
+"""
+import copy
+import pickle
+import sys
+from array import array
+from dataclasses import field
+from typing import List
+
+import pytest
+
+from asn1python.asn1_types import Asn1SequenceOf, asn1_dataclass, set_sequence_of_arrays
+from asn1python.codec import Encoding, ERROR_CONSTRAINT_VIOLATION, ERROR_INSUFFICIENT_DATA
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+
+@asn1_dataclass
+class Readings(Asn1SequenceOf):
+    nCount: int = 0
+    arr: List[int] = field(default_factory=list)
+
+    ITEM_TYPECODE = "h"
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 400
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        assert codec.encode_constrained_whole_number(self.nCount, 0, 300)
+        assert codec.encode_constrained_whole_number_array(self.arr, self.nCount, -1000, 1000)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Readings":
+        n_count = codec.decode_constrained_whole_number(0, 300).decoded_value
+        return cls(n_count, codec.decode_constrained_whole_number_array(n_count, -1000, 1000, "h").decoded_value)
+
+
+@pytest.fixture
+def array_mode():
+    set_sequence_of_arrays("array")
+    yield
+    set_sequence_of_arrays(None)
+
+
+def _per_item(values: List[int], min_val: int, max_val: int) -> bytearray:
+    encoder = UPEREncoder.of_size(1024)
+    for v in values:
+        encoder.encode_constrained_whole_number(v, min_val, max_val)
+    return encoder.get_bitstream_buffer()
+
+
+@pytest.mark.parametrize("min_val,max_val,typecode", [
+    (0, 1, "B"), (0, 255, "B"), (-5, 250, "h"), (0, 65535, "H"),
+    (-1000, 1000, "h"), (-2**31, 2**31 - 1, "i"), (0, 2**64 - 1, "Q"),
+])
+def test_packed_items_match_per_item_layout(min_val: int, max_val: int, typecode: str) -> None:
+    values = [min_val, max_val, (min_val + max_val) // 2, min_val + 1, max_val - 1] * 7
+    encoder = UPEREncoder.of_size(1024)
+    res = encoder.encode_constrained_whole_number_array(values, len(values), min_val, max_val)
+    assert res and res.bits_encoded == len(values) * (max_val - min_val).bit_length()
+    assert encoder.get_bitstream_buffer() == _per_item(values, min_val, max_val)
+
+    decoder = UPERDecoder.from_buffer(encoder.get_bitstream_buffer())
+    decoded = decoder.decode_constrained_whole_number_array(len(values), min_val, max_val, typecode).decoded_value
+    assert decoded == array(typecode, values)
+
+
+def test_invalid_input() -> None:
+    assert not UPEREncoder.of_size(8).encode_constrained_whole_number_array([1, 2], 3, 0, 7)
+    res = UPEREncoder.of_size(8).encode_constrained_whole_number_array([1, 9], 2, 0, 7)
+    assert not res and res.error_code == ERROR_CONSTRAINT_VIOLATION
+
+    # 3 bits per item of 0..5, but 7 is out of range
+    res = UPERDecoder.from_buffer(bytearray([0b11100000])).decode_constrained_whole_number_array(1, 0, 5, "B")
+    assert not res and res.error_code == ERROR_CONSTRAINT_VIOLATION
+    res = UPERDecoder.from_buffer(bytearray(1)).decode_constrained_whole_number_array(3, 0, 5, "B")
+    assert not res and res.error_code == ERROR_INSUFFICIENT_DATA
+
+
+def test_lists_by_default() -> None:
+    readings = Readings.decode(Encoding.uPER, Readings(3, [-1000, 0, 1000]).encode(Encoding.uPER))
+    assert type(readings.arr) is list
+    assert readings == Readings(3, [-1000, 0, 1000])
+
+
+def test_array_mode(array_mode) -> None:
+    readings = Readings(4, [5, -5, 999, -1000])
+    assert readings.arr == array("h", [5, -5, 999, -1000])
+
+    decoded = Readings.decode(Encoding.uPER, readings.encode(Encoding.uPER))
+    assert isinstance(decoded.arr, array) and decoded.arr.typecode == "h"
+    assert decoded == readings
+    assert Readings().arr == array("h")
+
+    for clone in (copy.deepcopy(decoded), pickle.loads(pickle.dumps(decoded))):
+        assert clone == readings
+
+
+def test_equality_across_representations(array_mode) -> None:
+    as_array = Readings(2, [1, 2])
+    set_sequence_of_arrays(None)
+    as_list = Readings(2, [1, 2])
+    assert as_array == as_list and as_list == as_array
+    assert as_array != Readings(2, [1, 3])
+
+
+def test_unknown_representation() -> None:
+    with pytest.raises(ValueError):
+        set_sequence_of_arrays("tuple")
+
+
+def test_numpy_mode() -> None:
+    numpy = pytest.importorskip("numpy")
+    set_sequence_of_arrays("numpy")
+    try:
+        readings = Readings.decode(Encoding.uPER, Readings(3, [7, -7, 0]).encode(Encoding.uPER))
+        assert isinstance(readings.arr, numpy.ndarray) and readings.arr.dtype == numpy.int16
+        assert readings == Readings(3, [7, -7, 0])
+        assert readings != Readings(3, [7, -7, 1])
+    finally:
+        set_sequence_of_arrays(None)
+
+
+def test_large_array_uses_item_size_per_element() -> None:
+    values = array("q", range(-50000, 50000))
+    encoder = UPEREncoder.empty()
+    assert encoder.encode_constrained_whole_number_array(values, len(values), -2**31, 2**31 - 1)
+    decoder = UPERDecoder.from_buffer(encoder.get_bitstream_buffer())
+    decoded = decoder.decode_constrained_whole_number_array(len(values), -2**31, 2**31 - 1, "q").decoded_value
+    assert decoded == values
+    assert sys.getsizeof(decoded) < 8 * len(values) + 100
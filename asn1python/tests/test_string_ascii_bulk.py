@@ -0,0 +1,86 @@
+"""
+Unit tests for the whole-string ASCII paths.
+
+The ASCII string codecs read and write the string as one block of bytes.
+These tests cover byte aligned and unaligned positions, the terminator
+search of the null terminated variants and the ASCII range check.
+"""
+import pytest
+
+from asn1python.acn_encoder import ACNEncoder
+from asn1python.acn_decoder import ACNDecoder
+from asn1python.bitstream import BitStream, BitStreamError
+
+
+@pytest.mark.parametrize("offset", [0, 1, 3, 7])
+def test_bytes_round_trip_at_bit_offset(offset: int) -> None:
+    stream = BitStream(bytearray(b"\xff" * 8))
+    stream.set_bit_index(offset)
+    stream.write_bytes(b"\x00ABC\x80")
+    assert stream.current_used_bits == offset + 40
+
+    stream.set_bit_index(offset)
+    assert stream.read_bytes(5) == b"\x00ABC\x80"
+    stream.set_bit_index(0)
+    assert stream.read_bits_wide(offset) == (1 << offset) - 1
+
+
+def test_bytes_bounds() -> None:
+    stream = BitStream(bytearray(2))
+    with pytest.raises(BitStreamError):
+        stream.write_bytes(b"abc")
+    with pytest.raises(BitStreamError):
+        stream.read_bytes(3)
+
+
+@pytest.mark.parametrize("offset", [0, 5])
+def test_fix_size_unaligned(acn_encoder: ACNEncoder, offset: int) -> None:
+    for _ in range(offset):
+        assert acn_encoder.append_bit(True).success
+    result = acn_encoder.enc_string_ascii_fix_size(8, "abc")
+    assert result.success
+    assert result.bits_encoded == 64
+
+    decoder = acn_encoder.get_decoder()
+    if offset:
+        assert decoder.read_bits(offset).success
+    decoded = decoder.dec_string_ascii_fix_size(8)
+    assert decoded.success
+    assert decoded.decoded_value == "abc" + "\x00" * 5
+    assert decoded.bits_consumed == 64
+
+
+def test_null_terminated_stops_at_terminator() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray(b"hello\x00world\x00"))
+    first = decoder.dec_string_ascii_null_terminated(10, 0)
+    second = decoder.dec_string_ascii_null_terminated(10, 0)
+    assert (first.decoded_value, first.bits_consumed) == ("hello", 48)
+    assert (second.decoded_value, second.bits_consumed) == ("world", 48)
+
+
+def test_null_terminated_without_terminator_reads_max_len_plus_one() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray(b"abcdefg"))
+    result = decoder.dec_string_ascii_null_terminated(3, 0)
+    assert result.success
+    assert result.decoded_value == "abcd"
+    assert decoder.dec_string_ascii_fix_size(3).decoded_value == "efg"
+
+
+def test_null_terminated_insufficient_data() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray(b"abc"))
+    assert not decoder.dec_string_ascii_null_terminated(10, 0).success
+
+
+def test_null_terminated_mult_window() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray(b"ab\r\ncd\r\n"))
+    first = decoder.dec_string_ascii_null_terminated_mult(10, bytearray(b"\r\n"))
+    second = decoder.dec_string_ascii_null_terminated_mult(10, bytearray(b"\r\n"))
+    assert (first.decoded_value, first.bits_consumed) == ("ab", 32)
+    assert (second.decoded_value, second.bits_consumed) == ("cd", 32)
+
+
+def test_non_ascii_byte_rejected() -> None:
+    decoder = ACNDecoder.from_buffer(bytearray(b"ab\xe9d"))
+    result = decoder.dec_string_ascii_fix_size(4)
+    assert not result.success
+    assert "position 2" in result.error_message
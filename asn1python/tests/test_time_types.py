@@ -0,0 +1,130 @@
+"""
+Unit tests for the immutable time types and their datetime/epoch conversions.
+"""
+import copy
+import pickle
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+from asn1python.asn1_types import (
+    Asn1Date, Asn1DateLocalTime, Asn1DateTimeWithTimeZone, Asn1DateUtcTime,
+    Asn1LocalTime, Asn1TimeWithTimeZone, Asn1TimeZone, Asn1UtcTime,
+)
+from asn1python.asn1_exceptions import Asn1InvalidValueException
+
+PLUS_0130 = Asn1TimeZone(1, 1, 30)
+
+
+def _values():
+    return [
+        Asn1TimeZone(-1, 5, 0),
+        Asn1Date(2024, 2, 29),
+        Asn1LocalTime(23, 59, 59, 999),
+        Asn1UtcTime(0, 0, 1),
+        Asn1TimeWithTimeZone(12, 30, 0, 5, PLUS_0130),
+        Asn1DateLocalTime(Asn1Date(1999, 12, 31), Asn1LocalTime(23, 59, 59)),
+        Asn1DateUtcTime(Asn1Date(1970, 1, 1), Asn1UtcTime(0, 0, 0, 1)),
+        Asn1DateTimeWithTimeZone(Asn1Date(2000, 1, 1), Asn1TimeWithTimeZone(1, 2, 3, 4, PLUS_0130)),
+    ]
+
+
+@pytest.mark.parametrize("value", _values(), ids=lambda v: type(v).__name__)
+def test_immutable_hashable_and_picklable(value) -> None:
+    with pytest.raises(AttributeError):
+        value.hours = 1
+    with pytest.raises(AttributeError):
+        del value._FIELDS
+    assert not hasattr(value, "__dict__")
+
+    for clone in (copy.copy(value), copy.deepcopy(value), pickle.loads(pickle.dumps(value))):
+        assert clone == value and type(clone) is type(value)
+        assert hash(clone) == hash(value)
+    assert len({value, copy.deepcopy(value)}) == 1
+
+
+def test_equality_is_per_type() -> None:
+    assert Asn1LocalTime(1, 2, 3) == Asn1LocalTime(1, 2, 3)
+    assert Asn1LocalTime(1, 2, 3) != Asn1UtcTime(1, 2, 3)
+    assert Asn1LocalTime(1, 2, 3) != Asn1LocalTime(1, 2, 3, 1)
+    assert Asn1Date(2000, 1, 1) != (2000, 1, 1)
+
+
+def test_validation() -> None:
+    with pytest.raises(Asn1InvalidValueException):
+        Asn1LocalTime(24, 0, 0)
+    with pytest.raises(Asn1InvalidValueException):
+        Asn1Date(2023, 13, 1)
+    with pytest.raises(Asn1InvalidValueException):
+        Asn1TimeZone(1, 24, 0)
+
+
+def test_epoch_round_trip_matches_datetime() -> None:
+    rng = random.Random(48)
+    for _ in range(2000):
+        us = rng.randrange(-2**52, 2**52)  # +-142 years, where a float keeps microseconds exact
+        expected = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=us)
+        value = Asn1DateUtcTime.from_epoch(us / 10**6, fraction_digits=6)
+        assert value.to_datetime(6) == expected
+        assert value.to_epoch(6) == us / 10**6
+
+        us = rng.randrange(-62135596800 * 10**6, 253402300799 * 10**6)
+        expected = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=us)
+        value = Asn1DateUtcTime._from_epoch_us(us, 6)
+        assert value.to_datetime(6) == expected and value._to_epoch_us(6) == us
+
+        day = us // (86400 * 10**6)
+        assert Asn1Date.from_epoch(day * 86400).to_date() == date(1970, 1, 1) + timedelta(days=day)
+
+
+def test_fraction_digits() -> None:
+    value = Asn1LocalTime.from_time(time(1, 2, 3, 456789), fraction_digits=3)
+    assert value == Asn1LocalTime(1, 2, 3, 456)
+    assert value.to_time(fraction_digits=3) == time(1, 2, 3, 456000)
+    assert Asn1LocalTime(0, 0, 0, 123456789).to_time(fraction_digits=9) == time(0, 0, 0, 123456)
+    assert Asn1DateUtcTime.from_epoch(1.25, fraction_digits=2).time == Asn1UtcTime(0, 0, 1, 25)
+    assert Asn1DateUtcTime.from_epoch(1.25, fraction_digits=2).to_epoch(fraction_digits=2) == 1.25
+
+
+def test_time_zones() -> None:
+    assert PLUS_0130.offset_seconds() == 5400
+    assert Asn1TimeZone.from_offset_seconds(-3600) == Asn1TimeZone(-1, 1, 0)
+    assert Asn1TimeZone.from_tzinfo(PLUS_0130.to_tzinfo()) == PLUS_0130
+
+    aware = datetime(2020, 6, 1, 12, 0, 0, tzinfo=PLUS_0130.to_tzinfo())
+    with_tz = Asn1DateTimeWithTimeZone.from_datetime(aware)
+    assert with_tz.time.tz == PLUS_0130 and with_tz.to_datetime() == aware
+    assert with_tz.to_epoch() == aware.timestamp()
+    assert Asn1DateTimeWithTimeZone.from_epoch(aware.timestamp(), tz=PLUS_0130) == with_tz
+    assert Asn1DateTimeWithTimeZone.from_epoch(0).time.tz == Asn1TimeZone(1, 0, 0)
+
+    utc = Asn1DateUtcTime.from_datetime(aware)
+    assert utc == Asn1DateUtcTime(Asn1Date(2020, 6, 1), Asn1UtcTime(10, 30, 0))
+    assert Asn1UtcTime.from_time(time(1, 0, tzinfo=PLUS_0130.to_tzinfo())) == Asn1UtcTime(23, 30, 0)
+
+    with pytest.raises(Asn1InvalidValueException):
+        Asn1DateTimeWithTimeZone.from_datetime(datetime(2020, 6, 1))
+
+    local = Asn1DateLocalTime.from_datetime(datetime(2020, 6, 1, 12, 0))
+    assert local.to_epoch() == datetime(2020, 6, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+def test_batch_conversions() -> None:
+    seconds = [0, 86399.5, -1, 1700000000]
+    values = Asn1DateUtcTime.from_epochs(seconds, fraction_digits=1)
+    assert values == [Asn1DateUtcTime.from_epoch(s, fraction_digits=1) for s in seconds]
+    assert Asn1DateUtcTime.to_epochs(values, fraction_digits=1) == seconds
+    assert Asn1Date.to_epochs(Asn1Date.from_epochs([0, 86400])) == [0, 86400]
+
+    in_zone = Asn1DateTimeWithTimeZone.from_epochs(seconds, tz=PLUS_0130)
+    assert all(v.time.tz == PLUS_0130 for v in in_zone)
+    assert Asn1DateTimeWithTimeZone.to_epochs(in_zone) == [0, 86399, -1, 1700000000]
+
+
+def test_datetime64() -> None:
+    numpy = pytest.importorskip("numpy")
+    stamps = numpy.array(["1970-01-01T00:00:00.5", "2024-02-29T23:59:59.25"], dtype="datetime64[ms]")
+    values = Asn1DateUtcTime.from_datetime64(stamps, fraction_digits=3)
+    assert values[1] == Asn1DateUtcTime(Asn1Date(2024, 2, 29), Asn1UtcTime(23, 59, 59, 250))
+    assert (Asn1DateUtcTime.to_datetime64(values, fraction_digits=3) == stamps).all()
@@ -0,0 +1,127 @@
+"""
+Unit tests for pickling generated types through their uPER encoding.
+
+The classes mimic what the Python backend generates for:
+
+    Mode ::= ENUMERATED { idle, busy }
+    Report ::= SEQUENCE { id INTEGER (0..65535), ok BOOLEAN, mode Mode, values SEQUENCE (SIZE(0..50)) OF INTEGER (0..255) }
+"""
+import copy
+import copyreg
+import pickle
+import sys
+from dataclasses import field
+from enum import IntEnum
+from typing import List
+
+import pytest
+
+from asn1python.asn1_types import (
+    Asn1Base, Asn1Boolean, Asn1Enumerated, NullType, asn1_dataclass,
+    register_uper_pickling, set_uper_pickling,
+)
+from asn1python.codec import Encoding
+from asn1python.codec_uper import UPEREncoder, UPERDecoder
+
+
+class Mode_Enum(IntEnum):
+    idle = 0
+    busy = 1
+
+
+@asn1_dataclass
+class Mode(Asn1Enumerated):
+    val: Mode_Enum = Mode_Enum.idle
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 1
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        assert codec.encode_constrained_whole_number(int(self.val), 0, 1)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Mode":
+        return cls(Mode_Enum(codec.decode_constrained_whole_number(0, 1).decoded_value))
+
+
+@asn1_dataclass
+class Report(Asn1Base):
+    id: int = 0
+    ok: Asn1Boolean = field(default_factory=lambda: Asn1Boolean(False))
+    mode: Mode = field(default_factory=Mode)
+    values: List[int] = field(default_factory=list)
+
+    class EncodeConstants:
+        REQUIRED_BYTES_FOR_ENCODING = 60
+
+    def encode_uper(self, codec: UPEREncoder, check_constraints: bool = True) -> None:
+        assert codec.encode_constrained_whole_number(self.id, 0, 65535)
+        assert codec.append_bit(bool(self.ok))
+        self.mode.encode_uper(codec, check_constraints)
+        assert codec.encode_constrained_whole_number(len(self.values), 0, 50)
+        for v in self.values:
+            assert codec.encode_constrained_whole_number(v, 0, 255)
+
+    @classmethod
+    def decode_uper(cls, codec: UPERDecoder, check_constraints: bool = True) -> "Report":
+        report_id = codec.decode_constrained_whole_number(0, 65535).decoded_value
+        ok = Asn1Boolean(codec.read_bit().decoded_value)
+        mode = Mode.decode_uper(codec, check_constraints)
+        count = codec.decode_constrained_whole_number(0, 50).decoded_value
+        values = [codec.decode_constrained_whole_number(0, 255).decoded_value for _ in range(count)]
+        return cls(report_id, ok, mode, values)
+
+
+def _report() -> Report:
+    return Report(4242, Asn1Boolean(True), Mode(Mode_Enum.busy), list(range(40)))
+
+
+@pytest.fixture
+def uper_pickling():
+    set_uper_pickling(True)
+    yield
+    set_uper_pickling(False)
+
+
+def test_disabled_by_default() -> None:
+    report = _report()
+    data = pickle.dumps(report)
+    assert b"values" in data and pickle.loads(data) == report
+
+
+def test_uper_pickling(uper_pickling) -> None:
+    reports = [_report() for _ in range(100)]
+    data = pickle.dumps(reports, pickle.HIGHEST_PROTOCOL)
+    assert pickle.loads(data) == reports
+
+    set_uper_pickling(False)
+    assert len(data) < len(pickle.dumps(reports, pickle.HIGHEST_PROTOCOL)) / 2
+
+
+def test_copies(uper_pickling) -> None:
+    report = _report()
+    for clone in (copy.copy(report), copy.deepcopy(report)):
+        assert clone == report and clone is not report
+    clone = copy.deepcopy(report)
+    clone.values.append(1)
+    assert report.values == list(range(40))
+
+
+def test_runtime_wrappers_keep_their_pickling(uper_pickling) -> None:
+    # No uPER codec of their own: interned booleans and NULL still pickle as before
+    assert pickle.loads(pickle.dumps(Asn1Boolean(True))) is Asn1Boolean(True)
+    assert pickle.loads(pickle.dumps(NullType())) == NullType()
+
+
+def test_register_module() -> None:
+    registered = register_uper_pickling(sys.modules[__name__])
+    try:
+        assert set(registered) == {Mode, Report}
+        report = _report()
+        assert copyreg.dispatch_table[Report](report)[1] == (Report, bytes(report.encode(Encoding.uPER)))
+        data = pickle.dumps(report, pickle.HIGHEST_PROTOCOL)
+        assert pickle.loads(data) == report
+        assert b"values" not in data
+    finally:
+        for cls in registered:
+            del copyreg.dispatch_table[cls]
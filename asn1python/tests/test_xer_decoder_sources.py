@@ -0,0 +1,97 @@
+import mmap
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from asn1python.xer_decoder import XER_NEED_MORE_DATA, XERDecoder, XERPushDecoder
+
+XML = "<pdu><name>Zoë</name><count>3</count><items><v>1</v><v>2</v><v>3</v></items></pdu>".encode("utf-8")
+
+
+class Pdu:
+    """Mimics the decode_xer classmethod generated for the type of XML."""
+
+    @classmethod
+    def decode_xer(cls, codec: XERDecoder, check_constraints: bool = True, xmlTag=None) -> tuple:
+        return _read_pdu(codec)
+
+
+def _read_pdu(d: XERDecoder) -> tuple:
+    d.expect_start("pdu")
+    name = d.decode_string("name")
+    count = d.decode_integer("count")
+    d.complex_start("items")
+    values = [d.decode_integer("v") for _ in range(count)]
+    d.complex_end("items")
+    d.expect_end("pdu")
+    return name, values
+
+
+def test_from_file_path_and_object(tmp_path):
+    path = tmp_path / "pdu.xml"
+    path.write_bytes(XML)
+    assert _read_pdu(XERDecoder.from_file(path, chunk_size=7)) == ("Zoë", [1, 2, 3])
+    with open(path, "rb") as f:
+        assert _read_pdu(XERDecoder.from_file(f, chunk_size=5)) == ("Zoë", [1, 2, 3])
+
+
+def test_from_mmap(tmp_path):
+    path = tmp_path / "pdu.xml"
+    path.write_bytes(XML)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert _read_pdu(XERDecoder.from_mmap(mapped, chunk_size=16)) == ("Zoë", [1, 2, 3])
+
+
+def test_from_single_byte_chunks():
+    # Splits the two byte UTF-8 sequence of 'ë' across chunks
+    assert _read_pdu(XERDecoder.from_chunks(XML[i:i + 1] for i in range(len(XML)))) == ("Zoë", [1, 2, 3])
+
+
+def test_chunks_are_pulled_on_demand():
+    pulled = []
+
+    def chunks():
+        for i in range(0, len(XML), 8):
+            pulled.append(i)
+            yield XML[i:i + 8]
+
+    d = XERDecoder.from_chunks(chunks())
+    d.expect_start("pdu")
+    assert d.decode_string("name") == "Zoë"
+    assert len(pulled) < len(XML) // 8
+
+
+def test_truncated_document_raises():
+    d = XERDecoder.from_chunks([XML[:30]])
+    d.expect_start("pdu")
+    d.decode_string("name")
+    with pytest.raises(ET.ParseError):
+        d.decode_integer("count")
+
+
+def test_push_one_byte_at_a_time():
+    d = XERPushDecoder(Pdu)
+    results = [d.feed(XML[i:i + 1]) for i in range(len(XML))]
+    assert all(r is XER_NEED_MORE_DATA for r in results[:-1])
+    assert results[-1] == [("Zoë", [1, 2, 3])]
+    assert d.complete and d.close() is XER_NEED_MORE_DATA
+
+
+def test_push_pdu_stream():
+    data = b"<Stream>" + XML * 3 + b"</Stream>"
+    d = XERPushDecoder(Pdu, "Stream")
+    pdus = []
+    for i in range(len(data)):
+        pdus.extend(d.feed(data[i:i + 1]))
+        assert len(pdus) == data[:i + 1].count(b"</pdu>")
+    assert d.complete and pdus == [("Zoë", [1, 2, 3])] * 3
+    assert d.close() is XER_NEED_MORE_DATA
+    with pytest.raises(ValueError):
+        d.feed(b"")
+
+
+def test_push_truncated_document_raises():
+    d = XERPushDecoder(Pdu)
+    assert d.feed(XML[:30]) is XER_NEED_MORE_DATA
+    with pytest.raises(ET.ParseError):
+        d.close()
@@ -0,0 +1,59 @@
+import io
+
+from asn1python.xer_decoder import XERDecoder
+from asn1python.xer_encoder import CompactXEREncoder, XEREncoder
+
+
+def _encode_sample(enc: XEREncoder) -> None:
+    enc.complex_start("Packet", 0)
+    enc.encode_integer("id", 7, 1)
+    enc.encode_real("gain", 0.5, 1)
+    enc.encode_string("label", "a<b & c>é", 1)
+    enc.encode_boolean("valid", True, 1)
+    enc.encode_null("spare", 1)
+    enc.encode_enumerated("mode", "safe", 1)
+    enc.encode_octet_string("raw", b"\x0a\x1b", 2, 1)
+    enc.encode_bit_string("flags", "1011", 4, 1)
+    enc.complex_end("Packet", 0)
+
+
+def test_compact_layout():
+    enc = CompactXEREncoder.of_size()
+    _encode_sample(enc)
+    assert enc.get_xml() == (
+        "<Packet><id>7</id><gain>0.5</gain><label>a&lt;b &amp; c&gt;é</label>"
+        "<valid><true/></valid><spare/><mode><safe/></mode><raw>0A1B</raw>"
+        "<flags>1011</flags></Packet>"
+    )
+    assert enc.get_bitstream_buffer() == bytearray(enc.get_xml().encode("utf-8"))
+
+    pretty = XEREncoder.of_size()
+    _encode_sample(pretty)
+    assert len(enc.get_bitstream_buffer()) < len(pretty.get_bitstream_buffer())
+
+
+def test_compact_round_trip():
+    enc = CompactXEREncoder.of_size()
+    _encode_sample(enc)
+    dec = XERDecoder.from_codec(enc)
+    dec.complex_start("Packet")
+    assert dec.decode_integer("id") == 7
+    assert dec.decode_real("gain") == 0.5
+    assert dec.decode_string("label") == "a<b & c>é"
+    assert dec.decode_boolean("valid") is True
+    assert dec.decode_null("spare") is None
+    assert dec.decode_enumerated("mode") == "safe"
+    assert dec.decode_octet_string("raw") == b"\x0a\x1b"
+    assert dec.decode_bit_string("flags") == "1011"
+    dec.complex_end("Packet")
+
+
+def test_compact_stream():
+    in_memory = CompactXEREncoder.of_size()
+    writer = io.BytesIO()
+    streaming = CompactXEREncoder.to_stream(writer, buffer_size=16)
+    for enc in (in_memory, streaming):
+        for _ in range(20):
+            _encode_sample(enc)
+    streaming.flush()
+    assert writer.getvalue() == bytes(in_memory.get_bitstream_buffer())
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+
+from asn1python.xer_encoder import XEREncoder
+
+
+class _RecordingWriter(io.BytesIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.chunks = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(len(data))
+        return super().write(data)
+
+
+def _encode_sample(enc: XEREncoder) -> None:
+    enc.complex_start("Archive", 0)
+    for i in range(200):
+        enc.complex_start("Sample", 1)
+        enc.encode_integer("id", i, 2)
+        enc.encode_real("value", i / 3, 2)
+        enc.encode_string("label", "a<b & é", 2)
+        enc.encode_boolean("valid", i % 2 == 0, 2)
+        enc.complex_end("Sample", 1)
+    enc.complex_end("Archive", 0)
+
+
+def test_stream_output_matches_in_memory_output():
+    in_memory = XEREncoder.of_size()
+    _encode_sample(in_memory)
+
+    writer = _RecordingWriter()
+    streaming = XEREncoder.to_stream(writer, buffer_size=256)
+    _encode_sample(streaming)
+    streaming.flush()
+
+    expected = in_memory.get_bitstream_buffer()
+    assert writer.getvalue() == bytes(expected)
+    assert streaming.bytes_written == len(expected)
+    assert streaming.is_streaming and not in_memory.is_streaming
+
+
+def test_stream_buffers_a_bounded_amount():
+    writer = _RecordingWriter()
+    enc = XEREncoder.to_stream(writer, buffer_size=128)
+    _encode_sample(enc)
+    assert len(writer.chunks) > 10
+    # A flush happens as soon as the limit is reached, so a chunk exceeds it by at most one fragment
+    assert max(writer.chunks) < 128 + 64
+    enc.flush()
+    enc.flush()
+    assert writer.getvalue().endswith(b"</Archive>\n")
+
+
+def test_get_xml_of_streaming_encoder_raises():
+    enc = XEREncoder.to_stream(io.BytesIO())
+    enc.write_raw("<a/>")
+    with pytest.raises(ValueError):
+        enc.get_xml()
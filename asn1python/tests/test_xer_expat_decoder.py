@@ -0,0 +1,117 @@
+import mmap
+
+import pytest
+from xml.parsers.expat import ExpatError
+
+from asn1python.asn1_exceptions import Asn1InvalidValueException
+from asn1python.xer_decoder import ExpatXERDecoder, XERDecoder
+from asn1python.xer_encoder import CompactXEREncoder, XEREncoder
+
+DECODERS = [XERDecoder, ExpatXERDecoder]
+
+
+def _encode_sample(enc: XEREncoder) -> None:
+    enc.complex_start("Packet", 0)
+    enc.encode_integer("id", 7, 1)
+    enc.encode_real("gain", 0.5, 1)
+    enc.encode_string("label", "a<b & c>é", 1)
+    enc.encode_boolean("valid", True, 1)
+    enc.encode_null("spare", 1)
+    enc.encode_enumerated("mode", "safe", 1)
+    enc.encode_octet_string("raw", b"\x0a\x1b", 2, 1)
+    enc.encode_bit_string("flags", "1011", 4, 1)
+    enc.complex_end("Packet", 0)
+
+
+@pytest.mark.parametrize("decoder_cls", DECODERS)
+@pytest.mark.parametrize("encoder_cls", [XEREncoder, CompactXEREncoder])
+def test_round_trip(decoder_cls, encoder_cls):
+    enc = encoder_cls.of_size()
+    _encode_sample(enc)
+    dec = decoder_cls.from_codec(enc)
+    dec.complex_start("Packet")
+    assert dec.decode_integer("id") == 7
+    assert dec.decode_real("gain") == 0.5
+    assert dec.decode_string("label") == "a<b & c>é"
+    assert dec.decode_boolean("valid") is True
+    assert dec.decode_null("spare") is None
+    assert dec.decode_enumerated("mode") == "safe"
+    assert dec.decode_octet_string("raw") == b"\x0a\x1b"
+    assert dec.decode_bit_string("flags") == "1011"
+    dec.complex_end("Packet")
+    assert dec.peek_start_tag() is None
+
+
+@pytest.mark.parametrize("decoder_cls", DECODERS)
+def test_namespaced_tags_use_local_names(decoder_cls):
+    d = decoder_cls.from_buffer(b'<p:seq xmlns:p="urn:x"><p:v>1</p:v><v>2</v></p:seq>')
+    assert d.peek_start_tag() == "seq"
+    d.expect_start("seq")
+    assert d.decode_integer("v") == 1
+    assert d.decode_integer("v") == 2
+    assert d.at_end_element("seq")
+    d.expect_end("seq")
+
+
+@pytest.mark.parametrize("decoder_cls", DECODERS)
+def test_same_named_nesting(decoder_cls):
+    d = decoder_cls.from_buffer(b"<outer><value><value>1</value></value><x>t<y/>u</x></outer>")
+    d.expect_start("outer")
+    d.expect_start("value")
+    assert d.read_text_element("value") == "1"
+    d.expect_end("value")
+    # Like Element.text, only the text before the first child is returned
+    assert d.read_text_element("x") == "t"
+    d.expect_end("outer")
+
+
+def test_tokens_and_interned_names():
+    xml = b"<seq>" + b"<item>1</item>" * 3 + b"</seq>"
+    d = ExpatXERDecoder.from_chunks(xml[i:i + 3] for i in range(0, len(xml), 3))
+    assert d.expect_start("seq") == "seq"
+    names = set()
+    for _ in range(3):
+        assert d.peek_start_tag() == "item"
+        names.add(id(d.peek_start_tag()))
+        assert d.read_text_element("item") == "1"
+    assert len(names) == 1
+    d.expect_end("seq")
+
+
+def test_wrong_tag_and_truncation():
+    d = ExpatXERDecoder.from_buffer(b"<a><b>1</b></a>")
+    with pytest.raises(Asn1InvalidValueException, match="expected <b>"):
+        d.expect_start("b")
+    d = ExpatXERDecoder.from_chunks([b"<a><b>1</b>"])
+    d.expect_start("a")
+    with pytest.raises(ExpatError):
+        d.read_text_element("b")
+        d.expect_end("a")
+
+
+@pytest.mark.parametrize("decoder_cls", DECODERS)
+def test_mmap_can_be_closed_while_decoder_is_alive(decoder_cls, tmp_path):
+    path = tmp_path / "doc.xml"
+    path.write_bytes(b"<a><b>1</b><b>2</b></a>")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        d = decoder_cls.from_mmap(mapped, chunk_size=4)
+        d.expect_start("a")
+        assert d.decode_integer("b") == 1
+        mapped.close()  # mid-document: no slice of the map is held between chunks
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        d = decoder_cls.from_mmap(mapped)
+        d.expect_start("a")
+        d.expect_end("a")
+        assert d.peek_start_tag() is None and d._parser is None
+
+
+@pytest.mark.parametrize("decoder_cls", DECODERS)
+def test_parse_error_releases_input(decoder_cls, tmp_path):
+    path = tmp_path / "bad.xml"
+    path.write_bytes(b"<a><b>1</c></a>")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        d = decoder_cls.from_mmap(mapped)
+        with pytest.raises(SyntaxError if decoder_cls is XERDecoder else ExpatError):
+            d.expect_start("a")
+            d.decode_integer("b")
+        assert d._parser is None
@@ -0,0 +1,100 @@
+import io
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from asn1python.xer_decoder import ExpatXERDecoder, XERDecoder
+from asn1python.xer_encoder import CompactXEREncoder, XEREncoder, XERPduStreamWriter
+
+
+@dataclass
+class Record:
+    """Mimics the encode_xer/decode_xer pair generated for a SEQUENCE."""
+    id: int
+    name: str
+
+    def encode_xer(self, codec: XEREncoder, check_constraints: bool = True, xmlTag: Optional[str] = None) -> None:
+        xmlTag = xmlTag if xmlTag is not None else "Record"
+        codec.complex_start(xmlTag, 0)
+        codec.encode_integer("id", self.id, 1)
+        codec.encode_string("name", self.name, 1)
+        codec.complex_end(xmlTag, 0)
+
+    @classmethod
+    def decode_xer(cls, codec: XERDecoder, check_constraints: bool = True, xmlTag: Optional[str] = None) -> "Record":
+        xmlTag = xmlTag if xmlTag is not None else "Record"
+        codec.complex_start(xmlTag)
+        record = cls(codec.decode_integer("id"), codec.decode_string("name"))
+        codec.complex_end(xmlTag)
+        return record
+
+
+RECORDS = [Record(i, f"r<{i}>") for i in range(200)]
+
+
+@pytest.mark.parametrize("decoder_cls", [XERDecoder, ExpatXERDecoder])
+@pytest.mark.parametrize("encoder_cls", [XEREncoder, CompactXEREncoder])
+def test_round_trip(decoder_cls, encoder_cls):
+    out = io.BytesIO()
+    with XERPduStreamWriter(out, encoder_cls=encoder_cls, buffer_size=64) as writer:
+        for record in RECORDS:
+            writer.write(record)
+    assert writer.count == len(RECORDS)
+    assert writer.bytes_written == len(out.getvalue())
+
+    data = out.getvalue()
+    decoder = decoder_cls.from_chunks(data[i:i + 10] for i in range(0, len(data), 10))
+    assert list(decoder.iter_pdus(Record)) == RECORDS
+
+
+def test_custom_tags_and_empty_stream():
+    out = io.BytesIO()
+    with XERPduStreamWriter(out, "Log", CompactXEREncoder) as writer:
+        writer.write(Record(1, "a"), xml_tag="Entry")
+    assert out.getvalue() == b"<Log><Entry><id>1</id><name>a</name></Entry></Log>"
+    assert list(XERDecoder.from_buffer(out.getvalue()).iter_pdus(Record, "Log", xml_tag="Entry")) == [Record(1, "a")]
+
+    out = io.BytesIO()
+    XERPduStreamWriter(out).close()
+    assert list(XERDecoder.from_buffer(out.getvalue()).iter_pdus(Record)) == []
+
+
+def test_pdu_yielded_before_next_chunk_arrives():
+    pdus = [b"<Record><id>%d</id><name>x</name></Record>" % i for i in range(3)]
+    pulled = []
+
+    def chunks():
+        yield b"<PDUs>"
+        for i, pdu in enumerate(pdus):
+            pulled.append(i)
+            yield pdu
+        yield b"</PDUs>"
+
+    decoder = XERDecoder.from_chunks(chunks())
+    for i, record in enumerate(decoder.iter_pdus(Record)):
+        assert record.id == i
+        assert pulled[-1] == i
+
+
+def test_consumed_elements_are_released():
+    class WrapperTrackingDecoder(XERDecoder):
+        def _release_children(self, element):
+            super()._release_children(element)
+            self.wrapper = element
+
+    out = io.BytesIO()
+    with XERPduStreamWriter(out) as writer:
+        for record in RECORDS:
+            writer.write(record)
+    decoder = WrapperTrackingDecoder.from_buffer(out.getvalue())
+    for _ in decoder.iter_pdus(Record):
+        assert decoder.wrapper.tag == "PDUs" and len(decoder.wrapper) == 0
+
+
+def test_write_after_close_raises():
+    writer = XERPduStreamWriter(io.BytesIO())
+    writer.close()
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.write(Record(1, "a"))
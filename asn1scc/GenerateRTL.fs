@@ -172,8 +172,12 @@ let exportRTL (di:DirInfo) (l:ProgrammingLanguage) (args:CommandLineSettings) (l
         writeResource di "codec_uper.py" None
         writeResource di "decoder.py" None
         writeResource di "encoder.py" None
+        writeResource di "char_index_codec.py" None
+        writeResource di "int_array_codec.py" None
         writeResource di "acn_decoder.py" None
         writeResource di "acn_encoder.py" None
+        writeResource di "acn_post_encoding.py" None
+        writeResource di "codec_registry.py" None
 
         if hasXer then
             writeResource di "xer_codec.py" None